@@ -0,0 +1,132 @@
+"""Cost of selecting the tests of a test run (mode 1) from a synthetic pytest collection.
+
+Items are grouped into functions with several parametrized variants; a part of the functions set
+their external id with a parameter template. "previous" is the selection as it was before it was
+made linear (items.index per item, list lookups); it is quadratic, so it runs on fewer items.
+
+Usage:
+    python benchmarks/bench_collection_filter.py [--items 100000] [--variants 10] [--selected 0.1]
+                                                 [--previous-items 10000]
+"""
+import argparse
+import random
+import time
+from unittest import mock
+
+import testit_adapter_pytest.utils as utils
+from testit_adapter_pytest.listener import TmsListener
+
+
+class _Function:
+    def __init__(self, name: str, external_id: str = None):
+        self.__name__ = name
+        if external_id is not None:
+            self.test_external_id = external_id
+
+
+class _Mark:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _CallSpec:
+    def __init__(self, params: dict):
+        self.params = params
+
+
+class _Parent:
+    def __init__(self, nodeid: str):
+        self.nodeid = nodeid
+
+
+class _Item:
+    def __init__(self, function: _Function, parent: _Parent, variant: int):
+        self.function = function
+        self.parent = parent
+        self.originalname = function.__name__
+        self.own_markers = [_Mark('parametrize')]
+        self.callspec = _CallSpec({'variant': variant})
+
+
+def _make_items(count: int, variants: int) -> list:
+    items = []
+    for function_id in range(0, count, variants):
+        parent = _Parent(f'tests/package_{function_id % 97}/test_module_{function_id % 1009}.py::TestCase')
+        external_id = f'test_{function_id}_{{variant}}' if function_id % 3 == 0 else None
+        function = _Function(f'test_{function_id}', external_id)
+        items.extend(_Item(function, parent, variant) for variant in range(min(variants, count - function_id)))
+
+    return items
+
+
+def _previous_separation(items: list, resolved_autotests: list) -> tuple:
+    selected, deselected = [], []
+    index = 0
+
+    for item in items:
+        if hasattr(item.function, 'test_external_id'):
+            item.test_external_id = item.function.test_external_id
+        else:
+            item.test_external_id = utils.get_hash(item.parent.nodeid + item.function.__name__)
+
+        for mark in item.own_markers:
+            if mark.name == 'parametrize':
+                item.own_markers.index(mark)
+
+        params = utils.get_all_parameters(item)
+        item.test_external_id = utils.collect_parameters_in_string_attribute(item.test_external_id, params)
+
+        item.index = index
+        item_id = items.index(item)
+        index = index + 1 if len(items) > item_id + 1 and items[item_id + 1].originalname == item.originalname \
+            else 0
+
+        (selected if item.test_external_id in resolved_autotests else deselected).append(item)
+
+    return selected, deselected
+
+
+def _resolved_autotests(items: list, selected: float) -> list:
+    rnd = random.Random(1)
+    annotated_items = TmsListener._TmsListener__get_separation_of_tests(items, []).get_deselected_items()
+
+    return [item.test_external_id for item in annotated_items if rnd.random() < selected]
+
+
+def _select(items: list, resolved_autotests: list) -> float:
+    listener = TmsListener(mock.Mock(), mock.Mock(), mock.Mock())
+    listener._TmsListener__adapter_manager.get_autotests_for_launch.return_value = resolved_autotests
+    config = mock.Mock()
+    config.pluginmanager.list_plugin_distinfo.return_value = []
+
+    started = time.perf_counter()
+    listener.pytest_collection_modifyitems(config, list(items))
+
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--variants', type=int, default=10, help='Parametrized variants per function')
+    parser.add_argument('--selected', type=float, default=0.1, help='Share of items in the test run')
+    parser.add_argument('--previous-items', type=int, default=10000, help='Items for the previous selection, 0 to skip')
+    args = parser.parse_args()
+
+    items = _make_items(args.items, args.variants)
+    resolved_autotests = _resolved_autotests(items, args.selected)
+    seconds = _select(items, resolved_autotests)
+    print(f'{len(items):,} items, {len(resolved_autotests):,} external ids in the test run')
+    print(f'{"selection":<10}{"items":>10}{"time, s":>12}{"per item, us":>16}')
+    print(f'{"current":<10}{len(items):>10,}{seconds:>12.3f}{seconds / len(items) * 1e6:>16.2f}')
+
+    if args.previous_items:
+        items = items[:args.previous_items]
+        started = time.perf_counter()
+        _previous_separation(items, resolved_autotests)
+        seconds = time.perf_counter() - started
+        print(f'{"previous":<10}{len(items):>10,}{seconds:>12.3f}{seconds / len(items) * 1e6:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 import pickle
+from contextvars import ContextVar
 from importlib.metadata import metadata
 from uuid import uuid4
 
@@ -67,7 +68,6 @@ class SeparationOfTests:
 
 
 class TmsListener(object):
-    __executable_test = None
     __pytest_info = None
     __pytest_check_info = None
     __failures = None
@@ -77,6 +77,16 @@ class TmsListener(object):
         self.__step_manager = step_manager
         self.__fixture_manager = fixture_manager
         self._cache = ItemCache()
+        # The test running in the current thread or task
+        self.__executable_test_context = ContextVar(f'testit_executable_test_{id(self)}', default=None)
+
+    @property
+    def __executable_test(self):
+        return self.__executable_test_context.get()
+
+    @__executable_test.setter
+    def __executable_test(self, executable_test):
+        self.__executable_test_context.set(executable_test)
 
     @pytest.hookimpl
     def pytest_configure(self, config):
@@ -133,33 +143,27 @@ class TmsListener(object):
     @adapter_logger
     def __get_separation_of_tests(cls, items, resolved_autotests) -> SeparationOfTests:
         separation_of_tests = SeparationOfTests()
+        resolved_external_ids = set(resolved_autotests) if resolved_autotests is not None else None
+        # Parametrized items of one function share the hash of their node
+        hashed_external_ids = {}
+        last_item_id = len(items) - 1
         index = 0
 
-        for item in items:
-            if hasattr(item.function, 'test_external_id'):
-                item.test_external_id = item.function.test_external_id
-            else:
-                item.test_external_id = utils.get_hash(item.parent.nodeid + item.function.__name__)
+        for item_id, item in enumerate(items):
+            item.test_external_id = cls.__get_test_external_id(item, hashed_external_ids)
 
-            if item.own_markers:
-                for mark in item.own_markers:
-                    if mark.name == 'parametrize':
-                        if not hasattr(item, 'array_parametrize_mark_id'):
-                            item.array_parametrize_mark_id = []
-                        item.array_parametrize_mark_id.append(
-                            item.own_markers.index(mark))
-
-            params = utils.get_all_parameters(item)
-            item.test_external_id = utils.collect_parameters_in_string_attribute(
-                item.test_external_id,
-                params)
+            for mark_id, mark in enumerate(item.own_markers):
+                if mark.name == 'parametrize':
+                    if not hasattr(item, 'array_parametrize_mark_id'):
+                        item.array_parametrize_mark_id = []
+                    item.array_parametrize_mark_id.append(mark_id)
 
+            # Position of the item among consecutive items of the same function
             item.index = index
-            item_id = items.index(item)
-            index = index + 1 if len(items) > item_id + 1 and items[item_id + 1].originalname == item.originalname \
+            index = index + 1 if item_id < last_item_id and items[item_id + 1].originalname == item.originalname \
                 else 0
 
-            if cls.__check_external_id_in_resolved_autotests(item.test_external_id, resolved_autotests):
+            if resolved_external_ids is not None and item.test_external_id in resolved_external_ids:
                 separation_of_tests.add_item_to_selected_items(item)
             else:
                 separation_of_tests.add_item_to_deselected_items(item)
@@ -167,15 +171,35 @@ class TmsListener(object):
         return separation_of_tests
 
     @staticmethod
-    @adapter_logger
-    def __check_external_id_in_resolved_autotests(external_id: str, resolved_autotests: dict) -> bool:
-        return resolved_autotests is not None and external_id in resolved_autotests
+    def __get_test_external_id(item, hashed_external_ids: dict) -> str:
+        if hasattr(item.function, 'test_external_id'):
+            external_id = item.function.test_external_id
+        else:
+            node_name = item.parent.nodeid + item.function.__name__
+            external_id = hashed_external_ids.get(node_name)
 
-    @pytest.hookimpl(tryfirst=True)
+            if external_id is None:
+                external_id = hashed_external_ids[node_name] = utils.get_hash(node_name)
+
+        if '{' not in external_id:
+            return external_id
+
+        return utils.collect_parameters_in_string_attribute(external_id, utils.get_all_parameters(item))
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
     def pytest_runtest_protocol(self, item):
-        self.__executable_test = utils.form_test(item)
+        executable_test_token = self.__executable_test_context.set(utils.form_test(item))
+        step_context_token = self.__step_manager.start_context()
+        fixture_context_token = self.__fixture_manager.start_context()
         self.__adapter_manager.on_running_started()
 
+        try:
+            yield
+        finally:
+            self.__fixture_manager.end_context(fixture_context_token)
+            self.__step_manager.end_context(step_context_token)
+            self.__executable_test_context.reset(executable_test_token)
+
     @pytest.hookimpl(hookwrapper=True)
     def pytest_runtest_setup(self, item):
         if not self.__executable_test:
@@ -365,7 +389,7 @@ class TmsListener(object):
                 group_uuid = self._cache.push(fixturedef)
                 group = FixturesContainer(uuid=group_uuid)
                 self.__fixture_manager.start_group(group_uuid, group)
-            if self.__executable_test.external_id not in group.external_ids:
+            if not self.__fixture_manager.has_external_id(group_uuid, self.__executable_test.external_id):
                 self.__fixture_manager.update_group(group_uuid, external_ids=self.__executable_test.external_id)
 
     def _test_fixtures(self, item):
@@ -2,6 +2,7 @@ import hashlib
 import logging
 import re
 import traceback
+from functools import lru_cache
 from typing import List
 
 import pytest
@@ -19,6 +20,8 @@ from testit_adapter_pytest.models.executable_test import ExecutableTest
 
 
 __ARRAY_TYPES = (frozenset, list, set, tuple,)
+__PARAMETER_KEY_PATTERN = re.compile(r"\{(.*?)\}")
+__ID_KEY_PATTERN = re.compile(r'\[(.*?)\]')
 
 
 def form_test(item) -> ExecutableTest:
@@ -247,8 +250,19 @@ def __get_work_item_ids_from(item):
     return workitem_ids
 
 
+# Templates come from test decorators, so each one is parsed once for all tests and parameter sets
+@lru_cache(maxsize=4096)
+def __get_parameter_keys(attribute: str) -> tuple:
+    return tuple(__PARAMETER_KEY_PATTERN.findall(attribute))
+
+
+@lru_cache(maxsize=4096)
+def __get_id_keys(key_for_parameter: str) -> tuple:
+    return tuple(__ID_KEY_PATTERN.findall(key_for_parameter))
+
+
 def collect_parameters_in_string_attribute(attribute, all_parameters):
-    param_keys = re.findall(r"\{(.*?)\}", attribute)
+    param_keys = __get_parameter_keys(attribute)
 
     if len(param_keys) > 0:
         for param_key in param_keys:
@@ -261,7 +275,7 @@ def collect_parameters_in_string_attribute(attribute, all_parameters):
 
 
 def collect_parameters_in_mass_attribute(attribute, all_parameters):
-    param_keys = re.findall(r"\{(.*?)\}", attribute)
+    param_keys = __get_parameter_keys(attribute)
 
     if len(param_keys) == 1:
         parameter = get_parameter(param_keys[0], all_parameters)
@@ -276,7 +290,7 @@ def collect_parameters_in_mass_attribute(attribute, all_parameters):
 
 
 def get_parameter(key_for_parameter, all_parameters):
-    id_keys_in_parameter = re.findall(r'\[(.*?)\]', key_for_parameter)
+    id_keys_in_parameter = __get_id_keys(key_for_parameter)
 
     if len(id_keys_in_parameter) > 1:
         logging.error("(For type tuple, list, set, dict) support only one level!")
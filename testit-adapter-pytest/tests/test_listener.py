@@ -53,4 +53,53 @@ class TestTmsListener:
         # No direct assertion on links, but we ensure no error and __executable_test remains None
         # If __executable_test had a result_links attribute, we would check it's still empty.
         # For this case, the main check is that no AttributeError occurs.
-        assert listener._TmsListener__executable_test is None 
\ No newline at end of file
+        assert listener._TmsListener__executable_test is None 
+
+def _item(function, nodeid="tests/test_module.py", params=None, markers=()):
+    item = MagicMock(spec=["function", "parent", "own_markers", "originalname", "callspec"])
+    item.function = function
+    item.parent.nodeid = nodeid
+    item.own_markers = list(markers)
+    item.originalname = function.__name__
+    if params is None:
+        del item.callspec
+    else:
+        item.callspec.params = params
+    return item
+
+
+def _plain_function():
+    pass
+
+
+def _parametrized_function():
+    pass
+
+
+_parametrized_function.test_external_id = "parametrized_{value}"
+
+
+class TestCollectionFiltering:
+    def test_resolved_tests_are_selected_and_siblings_indexed(self, mocker):
+        parametrize = MagicMock()
+        parametrize.name = "parametrize"
+        items = [
+            _item(_plain_function),
+            _item(_parametrized_function, params={"value": 1}, markers=[MagicMock(), parametrize]),
+            _item(_parametrized_function, params={"value": 2}, markers=[MagicMock(), parametrize]),
+        ]
+        adapter_manager = mocker.MagicMock()
+        adapter_manager.get_autotests_for_launch.return_value = ["parametrized_2", "missing"]
+        config = mocker.MagicMock()
+        config.pluginmanager.list_plugin_distinfo.return_value = []
+        listener = TmsListener(adapter_manager, mocker.MagicMock(), mocker.MagicMock())
+        collected = list(items)
+
+        listener.pytest_collection_modifyitems(config, collected)
+
+        assert collected == [items[2]]
+        config.hook.pytest_deselected.assert_called_once_with(items=items[:2])
+        assert [item.test_external_id for item in items[1:]] == ["parametrized_1", "parametrized_2"]
+        assert len(items[0].test_external_id) == 64
+        assert [item.index for item in items] == [0, 0, 1]
+        assert items[1].array_parametrize_mark_id == [1]
@@ -53,3 +53,21 @@ def test_top_level_param_not_overwritten_by_dict_expand():
     params = get_all_parameters(item)
 
     assert params['user_type'] == 'from_parametrize'
+
+
+def test_same_template_is_resolved_for_each_parameter_set():
+    template = 'test_{number}_{user[name]}'
+
+    results = [
+        collect_parameters_in_string_attribute(template, {'number': number, 'user': {'name': f'user{number}'}})
+        for number in range(3)
+    ]
+
+    assert results == ['test_0_user0', 'test_1_user1', 'test_2_user2']
+
+
+def test_too_deep_parameter_key_is_reported_on_every_call(caplog):
+    for _ in range(2):
+        assert get_parameter('param[a][b]', {'param': {'a': {'b': 1}}}) is None
+
+    assert caplog.text.count('support only one level') == 2
@@ -0,0 +1,56 @@
+"""Serialization cost of bulk result chunks: generated client path versus JsonSerializer.
+
+Usage:
+    python benchmarks/bench_json_serializer.py [--chunk-size 100] [--repeat 20]
+"""
+import argparse
+import json
+import timeit
+
+from adapters_api import ApiClient
+from adapters_api.serializer import JsonSerializer, orjson
+
+from sample_results import make_test_results
+from testit_python_commons.client.converter import Converter
+
+_CONFIGURATION_ID = '0b6a0e0e-7a4e-4f16-9d31-5b7c4f1e2a90'
+
+
+def _generated(chunk):
+    return json.dumps(ApiClient.sanitize_for_serialization(chunk))
+
+
+def _serializer(serializer: JsonSerializer):
+    return lambda chunk: serializer.dumps(serializer.sanitize(chunk))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--chunk-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    chunk = [
+        Converter.test_result_to_testrun_result_post_model(test_result, _CONFIGURATION_ID, ['PASSED', 'FAILED'])
+        for test_result in make_test_results(args.chunk_size)
+    ]
+
+    modes = [
+        ('sanitize_for_serialization + json', _generated),
+        ('JsonSerializer, json', _serializer(JsonSerializer(use_orjson=False))),
+    ]
+    if orjson is not None:
+        modes.append(('JsonSerializer, orjson', _serializer(JsonSerializer())))
+    else:
+        print('orjson is not installed, skipping it')
+
+    print(f'{args.chunk_size} results per chunk, best of {args.repeat}')
+    baseline = None
+    for name, dump in modes:
+        seconds = min(timeit.repeat(lambda: dump(chunk), number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(f'{name:<36}{seconds * 1000:>10.2f} ms/chunk{baseline / seconds:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Bytes on the wire of bulk result uploads with and without gzip-compressed request bodies.
+
+Results are posted through the generated client to a local HTTP server that counts the received bytes.
+
+Usage:
+    python benchmarks/bench_request_compression.py [--chunks 5] [--chunk-size 100] [--threshold 1024] [--link-mbit 10]
+"""
+import argparse
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from adapters_api import ApiClient, Configuration
+from adapters_api.apis import TestRunsApi
+
+from sample_results import make_test_results
+from testit_python_commons.client.converter import Converter
+
+_TEST_RUN_ID = '6fa4f1de-8f8c-4d7e-9c1a-3c6b1c8c1d2e'
+_CONFIGURATION_ID = '0b6a0e0e-7a4e-4f16-9d31-5b7c4f1e2a90'
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    received = 0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        with self.server.lock:
+            _CountingHandler.received += len(self.requestline) + 2 + len(self.headers.as_bytes()) + len(body)
+
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        json.loads(body)
+
+        response = b'[]'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+def _upload(url: str, chunks: list, threshold: int or None) -> tuple:
+    configuration = Configuration(host=url)
+    configuration.gzip_request_threshold = threshold
+    test_runs_api = TestRunsApi(api_client=ApiClient(configuration))
+
+    _CountingHandler.received = 0
+    started = time.perf_counter()
+    for chunk in chunks:
+        test_runs_api.adapters_test_runs_id_test_results_post(
+            id=_TEST_RUN_ID,
+            auto_test_results_for_test_run_model=chunk)
+
+    return _CountingHandler.received, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--chunks', type=int, default=5)
+    parser.add_argument('--chunk-size', type=int, default=100)
+    parser.add_argument('--threshold', type=int, default=1024)
+    parser.add_argument('--link-mbit', type=float, default=10.0, help='Link speed used to estimate upload time')
+    args = parser.parse_args()
+
+    test_results = make_test_results(args.chunks * args.chunk_size)
+    models = [
+        Converter.test_result_to_testrun_result_post_model(test_result, _CONFIGURATION_ID, ['PASSED', 'FAILED'])
+        for test_result in test_results
+    ]
+    chunks = [models[i:i + args.chunk_size] for i in range(0, len(models), args.chunk_size)]
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _CountingHandler)
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    try:
+        plain_bytes, plain_seconds = _upload(url, chunks, None)
+        gzip_bytes, gzip_seconds = _upload(url, chunks, args.threshold)
+    finally:
+        server.shutdown()
+
+    bytes_per_second = args.link_mbit * 1000 * 1000 / 8
+    print(f'{len(chunks)} chunks x {args.chunk_size} results')
+    print(f'{"mode":<8}{"bytes on wire":>16}{"local time, s":>16}{f"at {args.link_mbit:g} Mbit/s, s":>22}')
+    for mode, sent, seconds in (('plain', plain_bytes, plain_seconds), ('gzip', gzip_bytes, gzip_seconds)):
+        print(f'{mode:<8}{sent:>16,}{seconds:>16.3f}{seconds + sent / bytes_per_second:>22.2f}')
+    print(f'gzip sends {gzip_bytes / plain_bytes:.1%} of the plain bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Per-result cost of Converter.test_result_to_testrun_result_post_model.
+
+"constructors" builds the models through the generated constructors (full type checking), as the
+converter did before ModelBuilder; "ModelBuilder" is the current converter.
+
+Usage:
+    python benchmarks/bench_result_conversion.py [--results 200] [--repeat 5]
+"""
+import argparse
+import timeit
+from unittest import mock
+
+from adapters_api import ApiClient
+
+from sample_results import make_test_results
+from testit_python_commons.client.converter import Converter
+from testit_python_commons.client.helpers.model_builder import ModelBuilder
+
+_CONFIGURATION_ID = '0b6a0e0e-7a4e-4f16-9d31-5b7c4f1e2a90'
+_STATUS_CODES = ['PASSED', 'FAILED']
+
+
+def _convert(test_results):
+    return [
+        Converter.test_result_to_testrun_result_post_model(test_result, _CONFIGURATION_ID, _STATUS_CODES)
+        for test_result in test_results
+    ]
+
+
+def _with_constructors(func):
+    def wrapper(*args):
+        with mock.patch.object(ModelBuilder, 'build', lambda model_class, **fields: model_class(**fields)), \
+                mock.patch.object(ModelBuilder, 'simple', lambda model_class, value: model_class(value)):
+            return func(*args)
+
+    return wrapper
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--results', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    test_results = make_test_results(args.results)
+
+    assert ApiClient.sanitize_for_serialization(_with_constructors(_convert)(test_results)) == \
+        ApiClient.sanitize_for_serialization(_convert(test_results)), 'conversions differ'
+
+    print(f'{args.results} results, best of {args.repeat}')
+    baseline = None
+    for name, convert in (('constructors', _with_constructors(_convert)), ('ModelBuilder', _convert)):
+        seconds = min(timeit.repeat(lambda: convert(test_results), number=1, repeat=args.repeat))
+        baseline = baseline or seconds
+        print(f'{name:<16}{seconds / args.results * 1e6:>10.0f} us/result{baseline / seconds:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Deterministic test results shaped like a real suite, shared by the benchmarks."""
+import random
+from datetime import datetime, timedelta
+from typing import List
+
+from testit_python_commons.models.link import Link
+from testit_python_commons.models.link_type import LinkType
+from testit_python_commons.models.step_result import StepResult
+from testit_python_commons.models.test_result import TestResult
+
+_WORDS = (
+    'open', 'login', 'page', 'user', 'order', 'cart', 'check', 'submit', 'form', 'payment',
+    'search', 'result', 'filter', 'profile', 'settings', 'save', 'delete', 'confirm', 'dialog', 'api',
+)
+_STARTED_ON = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_test_results(count: int, steps: int = 5, depth: int = 3, seed: int = 1) -> List[TestResult]:
+    rnd = random.Random(seed)
+
+    return [_make_test_result(rnd, index, steps, depth) for index in range(count)]
+
+
+def _make_test_result(rnd: random.Random, index: int, steps: int, depth: int) -> TestResult:
+    failed = rnd.random() < 0.2
+    test_result = TestResult()
+    test_result.set_external_id(f'tests.test_module_{index % 17}.test_case_{index}')
+    test_result.set_autotest_name(_sentence(rnd, 4))
+    test_result.set_title(_sentence(rnd, 6))
+    test_result.set_description(_sentence(rnd, 20))
+    test_result.set_namespace(f'tests.test_module_{index % 17}')
+    test_result.set_classname(f'TestModule{index % 17}')
+    test_result.set_outcome('Failed' if failed else 'Passed')
+    test_result.set_status_type('Failed' if failed else 'Succeeded')
+    test_result.set_duration(rnd.randint(10, 5000))
+    test_result.set_started_on(_STARTED_ON)
+    test_result.set_completed_on(_STARTED_ON + timedelta(seconds=5))
+    test_result.set_message(_sentence(rnd, 12) if failed else None)
+    test_result.set_traces(_traceback(rnd) if failed else None)
+    test_result.set_parameters({f'param_{i}': _sentence(rnd, 2) for i in range(3)})
+    test_result.set_properties({})
+    test_result.set_links([Link().set_url(f'https://tracker.example/issue/{index}').set_link_type(LinkType.ISSUE)])
+    test_result.set_result_links([])
+    test_result.set_labels([])
+    test_result.set_tags([])
+    test_result.set_attachments([])
+    test_result.set_work_item_ids([])
+    test_result.set_step_results(_make_steps(rnd, steps, depth))
+    test_result.set_setup_results(_make_steps(rnd, 2, 1))
+    test_result.set_teardown_results(_make_steps(rnd, 1, 1))
+
+    return test_result
+
+
+def _make_steps(rnd: random.Random, count: int, depth: int) -> List[StepResult]:
+    if depth <= 0:
+        return []
+
+    step_results = []
+    for _ in range(count):
+        step_result = StepResult()
+        step_result.set_title(_sentence(rnd, 5))
+        step_result.set_description(_sentence(rnd, 10))
+        step_result.set_outcome('Passed')
+        step_result.set_duration(rnd.randint(1, 500))
+        step_result.set_started_on(_STARTED_ON)
+        step_result.set_completed_on(_STARTED_ON + timedelta(milliseconds=500))
+        step_result.set_parameters({'value': _sentence(rnd, 1)})
+        step_result.set_step_results(_make_steps(rnd, max(1, count // 2), depth - 1))
+        step_results.append(step_result)
+
+    return step_results
+
+
+def _sentence(rnd: random.Random, words: int) -> str:
+    return ' '.join(rnd.choice(_WORDS) for _ in range(words))
+
+
+def _traceback(rnd: random.Random) -> str:
+    frames = [
+        f'  File "/builds/project/tests/{rnd.choice(_WORDS)}/test_{rnd.choice(_WORDS)}.py", '
+        f'line {rnd.randint(1, 900)}, in {rnd.choice(_WORDS)}_{rnd.choice(_WORDS)}\n'
+        f'    {_sentence(rnd, 6)}\n'
+        for _ in range(25)
+    ]
+
+    return 'Traceback (most recent call last):\n' + ''.join(frames) + 'AssertionError: ' + _sentence(rnd, 8)
@@ -25,5 +25,6 @@ setup(
     py_modules=['testit', 'testit_python_commons'],
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
-    install_requires=['pluggy', 'tomli', 'urllib3', 'python-dateutil']
+    install_requires=['pluggy', 'tomli', 'urllib3', 'python-dateutil'],
+    extras_require={'orjson': ['orjson']}
 )
@@ -179,7 +179,7 @@ class ApiClient(object):
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            body = self.rest_client.serializer.sanitize(body)
 
         # auth setting
         self.update_params_for_auth(header_params, query_params,
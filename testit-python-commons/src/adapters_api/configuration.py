@@ -220,6 +220,14 @@ conf = adapters_api.Configuration(
 
         # Options to pass down to the underlying urllib3 socket
         self.socket_options = None
+        # Default urllib3 timeout of requests that do not set _request_timeout
+        self.timeout = None
+        # JSON request bodies of at least this many bytes are sent gzip-compressed;
+        # None disables compression
+        self.gzip_request_threshold = None
+        # Serializer of JSON request bodies, see adapters_api.serializer;
+        # None uses JsonSerializer
+        self.json_serializer = None
 
     def __deepcopy__(self, memo):
         cls = self.__class__
@@ -8,8 +8,8 @@
 """
 
 
+import gzip
 import io
-import json
 import logging
 import re
 import ssl
@@ -20,10 +20,13 @@ import urllib3
 import ipaddress
 
 from adapters_api.exceptions import ApiException, UnauthorizedException, ForbiddenException, NotFoundException, ServiceException, ApiValueError
+from adapters_api.serializer import JsonSerializer
 
 
 logger = logging.getLogger(__name__)
 
+GZIP_COMPRESS_LEVEL = 6
+
 
 class RESTResponse(io.IOBase):
 
@@ -71,6 +74,10 @@ class RESTClientObject(object):
         if configuration.socket_options is not None:
             addition_pool_args['socket_options'] = configuration.socket_options
 
+        self.timeout = configuration.timeout
+        self.gzip_request_threshold = configuration.gzip_request_threshold
+        self.serializer = configuration.json_serializer or JsonSerializer()
+
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
                 maxsize = configuration.connection_pool_maxsize
@@ -135,7 +142,7 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
-        timeout = None
+        timeout = self.timeout
         if _request_timeout:
             if isinstance(_request_timeout, (int, float)):  # noqa: E501,F821
                 timeout = urllib3.Timeout(total=_request_timeout)
@@ -156,8 +163,8 @@ class RESTClientObject(object):
                                                                  headers['Content-Type'], re.IGNORECASE)):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
-                    r = self.pool_manager.request(
+                        request_body = self.serializer.dumps(body)
+                    r = self.request_json(
                         method, url,
                         body=request_body,
                         preload_content=_preload_content,
@@ -183,6 +190,15 @@ class RESTClientObject(object):
                         preload_content=_preload_content,
                         timeout=timeout,
                         headers=headers)
+                # Stream file-like bodies (e.g. a pre-encoded multipart body)
+                # without loading them into memory
+                elif hasattr(body, 'read'):
+                    r = self.pool_manager.request(
+                        method, url,
+                        body=body,
+                        preload_content=_preload_content,
+                        timeout=timeout,
+                        headers=headers)
                 # Pass a `string` parameter directly in the body to support
                 # other content types than Json when `body` argument is
                 # provided in serialized form
@@ -234,6 +250,49 @@ class RESTClientObject(object):
 
         return r
 
+    def request_json(self, method, url, body, preload_content, timeout,
+                     headers):
+        """Sends a serialized JSON body, gzip-compressed when it reaches
+        gzip_request_threshold bytes.
+
+        A server that answers a compressed body with 415 Unsupported Media
+        Type gets the body again uncompressed, and compression is switched off
+        for this client.
+        """
+        threshold = self.gzip_request_threshold
+        if body is None or threshold is None or len(body) < threshold:
+            return self.pool_manager.request(
+                method, url,
+                body=body,
+                preload_content=preload_content,
+                timeout=timeout,
+                headers=headers)
+
+        compressed_headers = dict(headers, **{'Content-Encoding': 'gzip'})
+        r = self.pool_manager.request(
+            method, url,
+            body=gzip.compress(
+                body.encode('utf-8') if isinstance(body, str) else body,
+                compresslevel=GZIP_COMPRESS_LEVEL),
+            preload_content=preload_content,
+            timeout=timeout,
+            headers=compressed_headers)
+
+        if r.status != 415:
+            return r
+
+        logger.warning("Server does not accept gzip-compressed requests, "
+                       "sending them uncompressed")
+        self.gzip_request_threshold = None
+        r.drain_conn()
+
+        return self.pool_manager.request(
+            method, url,
+            body=body,
+            preload_content=preload_content,
+            timeout=timeout,
+            headers=headers)
+
     def GET(self, url, headers=None, query_params=None, _preload_content=True,
             _request_timeout=None):
         return self.request("GET", url,
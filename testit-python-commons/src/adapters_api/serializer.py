@@ -0,0 +1,104 @@
+"""
+    JSON serialization of request bodies.
+
+    JsonSerializer produces the same JSON documents as
+    ApiClient.sanitize_for_serialization followed by json.dumps, but walks
+    models by per-class field tables and uses orjson when it is installed.
+    Set Configuration.json_serializer to plug in another implementation.
+"""
+
+import json
+from datetime import date, datetime
+
+from adapters_api.exceptions import ApiValueError
+from adapters_api.model_utils import ModelNormal, ModelSimple, model_to_dict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+none_type = type(None)
+_PASS_THROUGH_TYPES = frozenset((str, int, float, bool, none_type))
+
+
+class JsonSerializer(object):
+    """Converts request bodies to JSON.
+
+    :param use_orjson: dump with orjson when it is installed. Otherwise the
+                       standard json module is used.
+    """
+
+    # Per-class {python attribute name: JSON key} tables of generated models
+    _field_tables = {}
+
+    def __init__(self, use_orjson=True):
+        self.use_orjson = bool(use_orjson and orjson is not None)
+
+    def sanitize(self, obj):
+        """Returns obj as JSON-compatible primitives.
+
+        Equivalent to ApiClient.sanitize_for_serialization for request bodies.
+        """
+        obj_type = type(obj)
+
+        if obj_type in _PASS_THROUGH_TYPES:
+            return obj
+        if obj_type is list:
+            return [self.sanitize(item) for item in obj]
+        if obj_type is dict:
+            return {key: self.sanitize(value) for key, value in obj.items()}
+
+        field_table = self._field_tables.get(obj_type)
+        if field_table is None and isinstance(obj, ModelNormal):
+            field_table = self._get_field_table(obj_type)
+        if field_table is not None:
+            return {
+                field_table.get(name, name): self.sanitize(value)
+                for name, value in obj._data_store.items()
+            }
+
+        if isinstance(obj, ModelSimple):
+            return self.sanitize(obj.value)
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if hasattr(obj, '_data_store'):
+            # Composed models merge the fields of their schemas
+            return {
+                key: self.sanitize(value)
+                for key, value in model_to_dict(obj, serialize=True).items()
+            }
+        if isinstance(obj, (str, int, float, bool)):
+            return obj
+        if isinstance(obj, (list, tuple)):
+            return obj_type(self.sanitize(item) for item in obj)
+        if isinstance(obj, dict):
+            return {key: self.sanitize(value) for key, value in obj.items()}
+        if hasattr(obj, 'read'):
+            # File-like bodies are streamed by RESTClientObject as they are
+            return obj
+
+        raise ApiValueError(
+            'Unable to prepare type {} for serialization'.format(
+                obj_type.__name__))
+
+    def dumps(self, obj):
+        """Dumps sanitized primitives to a JSON document.
+
+        :return: bytes with orjson, str with the json module.
+        """
+        if self.use_orjson:
+            try:
+                return orjson.dumps(obj)
+            except TypeError:
+                # e.g. integers beyond 64 bits
+                pass
+
+        return json.dumps(obj)
+
+    @classmethod
+    def _get_field_table(cls, model_class):
+        field_table = dict(model_class.attribute_map)
+        cls._field_tables[model_class] = field_table
+
+        return field_table
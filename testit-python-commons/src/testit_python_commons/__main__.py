@@ -0,0 +1,75 @@
+"""Command line tools of testit-python-commons.
+
+Usage:
+    python -m testit_python_commons upload <results-dir> [--config-file PATH] [--test-run-id ID]
+"""
+import argparse
+import logging
+import sys
+
+from testit_python_commons.app_properties import AppProperties
+from testit_python_commons.client.api_client import ApiClientWorker
+from testit_python_commons.client.client_configuration import ClientConfiguration
+from testit_python_commons.services.adapter_manager_configuration import AdapterManagerConfiguration
+from testit_python_commons.services.offline_results import OfflineResultsUploader
+from testit_python_commons.services.request_metrics import RequestMetrics, get_request_metrics, set_request_metrics
+from testit_python_commons.services.retry import RetryPolicy, set_retry_policy
+
+
+def parse_args(args=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m testit_python_commons')
+    commands = parser.add_subparsers(dest='command')
+
+    upload = commands.add_parser('upload', help='Upload results exported with offlineExportDir to Test IT')
+    upload.add_argument('results_dir', help='Directory with the exported results')
+    upload.add_argument(
+        '--config-file', dest='set_config_file', metavar='PATH', help='Path to the configuration file')
+    upload.add_argument('--test-run-id', dest='set_test_run_id', metavar='ID', help='Test run to upload results to')
+
+    return parser.parse_args(args)
+
+
+def upload(option: argparse.Namespace) -> int:
+    app_properties = AppProperties.load_properties(option)
+    client_configuration = ClientConfiguration(app_properties)
+    adapter_configuration = AdapterManagerConfiguration(app_properties)
+    set_retry_policy(RetryPolicy(
+        max_attempts=client_configuration.get_retry_max_attempts(),
+        budget_sec=client_configuration.get_retry_budget()))
+    if client_configuration.should_collect_request_metrics():
+        set_request_metrics(RequestMetrics(client_configuration.get_request_metrics_file()))
+
+    api_client = ApiClientWorker(client_configuration)
+    uploader = OfflineResultsUploader(
+        option.results_dir, api_client, client_configuration.get_upload_threads())
+
+    test_run_id = adapter_configuration.get_test_run_id() or uploader.get_test_run_id()
+    if not test_run_id:
+        test_run_id = api_client.create_test_run(
+            adapter_configuration.get_test_run_name(),
+            tags=adapter_configuration.get_test_run_tags(),
+            links=adapter_configuration.get_test_run_links())
+    api_client.set_test_run_id(test_run_id)
+
+    uploaded = uploader.upload(adapter_configuration.should_automatic_creation_test_cases())
+    print(f'Uploaded {uploaded} test results to test run {test_run_id}')
+
+    if get_request_metrics():
+        get_request_metrics().report()
+
+    return 0
+
+
+def main(args=None) -> int:
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+    option = parse_args(args)
+
+    if option.command == 'upload':
+        return upload(option)
+
+    print(__doc__)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -163,6 +163,9 @@ class AppProperties:
             # import realtime false by default
             properties[PropertiesNames.IMPORT_REALTIME] = 'false'
 
+        if not cls.__check_property_value(properties.get(PropertiesNames.IMPORT_REALTIME_ASYNC)):
+            properties[PropertiesNames.IMPORT_REALTIME_ASYNC] = 'false'
+
         if not cls.__check_property_value(properties.get(PropertiesNames.SYNC_STORAGE_PORT)):
             # import realtime false by default
             properties[PropertiesNames.SYNC_STORAGE_PORT] = '49152'
@@ -170,6 +173,45 @@ class AppProperties:
         if not cls.__check_property_value(properties.get(PropertiesNames.LEGACY_WORKFLOW)):
             properties[PropertiesNames.LEGACY_WORKFLOW] = 'false'
 
+        if not cls.__check_property_value(properties.get(PropertiesNames.UPLOAD_THREADS)):
+            properties[PropertiesNames.UPLOAD_THREADS] = '1'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.STATUS_CODES_CACHE_TTL)):
+            properties[PropertiesNames.STATUS_CODES_CACHE_TTL] = '600'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.AUTOTEST_FINGERPRINT_TTL)):
+            properties[PropertiesNames.AUTOTEST_FINGERPRINT_TTL] = '0'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.CONNECT_TIMEOUT)):
+            properties[PropertiesNames.CONNECT_TIMEOUT] = '30'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.READ_TIMEOUT)):
+            properties[PropertiesNames.READ_TIMEOUT] = '300'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.TCP_KEEP_ALIVE)):
+            properties[PropertiesNames.TCP_KEEP_ALIVE] = 'true'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.HTTP_COMPRESSION)):
+            properties[PropertiesNames.HTTP_COMPRESSION] = 'true'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.REQUEST_COMPRESSION_THRESHOLD)):
+            properties[PropertiesNames.REQUEST_COMPRESSION_THRESHOLD] = '0'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.RESULTS_JOURNAL)):
+            properties[PropertiesNames.RESULTS_JOURNAL] = 'false'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.TEST_RESULTS_PAGE_SIZE)):
+            properties[PropertiesNames.TEST_RESULTS_PAGE_SIZE] = '100'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.RETRY_MAX_ATTEMPTS)):
+            properties[PropertiesNames.RETRY_MAX_ATTEMPTS] = '10'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.RETRY_BUDGET)):
+            properties[PropertiesNames.RETRY_BUDGET] = '300'
+
+        if not cls.__check_property_value(properties.get(PropertiesNames.REQUEST_METRICS)):
+            properties[PropertiesNames.REQUEST_METRICS] = 'false'
+
     @classmethod
     def __load_file_properties_from_toml(cls):
         properties = {}
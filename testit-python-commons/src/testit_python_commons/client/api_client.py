@@ -1,8 +1,10 @@
 ﻿import logging
 import os
+import socket
+import threading
 from datetime import datetime
 
-import adapters_api
+import urllib3
 from adapters_api import ApiClient, Configuration
 from adapters_api.apis import (
     AttachmentsApi,
@@ -19,28 +21,34 @@ from adapters_api.models import (
     AutoTestCreateApiModel,
     AutoTestUpdateApiModel,
     AttachmentPutModel,
+    AutoTestResultsForTestRunModel,
     TestResultResponse,
     TestResultShortResponse,
     TestRunApiResult,
-    AdaptersAutoTestsIdWorkItemsPostRequest,
-    AutoTestWorkItemIdentifierApiResult,
+    TestStatusApiType,
     WorkflowApiResult,
 )
 
 from testit_python_commons.client.client_configuration import ClientConfiguration
 from testit_python_commons.client.converter import Converter
+from testit_python_commons.client.helpers.attachment_uploader import AttachmentUploader
+from testit_python_commons.client.helpers.autotest_fingerprint_cache import AutotestFingerprintCache
 from testit_python_commons.client.helpers.bulk_autotest_helper import BulkAutotestHelper
-from testit_python_commons.client.helpers.test_result_matching import pick_best_in_progress_id
-from typing import List
+from testit_python_commons.client.helpers.in_progress_index import InProgressTestResultIndex
+from testit_python_commons.client.helpers.multipart_body import MultipartFileBody
+from testit_python_commons.client.helpers.paginator import iterate_pages
+from testit_python_commons.client.helpers.status_codes_cache import StatusCodesCache
+from testit_python_commons.client.helpers.work_item_linker import WorkItemLinker
+from typing import Callable, Dict, Iterator, List, Optional, Union
 
 from testit_python_commons.models.link import Link
 from testit_python_commons.models.test_result import TestResult
+from testit_python_commons.services.fixture_storage import FixturesContainersIndex
 from testit_python_commons.services.logger import adapter_logger
+from testit_python_commons.services.request_metrics import get_request_metrics
 from testit_python_commons.services.retry import (
-    is_non_retriable_api_exception,
     is_retriable_connection_error,
     retry,
-    retry_on_connection_error,
 )
 
 
@@ -51,9 +59,21 @@ class ApiClientWorker:
         api_client_config = self.__get_api_client_configuration(
             url=config.get_url(),
             verify_ssl=config.get_cert_validation(),
-            proxy=config.get_proxy())
+            proxy=config.get_proxy(),
+            pool_size=config.get_connection_pool_size(),
+            upload_threads=config.get_upload_threads(),
+            connect_timeout=config.get_connect_timeout(),
+            read_timeout=config.get_read_timeout(),
+            tcp_keep_alive=config.is_tcp_keep_alive(),
+            request_compression_threshold=config.get_request_compression_threshold())
         api_client = self.__get_api_client(api_client_config, config.get_private_token())
 
+        if config.is_http_compression():
+            api_client.set_default_header('Accept-Encoding', 'gzip, deflate')
+
+        if get_request_metrics():
+            get_request_metrics().instrument(api_client, 'tms')
+
         self.__test_run_api = TestRunsApi(api_client=api_client)
         self.__autotest_api = AutoTestsApi(api_client=api_client)
         self.__attachments_api = AttachmentsApi(api_client=api_client)
@@ -62,18 +82,64 @@ class ApiClientWorker:
         self.__projects_api = ProjectsApi(api_client=api_client)
         self.__workflows_api = WorkflowsApi(api_client=api_client)
         self.__config = config
-        self.__status_codes = self.__get_status_codes()
-        self.__claimed_in_progress_ids = set()
+        self.__status_codes: List[str] = None
+        self.__status_codes_lock = threading.Lock()
+        self.__attachment_uploader: AttachmentUploader = None
+        self.__attachment_uploader_lock = threading.Lock()
+        self.__work_item_linker: WorkItemLinker = None
+        self.__work_item_linker_lock = threading.Lock()
+        self.__autotest_fingerprint_cache: AutotestFingerprintCache = None
+        self.__autotest_fingerprint_cache_lock = threading.Lock()
+        self.__in_progress_index = InProgressTestResultIndex(
+            lambda: self.__get_test_results(),
+            lambda result_id: self.__describe_in_progress_test_result(result_id))
 
     @staticmethod
     @adapter_logger
-    def __get_api_client_configuration(url: str, verify_ssl: bool = True, proxy: str = None) -> Configuration:
+    def __get_api_client_configuration(
+            url: str,
+            verify_ssl: bool = True,
+            proxy: str = None,
+            pool_size: int = 0,
+            upload_threads: int = 1,
+            connect_timeout: int = 0,
+            read_timeout: int = 0,
+            tcp_keep_alive: bool = False,
+            request_compression_threshold: int = 0) -> Configuration:
         api_client_configuration = Configuration(host=url)
         api_client_configuration.verify_ssl = verify_ssl
         api_client_configuration.proxy = proxy
+        if pool_size:
+            api_client_configuration.connection_pool_maxsize = pool_size
+        else:
+            # A pool smaller than the number of upload threads makes urllib3 drop connections instead of reusing them
+            api_client_configuration.connection_pool_maxsize = max(
+                api_client_configuration.connection_pool_maxsize, upload_threads)
+        # 0 means no timeout
+        api_client_configuration.timeout = urllib3.Timeout(
+            connect=connect_timeout or None,
+            read=read_timeout or None)
+
+        if tcp_keep_alive:
+            api_client_configuration.socket_options = ApiClientWorker.__get_keep_alive_socket_options()
+
+        if request_compression_threshold:
+            api_client_configuration.gzip_request_threshold = request_compression_threshold
 
         return api_client_configuration
 
+    @staticmethod
+    def __get_keep_alive_socket_options() -> list:
+        socket_options = list(urllib3.connection.HTTPConnection.default_socket_options)
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+        # Probe idle connections after a minute, e.g. behind VPN or NAT that silently drop them
+        for option_name, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 15), ('TCP_KEEPCNT', 4)):
+            if hasattr(socket, option_name):
+                socket_options.append((socket.IPPROTO_TCP, getattr(socket, option_name), value))
+
+        return socket_options
+
     @staticmethod
     @adapter_logger
     def __get_api_client(api_client_config: Configuration, token: str) -> ApiClient:
@@ -177,53 +243,94 @@ class ApiClientWorker:
 
     @adapter_logger
     def get_external_ids_for_test_run_id(self) -> List[str]:
-        test_results: List[TestResultShortResponse] = self.__get_test_results()
-        external_ids: List[str] = Converter.get_external_ids_from_autotest_response_list(
-            test_results,
-            self.__config.get_configuration_id())
+        external_ids = set()
+
+        for test_results in self.__get_test_results_pages():
+            external_ids.update(Converter.get_external_ids_from_autotest_response_list(
+                test_results,
+                self.__config.get_configuration_id()))
 
         if len(external_ids) > 0:
-            return external_ids
+            return list(external_ids)
 
         raise Exception('The autotests with the status "InProgress" ' +
                         f'and the configuration id "{self.__config.get_configuration_id()}" were not found!')
 
-    @retry
-    def __get_test_results(self) -> List[TestResultShortResponse]:
-        all_test_results = []
-        skip = 0
+    def __get_test_results(self) -> Iterator[TestResultShortResponse]:
+        for test_results in self.__get_test_results_pages():
+            yield from test_results
+
+    def __get_test_results_pages(self) -> Iterator[List[TestResultShortResponse]]:
         model: AdaptersTestResultsSearchPostRequest = (
             Converter.build_test_results_search_post_request_with_in_progress_outcome(
                 self.__config.get_test_run_id(),
                 self.__config.get_configuration_id()))
 
-        while skip >= 0:
-            logging.debug(f"Getting test results with limit {self.__tests_limit}: {model}")
+        page_size = self.__config.get_test_results_page_size()
 
-            test_results: List[TestResultShortResponse] = self.__test_results_api.adapters_test_results_search_post(
-                skip=skip,
-                take=self.__tests_limit,
-                adapters_test_results_search_post_request=model)
+        # The server may return fewer results than a larger take asks for,
+        # so only pages of the default size end on a short page
+        return iterate_pages(
+            lambda skip, take: self.__get_test_results_page(model, skip, take),
+            page_size,
+            short_page_is_last=page_size <= self.__tests_limit)
 
-            logging.debug(f"Got {len(test_results)} test results: {test_results}")
+    @retry
+    def __get_test_results_page(
+            self,
+            model: AdaptersTestResultsSearchPostRequest,
+            skip: int,
+            take: int) -> List[TestResultShortResponse]:
+        logging.debug(f"Getting test results with skip {skip} and limit {take}: {model}")
 
-            all_test_results.extend(test_results)
-            skip += self.__tests_limit
+        test_results: List[TestResultShortResponse] = self.__test_results_api.adapters_test_results_search_post(
+            skip=skip,
+            take=take,
+            adapters_test_results_search_post_request=model)
 
-            if len(test_results) == 0:
-                skip = -1
+        logging.debug(f"Got {len(test_results)} test results: {test_results}")
 
-        return all_test_results
+        return test_results
 
     @adapter_logger
+    def __get_autotests_by_external_ids(self, external_ids: List[str]) -> Dict[str, AutoTestApiResult]:
+        autotests_by_external_id: Dict[str, AutoTestApiResult] = {}
+        unique_external_ids = list(dict.fromkeys(
+            external_id for external_id in external_ids if external_id))
+
+        for index in range(0, len(unique_external_ids), self.__tests_limit):
+            chunk = unique_external_ids[index:index + self.__tests_limit]
+
+            for autotest in self.__search_autotests_by_external_ids(chunk):
+                autotests_by_external_id.setdefault(autotest.external_id, autotest)
+
+        logging.debug(
+            'Resolved %d of %d external ids to existing autotests',
+            len(autotests_by_external_id),
+            len(unique_external_ids),
+        )
+
+        return autotests_by_external_id
+
     @retry
-    def __get_autotests_by_external_id(self, external_id: str) -> List[AutoTestApiResult]:
-        model = Converter.project_id_and_external_id_to_auto_tests_search_post_request(
+    def __search_autotests_by_external_ids(self, external_ids: List[str]) -> List[AutoTestApiResult]:
+        all_autotests = []
+        skip = 0
+        model = Converter.project_id_and_external_ids_to_auto_tests_search_post_request(
             self.__config.get_project_id(),
-            external_id)
+            external_ids)
 
-        return self.__autotest_api.adapters_auto_tests_search_post(
-            adapters_auto_tests_search_post_request=model)
+        while True:
+            autotests: List[AutoTestApiResult] = self.__autotest_api.adapters_auto_tests_search_post(
+                skip=skip,
+                take=self.__tests_limit,
+                adapters_auto_tests_search_post_request=model)
+
+            all_autotests.extend(autotests)
+            skip += self.__tests_limit
+
+            if len(autotests) < self.__tests_limit:
+                return all_autotests
 
     @adapter_logger
     @retry
@@ -263,12 +370,33 @@ class ApiClientWorker:
 
     @adapter_logger
     @retry
-    def write_tests(self, test_results: List[TestResult], fixture_containers: dict) -> None:
+    def write_tests(
+            self,
+            test_results: List[TestResult],
+            fixture_containers: Union[dict, FixturesContainersIndex],
+            on_results_sent: Callable[[List[TestResult]], None] = None) -> None:
         logging.debug("call __write_tests")
-        bulk_autotest_helper = BulkAutotestHelper(self.__autotest_api, self.__test_run_api, self.__config)
+        fixture_containers = FixturesContainersIndex.of(fixture_containers)
+        test_results_by_model: Dict[int, TestResult] = {}
+
+        def report_sent_results(result_models: List[AutoTestResultsForTestRunModel]) -> None:
+            # The caller learns which test results were sent even if the upload fails later
+            on_results_sent([test_results_by_model[id(result_model)] for result_model in result_models])
+
+        bulk_autotest_helper = BulkAutotestHelper(
+            self.__autotest_api,
+            self.__test_run_api,
+            self.__config,
+            self.__get_work_item_linker(),
+            self.__get_autotest_fingerprint_cache(),
+            report_sent_results if on_results_sent else None)
+        # Shared fixture steps are converted once per call
+        step_tree_compiler = Converter.create_step_tree_compiler()
         create_count = 0
         update_count = 0
         tests_to_link_after_create = []
+        autotests_by_external_id = self.__get_autotests_by_external_ids(
+            [test_result.get_external_id() for test_result in test_results])
 
         for test_result in test_results:
             test_result = self.__add_fixtures_to_test_result(test_result, fixture_containers)
@@ -277,11 +405,13 @@ class ApiClientWorker:
             test_result_model = Converter.test_result_to_testrun_result_post_model(
                 test_result,
                 self.__config.get_configuration_id(),
-                self.__status_codes)
+                self.__get_cached_status_codes(),
+                step_tree_compiler)
+            test_results_by_model[id(test_result_model)] = test_result
 
-            autotests = self.__get_autotests_by_external_id(test_result.get_external_id())
+            autotest = autotests_by_external_id.get(test_result.get_external_id())
 
-            if autotests:
+            if autotest:
                 update_count += 1
                 logging.debug(
                     'Bulk update path for external_id="%s", automaticCreationTestCases=%s '
@@ -292,10 +422,11 @@ class ApiClientWorker:
                 autotest_links_to_wi_for_update = {}
                 autotest_for_update = Converter.prepare_to_mass_update_autotest(
                     test_result,
-                    autotests[0],
-                    self.__config.get_project_id())
+                    autotest,
+                    self.__config.get_project_id(),
+                    step_tree_compiler)
 
-                autotest_id = autotests[0].id
+                autotest_id = autotest.id
                 autotest_links_to_wi_for_update[autotest_id] = test_result.get_work_item_ids()
 
                 bulk_autotest_helper.add_for_update(
@@ -311,7 +442,8 @@ class ApiClientWorker:
                 )
                 autotest_for_create = Converter.prepare_to_mass_create_autotest(
                     test_result,
-                    self.__config.get_project_id())
+                    self.__config.get_project_id(),
+                    step_tree_compiler)
 
                 bulk_autotest_helper.add_for_create(autotest_for_create, test_result_model)
                 tests_to_link_after_create.append(test_result)
@@ -324,121 +456,47 @@ class ApiClientWorker:
         )
         bulk_autotest_helper.teardown()
 
+        if not tests_to_link_after_create:
+            return
+
+        created_autotests_by_external_id = self.__get_autotests_by_external_ids(
+            [test_result.get_external_id() for test_result in tests_to_link_after_create])
+
+        work_item_ids_by_autotest = {}
         for test_result in tests_to_link_after_create:
-            created_autotests = self.__get_autotests_by_external_id(test_result.get_external_id())
-            if created_autotests:
-                self.__update_autotest_link_from_work_items(
-                    created_autotests[0].id,
-                    test_result.get_work_item_ids())
+            created_autotest = created_autotests_by_external_id.get(test_result.get_external_id())
+            if created_autotest:
+                work_item_ids_by_autotest[created_autotest.id] = test_result.get_work_item_ids()
+
+        self.__update_autotests_links_from_work_items(work_item_ids_by_autotest)
 
     @staticmethod
     @adapter_logger
     def __add_fixtures_to_test_result(
             test_result: TestResult,
-            fixtures_containers: dict) -> TestResult:
+            fixtures_containers: FixturesContainersIndex) -> TestResult:
         setup_results = []
         teardown_results = []
 
-        for uuid, fixtures_container in fixtures_containers.items():
-            if test_result.get_external_id() in fixtures_container.external_ids:
-                if fixtures_container.befores:
-                    setup_results += fixtures_container.befores[0].steps
+        for fixtures_container in fixtures_containers.get_containers(test_result.get_external_id()):
+            if fixtures_container.befores:
+                setup_results += fixtures_container.befores[0].steps
 
-                if fixtures_container.afters:
-                    teardown_results = fixtures_container.afters[0].steps + teardown_results
+            if fixtures_container.afters:
+                teardown_results = fixtures_container.afters[0].steps + teardown_results
 
         test_result.set_setup_results(setup_results)
         test_result.set_teardown_results(teardown_results)
 
         return test_result
 
-    @adapter_logger
-    def __get_work_item_uuids_for_link_with_auto_test(
-            self,
-            work_item_ids: List[str],
-            autotest_global_id: str = None) -> List[str]:
-        linked_work_items = []
-        logging.debug("call __get_work_item_uuids_for_link_with_auto_test")
-
-        if autotest_global_id:
-            linked_work_items = self.__get_work_items_linked_to_autotest(autotest_global_id)
-
-        work_item_uuids = self.__prepare_list_of_work_item_uuids(linked_work_items, work_item_ids)
-
-        return work_item_uuids
-
-    @adapter_logger
-    def __prepare_list_of_work_item_uuids(
-            self,
-            linked_work_items: List[AutoTestWorkItemIdentifierApiResult],
-            work_item_ids: List[str]) -> List[str]:
-        work_item_uuids = []
-
-        for linked_work_item in linked_work_items:
-            linked_work_item_id = str(linked_work_item.global_id)
-            linked_work_item_uuid = linked_work_item.id
-
-            if linked_work_item_id in work_item_ids:
-                work_item_ids.remove(linked_work_item_id)
-                work_item_uuids.append(linked_work_item_uuid)
-
-                continue
-
-            if not self.__config.get_automatic_updation_links_to_test_cases():
-                work_item_uuids.append(linked_work_item_uuid)
-
-        for work_item_id in work_item_ids:
-            work_item_uuid = self.__get_work_item_uuid_by_work_item_id(work_item_id)
-
-            if work_item_uuid:
-                work_item_uuids.append(work_item_uuid)
-
-        return work_item_uuids
-
-    @adapter_logger
-    def __get_work_item_uuid_by_work_item_id(self, work_item_id: str) -> str or None:
-        logging.debug('Getting workitem by id ' + work_item_id)
-
-        try:
-            work_item = self.__work_items_api.adapters_work_items_id_get(id=work_item_id)
-
-            # logging.debug(f'Got workitem {work_item}')
-
-            return work_item.id
-        except adapters_api.exceptions.ApiException as exc:
-            if is_retriable_connection_error(exc):
-                raise
-            if is_non_retriable_api_exception(exc):
-                logging.warning(f'Getting workitem by id {work_item_id} status: {exc}')
-                return
-            raise
-        except Exception as exc:
-            if is_retriable_connection_error(exc):
-                raise
-            logging.error(f'Getting workitem by id {work_item_id} status: {exc}')
-
-    @adapter_logger
-    @retry_on_connection_error
-    def __get_work_items_linked_to_autotest(self, autotest_global_id: str) -> List[AutoTestWorkItemIdentifierApiResult]:
-        return self.__autotest_api.adapters_auto_tests_id_work_items_get(id=autotest_global_id)
-
     @adapter_logger
     def __update_autotest_link_from_work_items(self, autotest_global_id: str, work_item_ids: list):
-        linked_work_items = self.__get_work_items_linked_to_autotest(autotest_global_id)
-
-        for linked_work_item in linked_work_items:
-            linked_work_item_id = str(linked_work_item.global_id)
-
-            if linked_work_item_id in work_item_ids:
-                work_item_ids.remove(linked_work_item_id)
+        self.__update_autotests_links_from_work_items({autotest_global_id: work_item_ids})
 
-                continue
-
-            if self.__config.get_automatic_updation_links_to_test_cases():
-                self.__unlink_test_to_work_item(autotest_global_id, linked_work_item_id)
-
-        for work_item_id in work_item_ids:
-            self.__link_test_to_work_item(autotest_global_id, work_item_id)
+    @adapter_logger
+    def __update_autotests_links_from_work_items(self, work_item_ids_by_autotest: Dict[str, List[str]]):
+        self.__get_work_item_linker().update_links(work_item_ids_by_autotest)
 
     @adapter_logger
     @retry
@@ -476,6 +534,12 @@ class ApiClientWorker:
         logging.debug(f'Autotest "{test_result.get_autotest_name()}" was found')
 
         model = Converter.prepare_to_update_autotest(test_result, autotest, self.__config.get_project_id())
+        fingerprint_cache = self.__get_autotest_fingerprint_cache()
+        fingerprint = fingerprint_cache.get_fingerprint(model)
+
+        if fingerprint_cache.is_unchanged(model.external_id, fingerprint):
+            logging.debug(f'Autotest "{test_result.get_autotest_name()}" is unchanged, skipping update')
+            return
 
         try:
             self.__autotest_api.adapters_auto_tests_put(adapters_auto_tests_put_request=model)
@@ -483,7 +547,9 @@ class ApiClientWorker:
             if is_retriable_connection_error(exc):
                 raise
             logging.error(f'Cannot update autotest "{test_result.get_autotest_name()}" status: {exc}')
+            return
 
+        fingerprint_cache.update({model.external_id: fingerprint})
         logging.debug(f'Autotest "{test_result.get_autotest_name()}" was updated')
 
     @adapter_logger
@@ -496,81 +562,34 @@ class ApiClientWorker:
         logging.debug(f'Autotests were updated')
 
     @adapter_logger
-    @retry
-    def __unlink_test_to_work_item(self, autotest_global_id: str, work_item_id: str) -> None:
-        try:
-            self.__autotest_api.adapters_auto_tests_id_work_items_delete(
-                id=autotest_global_id,
-                work_item_id=work_item_id)
-        except adapters_api.exceptions.ApiException as exc:
-            if is_non_retriable_api_exception(exc):
-                logging.warning(
-                    'Cannot unlink autotest %s from work item %s: %s',
-                    autotest_global_id,
-                    work_item_id,
-                    exc,
-                )
-                return
-            raise
+    def find_in_progress_test_result_id(self, external_id: str, parameters=None):
+        if not external_id:
+            return None
 
-        logging.debug(f'Autotest was unlinked with workItem "{work_item_id}" by global id "{autotest_global_id}')
+        return self.__in_progress_index.claim(external_id, parameters)
 
-    @adapter_logger
-    @retry
-    def __link_test_to_work_item(self, autotest_global_id: str, work_item_id: str) -> None:
+    def __describe_in_progress_test_result(self, result_id: str) -> dict:
         try:
-            self.__autotest_api.adapters_auto_tests_id_work_items_post(
-                id=autotest_global_id,
-                adapters_auto_tests_id_work_items_post_request=AdaptersAutoTestsIdWorkItemsPostRequest(
-                    id=work_item_id))
-        except adapters_api.exceptions.ApiException as exc:
-            if is_non_retriable_api_exception(exc):
-                logging.warning(
-                    'Cannot link autotest %s to work item %s: %s',
-                    autotest_global_id,
-                    work_item_id,
-                    exc,
-                )
-                return
-            raise
+            detail = self.get_test_result_by_id(result_id)
+        except Exception as exc:
+            logging.debug("getTestResult %s failed: %s", result_id, exc)
+            return {"has_test_point": False, "parameters": {}}
 
-        logging.debug(f'Autotest was linked with workItem "{work_item_id}" by global id "{autotest_global_id}')
+        return {
+            "has_test_point": self.__is_valid_test_point_id(getattr(detail, "test_point_id", None)),
+            "parameters": getattr(detail, "parameters", None) or {},
+            "in_progress": self.__is_in_progress(detail),
+        }
 
-    @adapter_logger
-    def find_in_progress_test_result_id(self, external_id: str, parameters=None):
-        if not external_id:
-            return None
+    @staticmethod
+    def __is_in_progress(test_result: TestResultResponse) -> bool:
+        status = getattr(test_result, "status", None)
+        status_type = getattr(status, "type", None) if status is not None else None
+        if not isinstance(status_type, TestStatusApiType):
+            # Without a status the result is taken as InProgress, as it was found by the InProgress search
+            return True
 
-        candidates = []
-        for item in self.__get_test_results():
-            if item is None:
-                continue
-            if getattr(item, "autotest_external_id", None) != external_id:
-                continue
-            result_id = getattr(item, "id", None)
-            if result_id is None:
-                continue
-            result_id_str = str(result_id)
-            if result_id_str in self.__claimed_in_progress_ids:
-                continue
-            try:
-                detail = self.get_test_result_by_id(result_id_str)
-                test_point_id = getattr(detail, "test_point_id", None)
-                parameters_meta = getattr(detail, "parameters", None) or {}
-            except Exception as exc:
-                logging.debug("getTestResult %s failed: %s", result_id_str, exc)
-                test_point_id = None
-                parameters_meta = {}
-            candidates.append({
-                "id": result_id_str,
-                "has_test_point": self.__is_valid_test_point_id(test_point_id),
-                "parameters": parameters_meta,
-            })
-
-        chosen = pick_best_in_progress_id(candidates, parameters)
-        if chosen:
-            self.__claimed_in_progress_ids.add(chosen)
-        return chosen
+        return status_type.value == "InProgress"
 
     @staticmethod
     def __is_valid_test_point_id(test_point_id) -> bool:
@@ -581,12 +600,17 @@ class ApiClientWorker:
 
     @adapter_logger
     @retry
-    def __update_existing_test_result(self, test_result_id: str, test_result: TestResult) -> str:
+    def __update_existing_test_result(self, test_result_id: str, test_result: TestResult) -> Optional[str]:
         existing = self.get_test_result_by_id(test_result_id)
+        if not self.__is_in_progress(existing):
+            # Another adapter process may have set this result after the InProgress index was loaded
+            logging.debug('Test result "%s" is no longer InProgress', test_result_id)
+            return None
+
         model = Converter.convert_test_result_model_to_test_results_id_put_request(existing)
 
         outcome = test_result.get_outcome()
-        if outcome and outcome.upper() in self.__status_codes:
+        if outcome and outcome.upper() in self.__get_cached_status_codes():
             model.status_code = outcome
 
         if test_result.get_duration() is not None:
@@ -614,13 +638,20 @@ class ApiClientWorker:
             test_result.get_external_id(),
             test_result.get_parameters(),
         )
-        if existing_id:
-            return self.__update_existing_test_result(existing_id, test_result)
+        while existing_id:
+            updated_id = self.__update_existing_test_result(existing_id, test_result)
+            if updated_id:
+                return updated_id
+
+            existing_id = self.find_in_progress_test_result_id(
+                test_result.get_external_id(),
+                test_result.get_parameters(),
+            )
 
         model = Converter.test_result_to_testrun_result_post_model(
             test_result,
             self.__config.get_configuration_id(),
-            self.__status_codes)
+            self.__get_cached_status_codes())
 
         response = self.__test_run_api.adapters_test_runs_id_test_results_post(
             id=self.__config.get_test_run_id(),
@@ -637,16 +668,21 @@ class ApiClientWorker:
         return self.__test_results_api.adapters_test_results_id_get(id=test_result_id)
 
     @adapter_logger
-    def update_test_results(self, fixtures_containers: dict, test_result_ids: dict) -> None:
+    def update_test_results(
+            self,
+            fixtures_containers: Union[dict, FixturesContainersIndex],
+            test_result_ids: dict) -> None:
         test_results = Converter.fixtures_containers_to_test_results_with_all_fixture_step_results(
             fixtures_containers, test_result_ids)
 
         if not test_results:
             return
 
+        step_tree_compiler = Converter.create_fixture_step_tree_compiler()
+
         for test_result in test_results:
             model = Converter.convert_test_result_with_all_setup_and_teardown_steps_to_test_results_id_put_request(
-                test_result)
+                test_result, step_tree_compiler)
 
             try:
                 self.__test_results_api.adapters_test_results_id_put(
@@ -662,25 +698,79 @@ class ApiClientWorker:
     @retry
     def __upload_attachment(self, path: str) -> AttachmentPutModel:
         with open(path, "rb") as file:
-            attachment_response = self.__attachments_api.adapters_attachments_post(file=file)
-        return AttachmentPutModel(attachment_response['id'])
+            return self.__post_attachment(file, os.path.basename(path))
 
     @adapter_logger
-    def load_attachments(self, attach_paths: list or tuple) -> List[AttachmentPutModel]:
-        attachments = []
-
-        for path in attach_paths:
-            if os.path.isfile(path):
-                try:
-                    attachments.append(self.__upload_attachment(path))
-                    logging.debug(f'Attachment "{path}" was uploaded')
-                except Exception as exc:
-                    if is_retriable_connection_error(exc):
-                        raise
-                    logging.error(f'Upload attachment "{path}" status: {exc}')
+    def create_attachment(self, body, name: str) -> List[AttachmentPutModel]:
+        try:
+            if hasattr(body, 'read') and not body.seekable():
+                # A partly sent stream cannot be sent again, so the upload is not retried
+                attachment = self.__post_attachment(body, name)
             else:
-                logging.error(f'File "{path}" was not found!')
-        return attachments
+                attachment = self.__upload_attachment_body(
+                    body, name, body.tell() if hasattr(body, 'read') else None)
+        except Exception as exc:
+            if is_retriable_connection_error(exc):
+                raise
+            logging.error(f'Upload attachment "{name}" status: {exc}')
+            return []
+
+        logging.debug(f'Attachment "{name}" was uploaded')
+        return [attachment]
+
+    @adapter_logger
+    @retry
+    def __upload_attachment_body(self, body, name: str, start: int = None) -> AttachmentPutModel:
+        if start is not None:
+            # Rewind the stream when the upload is retried
+            body.seek(start)
+
+        return self.__post_attachment(body, name)
+
+    def __post_attachment(self, content, file_name: str) -> AttachmentPutModel:
+        # The generated client reads the whole file into memory to build the multipart body,
+        # so the body is streamed from the content instead
+        endpoint = self.__attachments_api.adapters_attachments_post_endpoint
+        body = MultipartFileBody('file', file_name, content)
+
+        header_params = {'Accept': 'application/json', 'Content-Type': body.content_type}
+        if body.content_length is not None:
+            header_params['Content-Length'] = str(body.content_length)
+
+        attachment = endpoint.api_client.call_api(
+            endpoint.settings['endpoint_path'],
+            endpoint.settings['http_method'],
+            header_params=header_params,
+            body=body,
+            response_type=endpoint.settings['response_type'],
+            auth_settings=endpoint.settings['auth'],
+            _return_http_data_only=True,
+            _check_type=True)
+
+        return AttachmentPutModel(attachment.id)
+
+    @adapter_logger
+    def load_attachments(self, attach_paths: list or tuple) -> List[AttachmentPutModel]:
+        return self.__get_attachment_uploader().upload(attach_paths)
+
+    def __get_attachment_uploader(self) -> AttachmentUploader:
+        with self.__attachment_uploader_lock:
+            if self.__attachment_uploader is None:
+                self.__attachment_uploader = AttachmentUploader(
+                    lambda path: self.__upload_attachment(path),
+                    self.__config.get_upload_threads())
+
+        return self.__attachment_uploader
+
+    def __get_work_item_linker(self) -> WorkItemLinker:
+        with self.__work_item_linker_lock:
+            if self.__work_item_linker is None:
+                self.__work_item_linker = WorkItemLinker(
+                    self.__autotest_api,
+                    self.__config.get_automatic_updation_links_to_test_cases() is True,
+                    self.__config.get_upload_threads())
+
+        return self.__work_item_linker
 
     def get_configuration_id(self):
         return self.__config.get_configuration_id()
@@ -695,9 +785,47 @@ class ApiClientWorker:
     def __get_workflow_by_id(self, workflow_id: str) -> WorkflowApiResult:
         return self.__workflows_api.adapters_workflows_id_get(id=workflow_id)
 
+    def __get_cached_status_codes(self) -> List[str]:
+        if self.__status_codes is None:
+            with self.__status_codes_lock:
+                if self.__status_codes is None:
+                    self.__status_codes = self.__get_status_codes()
+
+        return self.__status_codes
+
+    @adapter_logger
+    def invalidate_status_codes(self) -> None:
+        with self.__status_codes_lock:
+            self.__status_codes = None
+            self.__get_status_codes_cache().invalidate()
+
+    def __get_autotest_fingerprint_cache(self) -> AutotestFingerprintCache:
+        with self.__autotest_fingerprint_cache_lock:
+            if self.__autotest_fingerprint_cache is None:
+                self.__autotest_fingerprint_cache = AutotestFingerprintCache(
+                    self.__config.get_url(),
+                    self.__config.get_project_id(),
+                    self.__config.get_autotest_fingerprint_ttl())
+
+        return self.__autotest_fingerprint_cache
+
+    def __get_status_codes_cache(self) -> StatusCodesCache:
+        return StatusCodesCache(
+            self.__config.get_url(),
+            self.__config.get_project_id(),
+            self.__config.get_status_codes_cache_ttl())
+
     @adapter_logger
     def __get_status_codes(self) -> List[str]:
+        status_codes_cache = self.__get_status_codes_cache()
+        status_codes = status_codes_cache.get()
+        if status_codes is not None:
+            logging.debug('Using cached status codes')
+            return status_codes
+
         project = self.__get_project()
         workflow = self.__get_workflow_by_id(project.workflow_id)
+        status_codes = [status.code for status in workflow.statuses]
+        status_codes_cache.set(status_codes)
 
-        return [status.code for status in workflow.statuses]
+        return status_codes
@@ -24,6 +24,33 @@ class ClientConfiguration:
         self.__sync_storage_port = app_properties.get(PropertiesNames.SYNC_STORAGE_PORT)
         self.__legacy_workflow = Utils.convert_value_str_to_bool(
             app_properties.get(PropertiesNames.LEGACY_WORKFLOW).lower())
+        self.__upload_threads = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.UPLOAD_THREADS), default=1, minimum=1)
+        self.__status_codes_cache_ttl = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.STATUS_CODES_CACHE_TTL), default=600, minimum=0)
+        self.__autotest_fingerprint_ttl = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.AUTOTEST_FINGERPRINT_TTL), default=0, minimum=0)
+        self.__connection_pool_size = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.CONNECTION_POOL_SIZE), default=0, minimum=0)
+        self.__connect_timeout = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.CONNECT_TIMEOUT), default=30, minimum=0)
+        self.__read_timeout = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.READ_TIMEOUT), default=300, minimum=0)
+        self.__tcp_keep_alive = Utils.convert_value_str_to_bool(
+            app_properties.get(PropertiesNames.TCP_KEEP_ALIVE).lower())
+        self.__http_compression = Utils.convert_value_str_to_bool(
+            app_properties.get(PropertiesNames.HTTP_COMPRESSION).lower())
+        self.__request_compression_threshold = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.REQUEST_COMPRESSION_THRESHOLD), default=0, minimum=0)
+        self.__test_results_page_size = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.TEST_RESULTS_PAGE_SIZE), default=100, minimum=1)
+        self.__retry_max_attempts = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.RETRY_MAX_ATTEMPTS), default=10, minimum=1)
+        self.__retry_budget = Utils.convert_value_str_to_int(
+            app_properties.get(PropertiesNames.RETRY_BUDGET), default=300, minimum=0)
+        self.__request_metrics = Utils.convert_value_str_to_bool(
+            (app_properties.get(PropertiesNames.REQUEST_METRICS) or '').lower())
+        self.__request_metrics_file = app_properties.get(PropertiesNames.REQUEST_METRICS_FILE) or None
 
     @adapter_logger
     def get_url(self):
@@ -72,3 +99,45 @@ class ClientConfiguration:
 
     def is_legacy_workflow(self) -> bool:
         return self.__legacy_workflow
+
+    def get_upload_threads(self) -> int:
+        return self.__upload_threads
+
+    def get_status_codes_cache_ttl(self) -> int:
+        return self.__status_codes_cache_ttl
+
+    def get_autotest_fingerprint_ttl(self) -> int:
+        return self.__autotest_fingerprint_ttl
+
+    def get_connection_pool_size(self) -> int:
+        return self.__connection_pool_size
+
+    def get_connect_timeout(self) -> int:
+        return self.__connect_timeout
+
+    def get_read_timeout(self) -> int:
+        return self.__read_timeout
+
+    def is_tcp_keep_alive(self) -> bool:
+        return self.__tcp_keep_alive
+
+    def is_http_compression(self) -> bool:
+        return self.__http_compression
+
+    def get_request_compression_threshold(self) -> int:
+        return self.__request_compression_threshold
+
+    def get_test_results_page_size(self) -> int:
+        return self.__test_results_page_size
+
+    def get_retry_max_attempts(self) -> int:
+        return self.__retry_max_attempts
+
+    def get_retry_budget(self) -> int:
+        return self.__retry_budget
+
+    def should_collect_request_metrics(self) -> bool:
+        return self.__request_metrics or self.__request_metrics_file is not None
+
+    def get_request_metrics_file(self):
+        return self.__request_metrics_file
@@ -1,5 +1,5 @@
 ﻿import logging
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from adapters_api.models import (
     AdaptersTestResultsSearchPostRequest,
@@ -38,14 +38,22 @@ from adapters_api.models import (
     LabelApiModel,
 )
 
+from testit_python_commons.client.helpers.model_builder import ModelBuilder
+from testit_python_commons.client.helpers.step_tree_compiler import StepTreeCompiler
 from testit_python_commons.models.link import Link
 from testit_python_commons.models.step_result import StepResult
 from testit_python_commons.models.test_result import TestResult
 from testit_python_commons.models.test_result_with_all_fixture_step_results_model import TestResultWithAllFixtureStepResults
+from testit_python_commons.services.fixture_storage import FixturesContainersIndex
 from testit_python_commons.services.logger import adapter_logger
 
 
 class Converter:
+    # Targets of the step tree compilers
+    __AUTOTEST_STEPS = 'autotest_steps'
+    __STEP_RESULTS = 'step_results'
+    __STEP_RESULT_UPDATE_REQUESTS = 'step_result_update_requests'
+
     @staticmethod
     @adapter_logger
     def test_run_to_test_run_short_model(
@@ -182,6 +190,23 @@ class Converter:
 
         return AdaptersAutoTestsSearchPostRequest(filter=autotests_filter, includes=autotests_includes)
 
+    @staticmethod
+    @adapter_logger
+    def project_id_and_external_ids_to_auto_tests_search_post_request(
+            project_id: str,
+            external_ids: List[str]
+    ) -> AdaptersAutoTestsSearchPostRequest:
+        autotests_filter = AutoTestSearchApiModelFilter(
+            project_ids=[project_id],
+            external_ids=list(external_ids),
+            is_deleted=False)
+        autotests_includes = AutoTestSearchApiModelIncludes(
+            include_steps=False,
+            include_links=False,
+            include_labels=False)
+
+        return AdaptersAutoTestsSearchPostRequest(filter=autotests_filter, includes=autotests_includes)
+
     @staticmethod
     @adapter_logger
     def build_test_results_search_post_request_with_in_progress_outcome(
@@ -246,17 +271,18 @@ class Converter:
     def test_result_to_autotest_post_model(
             cls,
             test_result: TestResult,
-            project_id: str) -> AutoTestCreateApiModel:
+            project_id: str,
+            step_tree_compiler: StepTreeCompiler = None) -> AutoTestCreateApiModel:
         return AutoTestCreateApiModel(
             external_id=test_result.get_external_id(),
             project_id=project_id,
             name=test_result.get_autotest_name(),
             steps=cls.step_results_to_autotest_steps_model(
-                test_result.get_step_results()),
+                test_result.get_step_results(), step_tree_compiler),
             setup=cls.step_results_to_autotest_steps_model(
-                test_result.get_setup_results()),
+                test_result.get_setup_results(), step_tree_compiler),
             teardown=cls.step_results_to_autotest_steps_model(
-                test_result.get_teardown_results()),
+                test_result.get_teardown_results(), step_tree_compiler),
             namespace=test_result.get_namespace(),
             classname=test_result.get_classname(),
             title=test_result.get_title(),
@@ -300,18 +326,19 @@ class Converter:
     def test_result_to_autotest_put_model(
             cls,
             test_result: TestResult,
-            project_id: str) -> AutoTestUpdateApiModel:
+            project_id: str,
+            step_tree_compiler: StepTreeCompiler = None) -> AutoTestUpdateApiModel:
         return AutoTestUpdateApiModel(
             external_id=test_result.get_external_id(),
             project_id=project_id,
             name=test_result.get_autotest_name(),
             reset_layer=False,
             steps=cls.step_results_to_autotest_steps_model(
-                test_result.get_step_results()),
+                test_result.get_step_results(), step_tree_compiler),
             setup=cls.step_results_to_autotest_steps_model(
-                test_result.get_setup_results()),
+                test_result.get_setup_results(), step_tree_compiler),
             teardown=cls.step_results_to_autotest_steps_model(
-                test_result.get_teardown_results()),
+                test_result.get_teardown_results(), step_tree_compiler),
             namespace=test_result.get_namespace(),
             classname=test_result.get_classname(),
             title=test_result.get_title(),
@@ -355,17 +382,19 @@ class Converter:
             cls,
             test_result: TestResult,
             configuration_id: str,
-            status_codes: List[str]) -> AutoTestResultsForTestRunModel:
-        model = AutoTestResultsForTestRunModel(
+            status_codes: List[str],
+            step_tree_compiler: StepTreeCompiler = None) -> AutoTestResultsForTestRunModel:
+        model = ModelBuilder.build(
+            AutoTestResultsForTestRunModel,
             configuration_id=configuration_id,
             auto_test_external_id=test_result.get_external_id(),
-            status_type=TestStatusType(test_result.get_status_type()),
+            status_type=ModelBuilder.simple(TestStatusType, test_result.get_status_type()),
             step_results=cls.step_results_to_attachment_put_model_autotest_step_results_model(
-                test_result.get_step_results()),
+                test_result.get_step_results(), step_tree_compiler),
             setup_results=cls.step_results_to_attachment_put_model_autotest_step_results_model(
-                test_result.get_setup_results()),
+                test_result.get_setup_results(), step_tree_compiler),
             teardown_results=cls.step_results_to_attachment_put_model_autotest_step_results_model(
-                test_result.get_teardown_results()),
+                test_result.get_teardown_results(), step_tree_compiler),
             traces=test_result.get_traces(),
             attachments=test_result.get_attachments(),
             parameters=test_result.get_parameters(),
@@ -406,12 +435,13 @@ class Converter:
     @adapter_logger
     def convert_test_result_with_all_setup_and_teardown_steps_to_test_results_id_put_request(
             cls,
-            test_result: TestResultWithAllFixtureStepResults) -> AdaptersTestResultsIdPutRequest:
+            test_result: TestResultWithAllFixtureStepResults,
+            step_tree_compiler: StepTreeCompiler = None) -> AdaptersTestResultsIdPutRequest:
         return AdaptersTestResultsIdPutRequest(
             setup_results=cls.step_results_to_auto_test_step_result_update_request(
-                test_result.get_setup_results()),
+                test_result.get_setup_results(), step_tree_compiler),
             teardown_results=cls.step_results_to_auto_test_step_result_update_request(
-                test_result.get_teardown_results()))
+                test_result.get_teardown_results(), step_tree_compiler))
 
     @classmethod
     @adapter_logger
@@ -546,65 +576,86 @@ class Converter:
     def build_attachment_update_request(attachment: AttachmentPutModel) -> AttachmentUpdateRequest:
         return AttachmentUpdateRequest(id=attachment.id)
 
+    @classmethod
+    def create_step_tree_compiler(cls) -> StepTreeCompiler:
+        """Returns a compiler building autotest steps and step results of a step in one pass."""
+        return StepTreeCompiler({
+            cls.__AUTOTEST_STEPS: cls.__build_autotest_step,
+            cls.__STEP_RESULTS: cls.__build_step_result,
+        })
+
+    @classmethod
+    def create_fixture_step_tree_compiler(cls) -> StepTreeCompiler:
+        """Returns a compiler building step result update requests of fixture steps."""
+        return StepTreeCompiler({cls.__STEP_RESULT_UPDATE_REQUESTS: cls.__build_step_result_update_request})
+
     @classmethod
     # @adapter_logger
     def step_results_to_autotest_steps_model(
-            cls, step_results: List[StepResult]) -> List[AutoTestStepApiModel]:
-        autotest_model_steps = []
-
-        for step_result in step_results:
-            autotest_model_steps.append(
-                AutoTestStepApiModel(
-                    title=step_result.get_title(),
-                    description=step_result.get_description(),
-                    steps=cls.step_results_to_autotest_steps_model(
-                        step_result.get_step_results()))
-            )
+            cls,
+            step_results: List[StepResult],
+            step_tree_compiler: StepTreeCompiler = None) -> List[AutoTestStepApiModel]:
+        step_tree_compiler = step_tree_compiler or StepTreeCompiler(
+            {cls.__AUTOTEST_STEPS: cls.__build_autotest_step})
 
-        return autotest_model_steps
+        return step_tree_compiler.compile(step_results)[cls.__AUTOTEST_STEPS]
 
     @classmethod
     @adapter_logger
     def step_results_to_attachment_put_model_autotest_step_results_model(
-            cls, step_results: List[StepResult]) -> List[AttachmentPutModelAutoTestStepResultsModel]:
-        autotest_model_step_results = []
-
-        for step_result in step_results:
-            autotest_model_step_results.append(
-                AttachmentPutModelAutoTestStepResultsModel(
-                    title=step_result.get_title(),
-                    outcome=AvailableTestResultOutcome(step_result.get_outcome()),
-                    description=step_result.get_description(),
-                    duration=step_result.get_duration(),
-                    parameters=step_result.get_parameters(),
-                    attachments=step_result.get_attachments(),
-                    started_on=step_result.get_started_on(),
-                    completed_on=step_result.get_completed_on(),
-                    step_results=cls.step_results_to_attachment_put_model_autotest_step_results_model(
-                        step_result.get_step_results())
-                )
-            )
+            cls,
+            step_results: List[StepResult],
+            step_tree_compiler: StepTreeCompiler = None) -> List[AttachmentPutModelAutoTestStepResultsModel]:
+        step_tree_compiler = step_tree_compiler or StepTreeCompiler(
+            {cls.__STEP_RESULTS: cls.__build_step_result})
+
+        return step_tree_compiler.compile(step_results)[cls.__STEP_RESULTS]
 
-        return autotest_model_step_results
+    @staticmethod
+    def __build_autotest_step(
+            step_result: StepResult,
+            steps: List[AutoTestStepApiModel]) -> AutoTestStepApiModel:
+        return ModelBuilder.build(
+            AutoTestStepApiModel,
+            title=step_result.get_title(),
+            description=step_result.get_description(),
+            steps=steps)
+
+    @staticmethod
+    def __build_step_result(
+            step_result: StepResult,
+            step_results: List[AttachmentPutModelAutoTestStepResultsModel]
+    ) -> AttachmentPutModelAutoTestStepResultsModel:
+        return ModelBuilder.build(
+            AttachmentPutModelAutoTestStepResultsModel,
+            title=step_result.get_title(),
+            outcome=ModelBuilder.simple(AvailableTestResultOutcome, step_result.get_outcome()),
+            description=step_result.get_description(),
+            duration=step_result.get_duration(),
+            parameters=step_result.get_parameters(),
+            attachments=step_result.get_attachments(),
+            started_on=step_result.get_started_on(),
+            completed_on=step_result.get_completed_on(),
+            step_results=step_results)
 
     @staticmethod
     @adapter_logger
     def fixtures_containers_to_test_results_with_all_fixture_step_results(
-            fixtures_containers: dict,
+            fixtures_containers: Union[dict, FixturesContainersIndex],
             test_result_ids: dict) -> List[TestResultWithAllFixtureStepResults]:
         test_results_with_all_fixture_step_results = []
+        fixtures_containers_index = FixturesContainersIndex.of(fixtures_containers)
 
         for external_id, test_result_id in test_result_ids.items():
             test_result_with_all_fixture_step_results = TestResultWithAllFixtureStepResults(test_result_id)
 
-            for uuid, fixtures_container in fixtures_containers.items():
-                if external_id in fixtures_container.external_ids:
-                    if fixtures_container.befores:
-                        test_result_with_all_fixture_step_results.set_setup_results(fixtures_container.befores[0].steps)
+            for fixtures_container in fixtures_containers_index.get_containers(external_id):
+                if fixtures_container.befores:
+                    test_result_with_all_fixture_step_results.set_setup_results(fixtures_container.befores[0].steps)
 
-                    if fixtures_container.afters:
-                        test_result_with_all_fixture_step_results.set_teardown_results(
-                            fixtures_container.afters[0].steps)
+                if fixtures_container.afters:
+                    test_result_with_all_fixture_step_results.set_teardown_results(
+                        fixtures_container.afters[0].steps)
 
             if (test_result_with_all_fixture_step_results.get_setup_results()
                     or test_result_with_all_fixture_step_results.get_teardown_results()):
@@ -615,26 +666,28 @@ class Converter:
     @classmethod
     @adapter_logger
     def step_results_to_auto_test_step_result_update_request(
-            cls, step_results: List[StepResult]) -> List[AutoTestStepResultUpdateRequest]:
-        autotest_model_step_results = []
-
-        for step_result in step_results:
-            autotest_model_step_results.append(
-                AutoTestStepResultUpdateRequest(
-                    title=step_result.get_title(),
-                    outcome=AvailableTestResultOutcome(step_result.get_outcome()),
-                    description=step_result.get_description(),
-                    duration=step_result.get_duration(),
-                    parameters=step_result.get_parameters(),
-                    attachments=cls.build_attachment_update_requests(step_result.get_attachments()),
-                    started_on=step_result.get_started_on(),
-                    completed_on=step_result.get_completed_on(),
-                    step_results=cls.step_results_to_auto_test_step_result_update_request(
-                        step_result.get_step_results())
-                )
-            )
+            cls,
+            step_results: List[StepResult],
+            step_tree_compiler: StepTreeCompiler = None) -> List[AutoTestStepResultUpdateRequest]:
+        step_tree_compiler = step_tree_compiler or cls.create_fixture_step_tree_compiler()
+
+        return step_tree_compiler.compile(step_results)[cls.__STEP_RESULT_UPDATE_REQUESTS]
 
-        return autotest_model_step_results
+    @classmethod
+    def __build_step_result_update_request(
+            cls,
+            step_result: StepResult,
+            step_results: List[AutoTestStepResultUpdateRequest]) -> AutoTestStepResultUpdateRequest:
+        return AutoTestStepResultUpdateRequest(
+            title=step_result.get_title(),
+            outcome=AvailableTestResultOutcome(step_result.get_outcome()),
+            description=step_result.get_description(),
+            duration=step_result.get_duration(),
+            parameters=step_result.get_parameters(),
+            attachments=cls.build_attachment_update_requests(step_result.get_attachments()),
+            started_on=step_result.get_started_on(),
+            completed_on=step_result.get_completed_on(),
+            step_results=step_results)
 
     @classmethod
     @adapter_logger
@@ -653,12 +706,14 @@ class Converter:
     def prepare_to_mass_create_autotest(
             cls,
             test_result: TestResult,
-            project_id: str) -> AutoTestCreateApiModel:
+            project_id: str,
+            step_tree_compiler: StepTreeCompiler = None) -> AutoTestCreateApiModel:
         logging.debug('Preparing to create the auto test ' + test_result.get_external_id())
 
         return cls.test_result_to_autotest_post_model(
             test_result,
-            project_id)
+            project_id,
+            step_tree_compiler)
 
     @classmethod
     @adapter_logger
@@ -686,12 +741,14 @@ class Converter:
             cls,
             test_result: TestResult,
             autotest: AutoTestApiResult,
-            project_id: str) -> AutoTestUpdateApiModel:
+            project_id: str,
+            step_tree_compiler: StepTreeCompiler = None) -> AutoTestUpdateApiModel:
         logging.debug('Preparing to update the auto test ' + test_result.get_external_id())
 
         model = cls.test_result_to_autotest_put_model(
             test_result,
-            project_id)
+            project_id,
+            step_tree_compiler)
         model.is_flaky = autotest.is_flaky
         # TODO: return after fix PUT/api/v2/autoTests
         # model.work_item_ids_for_link_with_auto_test = self.__get_work_item_uuids_for_link_with_auto_test(
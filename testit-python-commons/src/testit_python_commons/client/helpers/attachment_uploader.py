@@ -0,0 +1,99 @@
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from adapters_api.models import AttachmentPutModel
+
+from testit_python_commons.services.retry import is_retriable_connection_error
+
+
+class AttachmentUploader:
+    """Uploads attachment files through a bounded pool; files with the same content and name are sent once per run."""
+    __hash_chunk_size = 1024 * 1024
+
+    def __init__(self, upload_file: Callable[[str], AttachmentPutModel], threads: int = 1):
+        self.__upload_file = upload_file
+        self.__threads = max(1, threads)
+        self.__executor: ThreadPoolExecutor = None
+        self.__attachment_ids: Dict[Tuple[str, str], str] = {}
+        self.__lock = threading.Lock()
+
+    def upload(self, paths: Iterable[str]) -> List[AttachmentPutModel]:
+        files = []
+        for path in paths:
+            if os.path.isfile(path):
+                files.append((path, (self.__get_content_hash(path), os.path.basename(path))))
+            else:
+                logging.error(f'File "{path}" was not found!')
+
+        with self.__lock:
+            pending = {}
+            for path, key in files:
+                if key not in self.__attachment_ids:
+                    pending.setdefault(key, path)
+
+        self.__upload_pending(pending)
+
+        attachments = []
+        for path, key in files:
+            attachment_id = self.__attachment_ids.get(key)
+            if attachment_id is None:
+                continue
+
+            if key not in pending:
+                logging.debug(f'Attachment "{path}" was already uploaded as {attachment_id}')
+            attachments.append(AttachmentPutModel(attachment_id))
+
+        return attachments
+
+    def get_cached_count(self) -> int:
+        return len(self.__attachment_ids)
+
+    def __upload_pending(self, pending: Dict[Tuple[str, str], str]) -> None:
+        if self.__threads <= 1 or len(pending) <= 1:
+            results = [self.__upload(key, path) for key, path in pending.items()]
+        else:
+            with self.__lock:
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(
+                        max_workers=self.__threads,
+                        thread_name_prefix='testit-attachment-upload')
+
+            futures = [
+                self.__executor.submit(self.__upload, key, path)
+                for key, path in pending.items()
+            ]
+            results = [future.result() for future in futures]
+
+        for error in results:
+            if error is not None:
+                raise error
+
+    def __upload(self, key: Tuple[str, str], path: str) -> Optional[Exception]:
+        try:
+            attachment = self.__upload_file(path)
+        except Exception as exc:
+            if is_retriable_connection_error(exc):
+                # Raised from the calling thread once every upload of the batch has finished
+                return exc
+            logging.error(f'Upload attachment "{path}" status: {exc}')
+            return None
+
+        with self.__lock:
+            self.__attachment_ids[key] = attachment.id
+        logging.debug(f'Attachment "{path}" was uploaded')
+
+        return None
+
+    @classmethod
+    def __get_content_hash(cls, path: str) -> str:
+        digest = hashlib.sha256()
+
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(cls.__hash_chunk_size), b''):
+                digest.update(chunk)
+
+        return digest.hexdigest()
@@ -0,0 +1,73 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Dict
+
+from testit_python_commons.client.helpers.json_file_cache import JsonFileCache
+
+
+class AutotestFingerprintCache:
+    """On-disk cache of fingerprints of autotest metadata last sent to Test IT.
+
+    An autotest whose update model has the same fingerprint as the cached one is not sent again
+    until the entry expires, so unchanged autotests cost no PUT requests. Disabled unless a TTL is set,
+    as changes made to the autotest elsewhere are not seen while its entry is fresh.
+    """
+    __file_name = 'testit_autotest_fingerprints.json'
+
+    def __init__(self, url: str, project_id: str, ttl_sec: int, cache_dir: str = None):
+        self.__key = f'{url}|{project_id}'
+        self.__ttl_sec = ttl_sec
+        self.__file = JsonFileCache(self.__file_name, 'autotest fingerprints', cache_dir)
+        self.__entries: Dict[str, list] = None
+        self.__lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self.__ttl_sec > 0
+
+    @staticmethod
+    def get_fingerprint(model) -> str:
+        payload = json.dumps(model.to_dict(), sort_keys=True, ensure_ascii=False, default=str)
+
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_unchanged(self, external_id: str, fingerprint: str) -> bool:
+        if not self.is_enabled():
+            return False
+
+        with self.__lock:
+            entry = self.__get_entries().get(external_id)
+
+        if not isinstance(entry, list) or len(entry) != 2:
+            return False
+
+        cached_fingerprint, saved_at = entry
+
+        return cached_fingerprint == fingerprint and JsonFileCache.is_fresh(saved_at, self.__ttl_sec)
+
+    def update(self, fingerprints: Dict[str, str]) -> None:
+        if not self.is_enabled() or not fingerprints:
+            return
+
+        saved_at = time.time()
+
+        with self.__lock:
+            entries = self.__get_entries()
+            for external_id, fingerprint in fingerprints.items():
+                entries[external_id] = [fingerprint, saved_at]
+
+            # Entries of other adapter processes written meanwhile are kept
+            all_entries = self.__file.read()
+            stored = all_entries.get(self.__key)
+            stored = stored if isinstance(stored, dict) else {}
+            stored.update({external_id: entries[external_id] for external_id in fingerprints})
+            all_entries[self.__key] = stored
+            self.__file.write(all_entries)
+
+    def __get_entries(self) -> Dict[str, list]:
+        if self.__entries is None:
+            entries = self.__file.read().get(self.__key)
+            self.__entries = entries if isinstance(entries, dict) else {}
+
+        return self.__entries
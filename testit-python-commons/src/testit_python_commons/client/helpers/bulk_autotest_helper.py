@@ -1,16 +1,19 @@
 ﻿import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from adapters_api.apis import AutoTestsApi, TestRunsApi
 from adapters_api.models import (
     AutoTestCreateApiModel,
     AutoTestUpdateApiModel,
     AutoTestResultsForTestRunModel,
-    AdaptersAutoTestsIdWorkItemsPostRequest,
-    AutoTestWorkItemIdentifierApiResult,
 )
 
 from testit_python_commons.client.client_configuration import ClientConfiguration
+from testit_python_commons.client.helpers.autotest_fingerprint_cache import AutotestFingerprintCache
 from testit_python_commons.client.helpers.threads_manager import ThreadsManager
+from testit_python_commons.client.helpers.work_item_linker import WorkItemLinker
 from testit_python_commons.client.models import (
     ThreadForCreateAndResult,
     ThreadsForCreateAndResult,
@@ -18,11 +21,8 @@ from testit_python_commons.client.models import (
     ThreadsForUpdateAndResult
 )
 from testit_python_commons.services.logger import adapter_logger
-import adapters_api
-
-from testit_python_commons.services.retry import is_non_retriable_api_exception, retry
 from testit_python_commons.utils.html_escape_utils import HtmlEscapeUtils
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 
 class BulkAutotestHelper:
@@ -32,12 +32,28 @@ class BulkAutotestHelper:
             self,
             autotests_api: AutoTestsApi,
             test_runs_api: TestRunsApi,
-            config: ClientConfiguration):
+            config: ClientConfiguration,
+            work_item_linker: WorkItemLinker = None,
+            fingerprint_cache: AutotestFingerprintCache = None,
+            on_results_sent: Callable[[List[AutoTestResultsForTestRunModel]], None] = None):
         self.__autotests_api = autotests_api
         self.__test_runs_api = test_runs_api
         self.__test_run_id = config.get_test_run_id()
-        self.__automatic_updation_links_to_test_cases = config.get_automatic_updation_links_to_test_cases()
         self.__threads_manager = ThreadsManager()
+        self.__upload_threads = config.get_upload_threads()
+        self.__work_item_linker = work_item_linker or WorkItemLinker(
+            autotests_api,
+            automatic_updation_links_to_test_cases=config.get_automatic_updation_links_to_test_cases() is True,
+            threads=self.__upload_threads)
+        self.__fingerprint_cache = fingerprint_cache
+        self.__on_results_sent = on_results_sent
+        self.__executor: ThreadPoolExecutor = None
+        self.__futures: List[Future] = []
+        self.__statistics_lock = threading.Lock()
+        self.__started_at: float = None
+        self.__uploaded_autotests = 0
+        self.__uploaded_results = 0
+        self.__skipped_autotests = 0
 
     @adapter_logger
     def add_for_create(
@@ -67,7 +83,11 @@ class BulkAutotestHelper:
             get_thread_for_update_and_result(update_model.external_id)
 
         thread_for_update: Dict[str, AutoTestUpdateApiModel] = thread_for_update_and_result.get_thread_for_update()
-        thread_for_update[update_model.external_id] = update_model
+        if self.__is_unchanged(update_model):
+            with self.__statistics_lock:
+                self.__skipped_autotests += 1
+        else:
+            thread_for_update[update_model.external_id] = update_model
 
         thread_results_for_updated_autotests: Dict[str, AutoTestResultsForTestRunModel] = thread_for_update_and_result\
             .get_thread_results_for_updated_autotests()
@@ -77,13 +97,28 @@ class BulkAutotestHelper:
             .get_thread_for_autotest_links_to_wi_for_update()
         thread_for_autotest_links_to_wi_for_update.update(autotest_links_to_wi_for_update)
 
-        if len(thread_for_update) >= self.__max_tests_for_import:
+        if len(thread_for_update) >= self.__max_tests_for_import or \
+                len(thread_results_for_updated_autotests) >= self.__max_tests_for_import:
             self.__teardown_for_update()
 
     @adapter_logger
     def teardown(self):
         self.__teardown_for_create()
         self.__teardown_for_update()
+        self.__wait_for_uploads()
+        self.__log_upload_statistics()
+
+    @adapter_logger
+    def get_upload_statistics(self) -> Dict[str, float]:
+        elapsed = time.monotonic() - self.__started_at if self.__started_at is not None else 0.0
+
+        return {
+            'autotests': self.__uploaded_autotests,
+            'results': self.__uploaded_results,
+            'skipped_autotests': self.__skipped_autotests,
+            'seconds': elapsed,
+            'results_per_second': self.__uploaded_results / elapsed if elapsed else 0.0,
+        }
 
     def __teardown_for_create(self):
         all_threads_for_create_and_result: ThreadsForCreateAndResult = self.__threads_manager\
@@ -93,17 +128,17 @@ class BulkAutotestHelper:
             .get_threads_for_create()
         autotests_for_create = list(thread_for_create.values())
 
-        if autotests_for_create:
-            self.__create_tests(autotests_for_create)
-
         threads_results_for_created_autotests: List[Dict[str, AutoTestResultsForTestRunModel]] = all_threads_for_create_and_result\
             .get_threads_results_for_created_autotests()
-
-        for thread_results_for_created_autotests in threads_results_for_created_autotests:
-            self.__load_test_results(list(thread_results_for_created_autotests.values()))
+        results_for_created_autotests = [
+            list(thread_results_for_created_autotests.values())
+            for thread_results_for_created_autotests in threads_results_for_created_autotests]
 
         self.__threads_manager.delete_threads_for_create_and_result()
 
+        if autotests_for_create or results_for_created_autotests:
+            self.__dispatch(self.__upload_for_create, autotests_for_create, results_for_created_autotests)
+
     def __teardown_for_update(self):
         all_threads_for_update_and_result: ThreadsForUpdateAndResult = self.__threads_manager\
             .get_all_threads_for_update_and_result()
@@ -113,22 +148,109 @@ class BulkAutotestHelper:
 
         autotests_for_update = list(thread_for_update.values())
 
+        thread_for_autotest_links_to_wi_for_update: Dict[str, List[str]] = dict(
+            all_threads_for_update_and_result.get_threads_for_autotest_links_to_wi_for_update())
+
+        threads_results_for_updated_autotests: List[Dict[str, AutoTestResultsForTestRunModel]] = all_threads_for_update_and_result\
+            .get_threads_results_for_updated_autotests()
+        results_for_updated_autotests = [
+            list(thread_results_for_updated_autotests.values())
+            for thread_results_for_updated_autotests in threads_results_for_updated_autotests]
+
+        self.__threads_manager.delete_threads_for_update_and_result()
+
+        if autotests_for_update or results_for_updated_autotests:
+            self.__dispatch(
+                self.__upload_for_update,
+                autotests_for_update,
+                thread_for_autotest_links_to_wi_for_update,
+                results_for_updated_autotests)
+
+    def __upload_for_create(
+            self,
+            autotests_for_create: List[AutoTestCreateApiModel],
+            results_for_created_autotests: List[List[AutoTestResultsForTestRunModel]]):
+        if autotests_for_create:
+            self.__create_tests(autotests_for_create)
+
+        for test_results in results_for_created_autotests:
+            self.__load_test_results(test_results)
+
+    def __upload_for_update(
+            self,
+            autotests_for_update: List[AutoTestUpdateApiModel],
+            thread_for_autotest_links_to_wi_for_update: Dict[str, List[str]],
+            results_for_updated_autotests: List[List[AutoTestResultsForTestRunModel]]):
         if autotests_for_update:
+            # Taken before the models are escaped for sending
+            fingerprints = self.__get_fingerprints(autotests_for_update)
             self.__update_tests(autotests_for_update)
+            if fingerprints:
+                self.__fingerprint_cache.update(fingerprints)
 
-        thread_for_autotest_links_to_wi_for_update: Dict[str, List[str]] = all_threads_for_update_and_result\
-            .get_threads_for_autotest_links_to_wi_for_update()
+        self.__work_item_linker.update_links(thread_for_autotest_links_to_wi_for_update)
 
-        for autotest_id, work_item_ids in thread_for_autotest_links_to_wi_for_update.items():
-            self.__update_autotest_link_from_work_items(autotest_id, work_item_ids)
+        for test_results in results_for_updated_autotests:
+            self.__load_test_results(test_results)
 
-        threads_results_for_updated_autotests: List[Dict[str, AutoTestResultsForTestRunModel]] = all_threads_for_update_and_result\
-            .get_threads_results_for_updated_autotests()
+    def __is_unchanged(self, update_model: AutoTestUpdateApiModel) -> bool:
+        if self.__fingerprint_cache is None or not self.__fingerprint_cache.is_enabled():
+            return False
 
-        for thread_results_for_updated_autotests in threads_results_for_updated_autotests:
-            self.__load_test_results(list(thread_results_for_updated_autotests.values()))
+        return self.__fingerprint_cache.is_unchanged(
+            update_model.external_id,
+            self.__fingerprint_cache.get_fingerprint(update_model))
 
-        self.__threads_manager.delete_threads_for_update_and_result()
+    def __get_fingerprints(self, autotests_for_update: List[AutoTestUpdateApiModel]) -> Dict[str, str]:
+        if self.__fingerprint_cache is None or not self.__fingerprint_cache.is_enabled():
+            return {}
+
+        return {
+            update_model.external_id: self.__fingerprint_cache.get_fingerprint(update_model)
+            for update_model in autotests_for_update
+        }
+
+    def __dispatch(self, upload, *args):
+        if self.__started_at is None:
+            self.__started_at = time.monotonic()
+
+        if self.__upload_threads <= 1:
+            upload(*args)
+            return
+
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=self.__upload_threads,
+                thread_name_prefix='testit-bulk-upload')
+
+        self.__futures.append(self.__executor.submit(upload, *args))
+
+    def __wait_for_uploads(self):
+        if self.__executor is None:
+            return
+
+        futures = self.__futures
+        self.__futures = []
+
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+
+    def __log_upload_statistics(self):
+        statistics = self.get_upload_statistics()
+
+        logging.info(
+            'Bulk upload finished: autotests=%d (unchanged=%d), results=%d in %.2f s (%.1f results/s, threads=%d)',
+            statistics['autotests'],
+            statistics['skipped_autotests'],
+            statistics['results'],
+            statistics['seconds'],
+            statistics['results_per_second'],
+            self.__upload_threads,
+        )
 
     @adapter_logger
     def __bulk_create(
@@ -148,9 +270,7 @@ class BulkAutotestHelper:
     ):
         self.__update_tests(list(thread_for_update.values()))
         self.__load_test_results(thread_results_for_updated_autotests)
-
-        for autotest_id, work_item_ids in thread_for_autotest_links_to_wi_for_update.items():
-            self.__update_autotest_link_from_work_items(autotest_id, work_item_ids)
+        self.__work_item_linker.update_links(thread_for_autotest_links_to_wi_for_update)
 
     @adapter_logger
     def __create_tests(self, autotests_for_create: List[AutoTestCreateApiModel]):
@@ -159,6 +279,9 @@ class BulkAutotestHelper:
         autotests_for_create = HtmlEscapeUtils.escape_html_in_object(autotests_for_create)
         self.__autotests_api.adapters_auto_tests_bulk_post(auto_test_create_api_model=autotests_for_create)
 
+        with self.__statistics_lock:
+            self.__uploaded_autotests += len(autotests_for_create)
+
         logging.debug(f'Autotests were created')
 
     @adapter_logger
@@ -168,6 +291,9 @@ class BulkAutotestHelper:
         autotests_for_update = HtmlEscapeUtils.escape_html_in_object(autotests_for_update)
         self.__autotests_api.adapters_auto_tests_bulk_put(auto_test_update_api_model=autotests_for_update)
 
+        with self.__statistics_lock:
+            self.__uploaded_autotests += len(autotests_for_update)
+
         logging.debug(f'Autotests were updated')
 
     @adapter_logger
@@ -179,69 +305,8 @@ class BulkAutotestHelper:
             id=self.__test_run_id,
             auto_test_results_for_test_run_model=test_results)
 
-    # TODO: delete after fix PUT/api/v2/autoTests
-    @adapter_logger
-    def __get_work_items_linked_to_autotest(self, autotest_global_id: str) -> List[AutoTestWorkItemIdentifierApiResult]:
-        return self.__autotests_api.adapters_auto_tests_id_work_items_get(id=autotest_global_id)
-
-    # TODO: delete after fix PUT/api/v2/autoTests
-    @adapter_logger
-    @retry
-    def __unlink_test_to_work_item(self, autotest_global_id: str, work_item_id: str):
-        try:
-            self.__autotests_api.adapters_auto_tests_id_work_items_delete(
-                id=autotest_global_id,
-                work_item_id=work_item_id)
-        except adapters_api.exceptions.ApiException as exc:
-            if is_non_retriable_api_exception(exc):
-                logging.warning(
-                    'Cannot unlink autotest %s from work item %s: %s',
-                    autotest_global_id,
-                    work_item_id,
-                    exc,
-                )
-                return
-            raise
-
-        logging.debug(f'Autotest was unlinked with workItem "{work_item_id}" by global id "{autotest_global_id}')
-
-    # TODO: delete after fix PUT/api/v2/autoTests
-    @adapter_logger
-    @retry
-    def __link_test_to_work_item(self, autotest_global_id: str, work_item_id: str):
-        try:
-            self.__autotests_api.adapters_auto_tests_id_work_items_post(
-                id=autotest_global_id,
-                adapters_auto_tests_id_work_items_post_request=AdaptersAutoTestsIdWorkItemsPostRequest(
-                    id=work_item_id))
-        except adapters_api.exceptions.ApiException as exc:
-            if is_non_retriable_api_exception(exc):
-                logging.warning(
-                    'Cannot link autotest %s to work item %s: %s',
-                    autotest_global_id,
-                    work_item_id,
-                    exc,
-                )
-                return
-            raise
-
-        logging.debug(f'Autotest was linked with workItem "{work_item_id}" by global id "{autotest_global_id}')
-
-    # TODO: delete after fix PUT/api/v2/autoTests
-    @adapter_logger
-    def __update_autotest_link_from_work_items(self, autotest_global_id: str, work_item_ids: list):
-        linked_work_items = self.__get_work_items_linked_to_autotest(autotest_global_id)
-
-        for linked_work_item in linked_work_items:
-            linked_work_item_id = str(linked_work_item.global_id)
-
-            if linked_work_item_id in work_item_ids:
-                work_item_ids.remove(linked_work_item_id)
-
-                continue
-
-            if self.__automatic_updation_links_to_test_cases:
-                self.__unlink_test_to_work_item(autotest_global_id, linked_work_item_id)
+        with self.__statistics_lock:
+            self.__uploaded_results += len(test_results)
 
-        for work_item_id in work_item_ids:
-            self.__link_test_to_work_item(autotest_global_id, work_item_id)
+        if self.__on_results_sent:
+            self.__on_results_sent(test_results)
@@ -0,0 +1,91 @@
+"""Local index of InProgress test results keyed by autotest external id (mode 0)."""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from testit_python_commons.client.helpers.test_result_matching import pick_best_in_progress_id
+
+
+class InProgressTestResultIndex:
+    def __init__(
+            self,
+            load_test_results: Callable[[], Iterable],
+            describe_test_result: Callable[[str], dict],
+            refresh_interval_sec: float = 30):
+        self.__load_test_results = load_test_results
+        self.__describe_test_result = describe_test_result
+        self.__refresh_interval_sec = refresh_interval_sec
+        self.__candidates: Optional[Dict[str, Dict[str, dict]]] = None
+        self.__known_ids = set()
+        self.__refreshed_at = 0.0
+        self.__lock = threading.Lock()
+
+    def claim(self, external_id: str, parameters=None) -> Optional[str]:
+        """Takes the best InProgress result for the external id out of the index.
+
+        Candidates are described on first use, outside the lock; those that are no longer
+        InProgress, e.g. set by another adapter process, are dropped.
+        """
+        with self.__lock:
+            if self.__should_refresh(external_id):
+                self.__refresh()
+
+        while True:
+            with self.__lock:
+                candidates = self.__candidates.get(external_id)
+                if not candidates:
+                    return None
+
+                undescribed = [result_id for result_id, candidate in candidates.items()
+                               if "has_test_point" not in candidate]
+                if not undescribed:
+                    chosen = pick_best_in_progress_id(list(candidates.values()), parameters)
+                    if chosen:
+                        candidates.pop(chosen)
+
+                    return chosen
+
+            descriptions = {result_id: self.__describe_test_result(result_id) for result_id in undescribed}
+
+            with self.__lock:
+                for result_id, description in descriptions.items():
+                    candidate = candidates.get(result_id)
+                    if candidate is None:
+                        continue
+                    if description.get("in_progress") is False:
+                        candidates.pop(result_id)
+                        continue
+                    candidate.update(description)
+
+    def __should_refresh(self, external_id: str) -> bool:
+        if self.__candidates is None:
+            return True
+
+        if self.__candidates.get(external_id):
+            return False
+
+        return time.monotonic() - self.__refreshed_at >= self.__refresh_interval_sec
+
+    def __refresh(self) -> None:
+        if self.__candidates is None:
+            self.__candidates = {}
+
+        added = 0
+        for item in self.__load_test_results():
+            if item is None:
+                continue
+            external_id = getattr(item, "autotest_external_id", None)
+            result_id = getattr(item, "id", None)
+            if not external_id or result_id is None:
+                continue
+            result_id = str(result_id)
+            if result_id in self.__known_ids:
+                continue
+
+            self.__known_ids.add(result_id)
+            self.__candidates.setdefault(external_id, {})[result_id] = {"id": result_id}
+            added += 1
+
+        self.__refreshed_at = time.monotonic()
+        logging.debug("InProgress index refreshed: %d new test results", added)
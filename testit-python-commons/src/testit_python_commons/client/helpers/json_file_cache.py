@@ -0,0 +1,59 @@
+import json
+import logging
+import os
+import tempfile
+import time
+
+
+class JsonFileCache:
+    """JSON object in a file of the cache directory shared by adapter processes.
+
+    The file is replaced atomically on write, so concurrent workers never read a partial file.
+    A missing or corrupt file reads as an empty object.
+    """
+    __default_cache_dir = os.path.join('build', '.caches')
+
+    def __init__(self, file_name: str, description: str, cache_dir: str = None):
+        self.__description = description
+        self.__path = os.path.join(
+            os.path.abspath(cache_dir or self.__default_cache_dir),
+            file_name)
+
+    @staticmethod
+    def is_fresh(saved_at, ttl_sec: int) -> bool:
+        return isinstance(saved_at, (int, float)) and time.time() - saved_at <= ttl_sec
+
+    def get_path(self) -> str:
+        return self.__path
+
+    def read(self) -> dict:
+        try:
+            with open(self.__path, 'r', encoding='utf-8') as file:
+                entries = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logging.debug(f'Cannot read {self.__description} cache "{self.__path}": {exc}')
+            return {}
+
+        return entries if isinstance(entries, dict) else {}
+
+    def write(self, entries: dict) -> None:
+        tmp_path = None
+
+        try:
+            cache_dir = os.path.dirname(self.__path)
+            os.makedirs(cache_dir, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_dir, prefix=f'.{os.path.splitext(os.path.basename(self.__path))[0]}_', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(entries, file)
+            os.replace(tmp_path, self.__path)
+        except (OSError, TypeError, ValueError) as exc:
+            logging.debug(f'Cannot write {self.__description} cache "{self.__path}": {exc}')
+            if tmp_path:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
@@ -0,0 +1,74 @@
+from typing import Dict, FrozenSet, Tuple, Type, TypeVar
+
+from adapters_api.exceptions import ApiAttributeError
+from adapters_api.model_utils import ModelNormal, ModelSimple, check_allowed_values, check_validations
+
+ModelT = TypeVar('ModelT', bound=ModelNormal)
+SimpleT = TypeVar('SimpleT', bound=ModelSimple)
+
+
+class ModelBuilder:
+    """Builds outbound generated models from values the converter has already typed.
+
+    Construction through the model constructor runs validate_and_convert_types for every field,
+    which dominates the cost of converting large step trees. Here the fields are stored as given;
+    allowed values and schema validations (lengths, ranges) are still checked. Models built this
+    way type-check later assignments like any other model.
+    """
+    # Per-class (known field names, fields with allowed values or validations)
+    _model_plans: Dict[type, Tuple[FrozenSet[str], Tuple[str, ...]]] = {}
+    _simple_models: Dict[tuple, ModelSimple] = {}
+
+    @classmethod
+    def build(cls, model_class: Type[ModelT], **fields) -> ModelT:
+        known_fields, checked_fields = cls.__get_model_plan(model_class)
+
+        for name in fields:
+            if name not in known_fields:
+                raise ApiAttributeError(f"{model_class.__name__} has no attribute '{name}'", [name])
+
+        for name in checked_fields:
+            if name in fields:
+                cls.__check_field(model_class, name, fields[name])
+
+        model = object.__new__(model_class)
+        model.__dict__.update(
+            _data_store=fields,
+            _check_type=True,
+            _spec_property_naming=False,
+            _path_to_item=(),
+            _configuration=None,
+            _visited_composed_classes=(model_class,))
+
+        return model
+
+    @classmethod
+    def simple(cls, model_class: Type[SimpleT], value) -> SimpleT:
+        """Returns an enum-like model for the value; instances are validated once and shared."""
+        key = (model_class, value)
+        model = cls._simple_models.get(key)
+
+        if model is None:
+            model = model_class(value)
+            cls._simple_models[key] = model
+
+        return model
+
+    @classmethod
+    def __get_model_plan(cls, model_class: type) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+        plan = cls._model_plans.get(model_class)
+
+        if plan is None:
+            checked_fields = {name for (name,) in model_class.allowed_values}
+            checked_fields.update(name for (name,) in model_class.validations)
+            plan = (frozenset(model_class.openapi_types), tuple(sorted(checked_fields)))
+            cls._model_plans[model_class] = plan
+
+        return plan
+
+    @staticmethod
+    def __check_field(model_class: type, name: str, value) -> None:
+        if (name,) in model_class.allowed_values:
+            check_allowed_values(model_class.allowed_values, (name,), value)
+        if (name,) in model_class.validations:
+            check_validations(model_class.validations, (name,), value, None)
@@ -0,0 +1,82 @@
+import io
+import mimetypes
+import os
+import uuid
+from typing import BinaryIO, List, Optional, Union
+
+
+class MultipartFileBody(io.RawIOBase):
+    """Read-only multipart/form-data body with one file field.
+
+    The file content is read from the wrapped buffer or stream in chunks while the request is sent,
+    so the payload is never copied as a whole.
+    """
+
+    def __init__(self, field_name: str, file_name: str, content: Union[bytes, bytearray, memoryview, BinaryIO]):
+        super().__init__()
+        boundary = uuid.uuid4().hex
+        mimetype = mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+        head = (
+            f'--{boundary}\r\n'
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{_quote(file_name)}"\r\n'
+            f'Content-Type: {mimetype}\r\n\r\n').encode('utf-8')
+        tail = f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        self.content_length: Optional[int] = None
+        self.__parts: List[Union[memoryview, BinaryIO]] = [memoryview(head), None, memoryview(tail)]
+
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            content = memoryview(content).cast('B')
+            self.content_length = len(head) + content.nbytes + len(tail)
+        else:
+            content_size = _get_remaining_size(content)
+            if content_size is not None:
+                self.content_length = len(head) + content_size + len(tail)
+
+        self.__parts[1] = content
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        target = memoryview(buffer).cast('B')
+
+        while self.__parts:
+            part = self.__parts[0]
+
+            if isinstance(part, memoryview):
+                size = min(len(part), len(target))
+                target[:size] = part[:size]
+                if size == len(part):
+                    self.__parts.pop(0)
+                else:
+                    self.__parts[0] = part[size:]
+                if size:
+                    return size
+                continue
+
+            data = part.read(len(target))
+            if data:
+                target[:len(data)] = data
+                return len(data)
+
+            self.__parts.pop(0)
+
+        return 0
+
+
+def _get_remaining_size(stream: BinaryIO) -> Optional[int]:
+    try:
+        if not stream.seekable():
+            return None
+        position = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _quote(file_name: str) -> str:
+    return file_name.replace('\\', '\\\\').replace('"', '\\"').replace('\r', ' ').replace('\n', ' ')
@@ -0,0 +1,43 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List
+
+
+def iterate_pages(
+        load_page: Callable[[int, int], List],
+        page_size: int,
+        prefetch: bool = True,
+        short_page_is_last: bool = True) -> Iterator[List]:
+    """Yields pages loaded with load_page(skip, take) until a page is empty.
+
+    skip advances by the number of items received, so a server that caps take does not make the
+    iteration miss items. With short_page_is_last, a page shorter than page_size ends the iteration
+    without a request for an empty page; use it only for page sizes the server returns in full.
+
+    With prefetch, the next page is requested in a background thread while the caller processes
+    the current one.
+    """
+    page = load_page(0, page_size)
+    skip = 0
+    executor = None
+
+    try:
+        while page and not (short_page_is_last and len(page) < page_size):
+            skip += len(page)
+
+            if not prefetch:
+                yield page
+                page = load_page(skip, page_size)
+                continue
+
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='testit-paginator')
+
+            next_page = executor.submit(load_page, skip, page_size)
+            yield page
+            page = next_page.result()
+
+        if page:
+            yield page
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,45 @@
+import logging
+import time
+from typing import List, Optional
+
+from testit_python_commons.client.helpers.json_file_cache import JsonFileCache
+
+
+class StatusCodesCache:
+    """On-disk cache of project workflow status codes shared by adapter processes."""
+    __file_name = 'testit_status_codes.json'
+
+    def __init__(self, url: str, project_id: str, ttl_sec: int, cache_dir: str = None):
+        self.__key = f'{url}|{project_id}'
+        self.__ttl_sec = ttl_sec
+        self.__file = JsonFileCache(self.__file_name, 'status codes', cache_dir)
+
+    def is_enabled(self) -> bool:
+        return self.__ttl_sec > 0
+
+    def get(self) -> Optional[List[str]]:
+        if not self.is_enabled():
+            return None
+
+        entry = self.__file.read().get(self.__key)
+        if not isinstance(entry, dict):
+            return None
+
+        if not JsonFileCache.is_fresh(entry.get('saved_at'), self.__ttl_sec):
+            logging.debug(f'Cached status codes for "{self.__key}" are expired')
+            return None
+
+        return entry.get('status_codes')
+
+    def set(self, status_codes: List[str]) -> None:
+        if not self.is_enabled():
+            return
+
+        entries = self.__file.read()
+        entries[self.__key] = {'saved_at': time.time(), 'status_codes': list(status_codes)}
+        self.__file.write(entries)
+
+    def invalidate(self) -> None:
+        entries = self.__file.read()
+        if entries.pop(self.__key, None) is not None:
+            self.__file.write(entries)
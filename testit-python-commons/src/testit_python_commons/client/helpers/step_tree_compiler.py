@@ -0,0 +1,48 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+from testit_python_commons.models.step_result import StepResult
+
+
+class StepTreeCompiler:
+    """Converts StepResult trees to API models bottom-up, with an explicit stack instead of recursion.
+
+    Every target representation of a step is built in the same pass, and every step is converted
+    only once per compiler, so fixture steps shared by many test results are converted once.
+    Converted models are shared between those results: a compiler is meant to live for one upload.
+
+    :param builders: target name -> build(step_result, converted_children) of that target
+    """
+
+    def __init__(self, builders: Dict[str, Callable[[StepResult, list], Any]]):
+        self.__builders = builders
+        # id(step_result) -> (step_result, {target: model}); the step is kept so its id cannot be reused
+        self.__memo: Dict[int, Tuple[StepResult, Dict[str, Any]]] = {}
+
+    def compile(self, step_results: List[StepResult]) -> Dict[str, list]:
+        memo = self.__memo
+        stack = [(step_result, False) for step_result in reversed(step_results or [])]
+
+        while stack:
+            step_result, children_converted = stack.pop()
+            if id(step_result) in memo:
+                continue
+
+            children = step_result.get_step_results() or []
+
+            if not children_converted:
+                stack.append((step_result, True))
+                stack.extend((child, False) for child in reversed(children) if id(child) not in memo)
+                continue
+
+            converted_children = [memo[id(child)][1] for child in children]
+            memo[id(step_result)] = (step_result, {
+                target: build(step_result, [converted[target] for converted in converted_children])
+                for target, build in self.__builders.items()
+            })
+
+        converted_steps = [memo[id(step_result)][1] for step_result in step_results or []]
+
+        return {
+            target: [converted[target] for converted in converted_steps]
+            for target in self.__builders
+        }
@@ -0,0 +1,127 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import adapters_api
+from adapters_api.apis import AutoTestsApi
+from adapters_api.models import (
+    AdaptersAutoTestsIdWorkItemsPostRequest,
+    AutoTestWorkItemIdentifierApiResult,
+)
+
+from testit_python_commons.services.retry import (
+    is_non_retriable_api_exception,
+    retry,
+    retry_on_connection_error,
+)
+
+
+class WorkItemLinker:
+    """Reconciles links between autotests and work items.
+
+    Link diffs are computed for a whole batch of autotests first, then link and unlink requests
+    are sent through a bounded pool.
+    """
+
+    def __init__(
+            self,
+            autotests_api: AutoTestsApi,
+            automatic_updation_links_to_test_cases: bool = False,
+            threads: int = 1):
+        self.__autotests_api = autotests_api
+        self.__automatic_updation_links_to_test_cases = automatic_updation_links_to_test_cases
+        self.__threads = max(1, threads)
+
+    def update_links(self, work_item_ids_by_autotest: Dict[str, List[str]]) -> None:
+        autotest_ids = list(work_item_ids_by_autotest.keys())
+        if not autotest_ids:
+            return
+
+        linked_work_items = self.__map(self.get_linked_work_items, autotest_ids)
+        changes = []
+
+        for autotest_id, linked in zip(autotest_ids, linked_work_items):
+            changes.extend(self.__get_link_changes(autotest_id, work_item_ids_by_autotest[autotest_id], linked))
+
+        if changes:
+            logging.debug(f'Sending {len(changes)} work item link changes for {len(autotest_ids)} autotests')
+            self.__map(lambda change: change[0](change[1], change[2]), changes)
+
+    @retry_on_connection_error
+    def get_linked_work_items(self, autotest_global_id: str) -> List[AutoTestWorkItemIdentifierApiResult]:
+        return self.__autotests_api.adapters_auto_tests_id_work_items_get(id=autotest_global_id)
+
+    def __get_link_changes(
+            self,
+            autotest_global_id: str,
+            work_item_ids: List[str],
+            linked_work_items: List[AutoTestWorkItemIdentifierApiResult]) -> List[Tuple[Callable, str, str]]:
+        # Work item IDs may repeat; order is kept so the requests go out as before
+        work_item_ids = list(dict.fromkeys(str(work_item_id) for work_item_id in work_item_ids or []))
+        changes = []
+
+        for linked_work_item in linked_work_items:
+            linked_work_item_id = str(linked_work_item.global_id)
+
+            if linked_work_item_id in work_item_ids:
+                work_item_ids.remove(linked_work_item_id)
+
+                continue
+
+            if self.__automatic_updation_links_to_test_cases:
+                changes.append((self.__unlink_test_to_work_item, autotest_global_id, linked_work_item_id))
+
+        for work_item_id in work_item_ids:
+            changes.append((self.__link_test_to_work_item, autotest_global_id, work_item_id))
+
+        return changes
+
+    def __map(self, func: Callable, items: Iterable) -> list:
+        items = list(items)
+
+        if self.__threads <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(
+                max_workers=min(self.__threads, len(items)),
+                thread_name_prefix='testit-work-item-links') as executor:
+            return list(executor.map(func, items))
+
+    @retry
+    def __unlink_test_to_work_item(self, autotest_global_id: str, work_item_id: str) -> None:
+        try:
+            self.__autotests_api.adapters_auto_tests_id_work_items_delete(
+                id=autotest_global_id,
+                work_item_id=work_item_id)
+        except adapters_api.exceptions.ApiException as exc:
+            if is_non_retriable_api_exception(exc):
+                logging.warning(
+                    'Cannot unlink autotest %s from work item %s: %s',
+                    autotest_global_id,
+                    work_item_id,
+                    exc,
+                )
+                return
+            raise
+
+        logging.debug(f'Autotest was unlinked with workItem "{work_item_id}" by global id "{autotest_global_id}')
+
+    @retry
+    def __link_test_to_work_item(self, autotest_global_id: str, work_item_id: str) -> None:
+        try:
+            self.__autotests_api.adapters_auto_tests_id_work_items_post(
+                id=autotest_global_id,
+                adapters_auto_tests_id_work_items_post_request=AdaptersAutoTestsIdWorkItemsPostRequest(
+                    id=work_item_id))
+        except adapters_api.exceptions.ApiException as exc:
+            if is_non_retriable_api_exception(exc):
+                logging.warning(
+                    'Cannot link autotest %s to work item %s: %s',
+                    autotest_global_id,
+                    work_item_id,
+                    exc,
+                )
+                return
+            raise
+
+        logging.debug(f'Autotest was linked with workItem "{work_item_id}" by global id "{autotest_global_id}')
@@ -15,8 +15,25 @@ class PropertiesNames:
     AUTOMATIC_CREATION_TEST_CASES = 'automaticcreationtestcases'
     AUTOMATIC_UPDATION_LINKS_TO_TEST_CASES = 'automaticupdationlinkstotestcases'
     IMPORT_REALTIME = 'importrealtime'
+    IMPORT_REALTIME_ASYNC = 'importrealtimeasync'
     SYNC_STORAGE_PORT = 'syncstorageport'
     LEGACY_WORKFLOW = 'legacyworkflow'
+    UPLOAD_THREADS = 'uploadthreads'
+    STATUS_CODES_CACHE_TTL = 'statuscodescachettl'
+    AUTOTEST_FINGERPRINT_TTL = 'autotestfingerprintttl'
+    CONNECTION_POOL_SIZE = 'connectionpoolsize'
+    CONNECT_TIMEOUT = 'connecttimeout'
+    READ_TIMEOUT = 'readtimeout'
+    TCP_KEEP_ALIVE = 'tcpkeepalive'
+    HTTP_COMPRESSION = 'httpcompression'
+    REQUEST_COMPRESSION_THRESHOLD = 'requestcompressionthreshold'
+    RESULTS_JOURNAL = 'resultsjournal'
+    OFFLINE_EXPORT_DIR = 'offlineexportdir'
+    TEST_RESULTS_PAGE_SIZE = 'testresultspagesize'
+    RETRY_MAX_ATTEMPTS = 'retrymaxattempts'
+    RETRY_BUDGET = 'retrybudget'
+    REQUEST_METRICS = 'requestmetrics'
+    REQUEST_METRICS_FILE = 'requestmetricsfile'
 
 ENV_TO_PROPERTY = {
     'TMS_URL': PropertiesNames.URL,
@@ -33,8 +50,25 @@ ENV_TO_PROPERTY = {
     'TMS_AUTOMATIC_CREATION_TEST_CASES': PropertiesNames.AUTOMATIC_CREATION_TEST_CASES,
     'TMS_AUTOMATIC_UPDATION_LINKS_TO_TEST_CASES': PropertiesNames.AUTOMATIC_UPDATION_LINKS_TO_TEST_CASES,
     'TMS_IMPORT_REALTIME': PropertiesNames.IMPORT_REALTIME,
+    'TMS_IMPORT_REALTIME_ASYNC': PropertiesNames.IMPORT_REALTIME_ASYNC,
     'TMS_SYNC_STORAGE_PORT': PropertiesNames.SYNC_STORAGE_PORT,
     'TMS_LEGACY_WORKFLOW': PropertiesNames.LEGACY_WORKFLOW,
+    'TMS_UPLOAD_THREADS': PropertiesNames.UPLOAD_THREADS,
+    'TMS_STATUS_CODES_CACHE_TTL': PropertiesNames.STATUS_CODES_CACHE_TTL,
+    'TMS_AUTOTEST_FINGERPRINT_TTL': PropertiesNames.AUTOTEST_FINGERPRINT_TTL,
+    'TMS_CONNECTION_POOL_SIZE': PropertiesNames.CONNECTION_POOL_SIZE,
+    'TMS_CONNECT_TIMEOUT': PropertiesNames.CONNECT_TIMEOUT,
+    'TMS_READ_TIMEOUT': PropertiesNames.READ_TIMEOUT,
+    'TMS_TCP_KEEP_ALIVE': PropertiesNames.TCP_KEEP_ALIVE,
+    'TMS_HTTP_COMPRESSION': PropertiesNames.HTTP_COMPRESSION,
+    'TMS_REQUEST_COMPRESSION_THRESHOLD': PropertiesNames.REQUEST_COMPRESSION_THRESHOLD,
+    'TMS_RESULTS_JOURNAL': PropertiesNames.RESULTS_JOURNAL,
+    'TMS_OFFLINE_EXPORT_DIR': PropertiesNames.OFFLINE_EXPORT_DIR,
+    'TMS_TEST_RESULTS_PAGE_SIZE': PropertiesNames.TEST_RESULTS_PAGE_SIZE,
+    'TMS_RETRY_MAX_ATTEMPTS': PropertiesNames.RETRY_MAX_ATTEMPTS,
+    'TMS_RETRY_BUDGET': PropertiesNames.RETRY_BUDGET,
+    'TMS_REQUEST_METRICS': PropertiesNames.REQUEST_METRICS,
+    'TMS_REQUEST_METRICS_FILE': PropertiesNames.REQUEST_METRICS_FILE,
 }
 
 OPTION_TO_PROPERTY = {
@@ -52,6 +86,23 @@ OPTION_TO_PROPERTY = {
     'set_automatic_creation_test_cases': PropertiesNames.AUTOMATIC_CREATION_TEST_CASES,
     'set_automatic_updation_links_to_test_cases': PropertiesNames.AUTOMATIC_UPDATION_LINKS_TO_TEST_CASES,
     'set_import_realtime': PropertiesNames.IMPORT_REALTIME,
+    'set_import_realtime_async': PropertiesNames.IMPORT_REALTIME_ASYNC,
     'set_sync_storage_port': PropertiesNames.SYNC_STORAGE_PORT,
     'set_legacy_workflow': PropertiesNames.LEGACY_WORKFLOW,
+    'set_upload_threads': PropertiesNames.UPLOAD_THREADS,
+    'set_status_codes_cache_ttl': PropertiesNames.STATUS_CODES_CACHE_TTL,
+    'set_autotest_fingerprint_ttl': PropertiesNames.AUTOTEST_FINGERPRINT_TTL,
+    'set_connection_pool_size': PropertiesNames.CONNECTION_POOL_SIZE,
+    'set_connect_timeout': PropertiesNames.CONNECT_TIMEOUT,
+    'set_read_timeout': PropertiesNames.READ_TIMEOUT,
+    'set_tcp_keep_alive': PropertiesNames.TCP_KEEP_ALIVE,
+    'set_http_compression': PropertiesNames.HTTP_COMPRESSION,
+    'set_request_compression_threshold': PropertiesNames.REQUEST_COMPRESSION_THRESHOLD,
+    'set_results_journal': PropertiesNames.RESULTS_JOURNAL,
+    'set_offline_export_dir': PropertiesNames.OFFLINE_EXPORT_DIR,
+    'set_test_results_page_size': PropertiesNames.TEST_RESULTS_PAGE_SIZE,
+    'set_retry_max_attempts': PropertiesNames.RETRY_MAX_ATTEMPTS,
+    'set_retry_budget': PropertiesNames.RETRY_BUDGET,
+    'set_request_metrics': PropertiesNames.REQUEST_METRICS,
+    'set_request_metrics_file': PropertiesNames.REQUEST_METRICS_FILE,
 }
\ No newline at end of file
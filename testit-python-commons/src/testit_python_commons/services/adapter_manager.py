@@ -1,6 +1,9 @@
+import itertools
 import logging
 import os
+import threading
 import uuid
+from typing import Iterable, List
 
 from testit_python_commons.client.api_client import ApiClientWorker
 from testit_python_commons.client.client_configuration import ClientConfiguration
@@ -10,7 +13,13 @@ from testit_python_commons.services.adapter_manager_configuration import (
     AdapterManagerConfiguration,
 )
 from testit_python_commons.services.fixture_manager import FixtureManager
+from testit_python_commons.services.fixture_storage import FixturesContainersIndex
 from testit_python_commons.services.logger import adapter_logger
+from testit_python_commons.services.offline_results import OfflineResultsWriter
+from testit_python_commons.services.realtime_uploader import RealtimeUploader
+from testit_python_commons.services.result_journal import ResultJournal
+from testit_python_commons.services.request_metrics import get_request_metrics
+from testit_python_commons.services.retry import get_retry_policy
 from testit_python_commons.services.utils import Utils
 
 from testit_python_commons.services.sync_storage.sync_storage_runner import (
@@ -21,6 +30,9 @@ SYNC_STORAGE_AVAILABLE = True
 
 
 class AdapterManager:
+    __results_journal_chunk_size = 500
+    __offline_fallback_dir = os.path.join('build', '.caches', 'testit_offline')
+
     def __init__(
         self,
         adapter_configuration: AdapterManagerConfiguration,
@@ -35,12 +47,23 @@ class AdapterManager:
         self.__test_result_map = {}
         self.__test_results = []
         self.__test_run_metadata_applied = False
+        self.__realtime_uploader = None
+        self.__results_journal = None
+        self.__offline_results_writer = None
+        # Set when results are saved offline because Test IT stopped responding during the session
+        self.__offline_fallback = False
+        self.__offline_results_writer_lock = threading.Lock()
+
+        if adapter_configuration.should_export_results_offline() is True:
+            self.__offline_results_writer = OfflineResultsWriter(adapter_configuration.get_offline_export_dir())
+            logging.info(f'Offline export is enabled, results are saved to '
+                         f'"{self.__offline_results_writer.get_directory()}"')
 
         # Sync Storage integration
         self.__sync_storage_runner = None
         legacy_workflow_enabled = client_configuration.is_legacy_workflow() is True
-        # Initialize Sync Storage if available and enabled
-        if SYNC_STORAGE_AVAILABLE and not legacy_workflow_enabled:
+        # Initialize Sync Storage if available and enabled (it needs a connection to Test IT)
+        if SYNC_STORAGE_AVAILABLE and not legacy_workflow_enabled and not self.__offline_results_writer:
             self.__sync_storage_runner = self._initialize_sync_storage(
                 client_configuration
             )
@@ -97,12 +120,19 @@ class AdapterManager:
             self.__sync_storage_runner.test_run_id = test_run_id
             return
 
+        if self.__offline_results_writer:
+            return
+
         if SYNC_STORAGE_AVAILABLE and not self.__client_config.is_legacy_workflow():
             self.__sync_storage_runner = self._start_sync_storage(
                 test_run_id, self.__client_config)
 
     @adapter_logger
     def get_test_run_id(self) -> str:
+        if self.__offline_results_writer:
+            # The test run is created (if needed) when the exported results are uploaded
+            return self.__config.get_test_run_id() or ""
+
         if self.__config.get_mode() != AdapterMode.NEW_TEST_RUN:
             test_run_id = self.__config.get_test_run_id()
 
@@ -139,6 +169,11 @@ class AdapterManager:
 
     @adapter_logger
     def get_autotests_for_launch(self):
+        if self.__offline_results_writer:
+            if self.__config.get_mode() == AdapterMode.USE_FILTER:
+                logging.warning('Offline export cannot filter tests by test run, all tests will be run')
+            return
+
         if self.__config.get_mode() == AdapterMode.USE_FILTER:
             return self.__api_client.get_external_ids_for_test_run_id()
 
@@ -146,6 +181,11 @@ class AdapterManager:
 
     @adapter_logger
     def write_test(self, test_result: TestResult) -> None:
+        offline_results_writer = self.__get_offline_results_writer()
+        if offline_results_writer:
+            offline_results_writer.write_test(test_result)
+            return
+
         if self.__config.should_import_realtime():
             self.__write_test_realtime(test_result)
             return
@@ -162,6 +202,11 @@ class AdapterManager:
                 return
             # else continue normal processing
 
+        results_journal = self.__get_results_journal()
+        if results_journal:
+            results_journal.append(test_result)
+            return
+
         self.__test_results.append(test_result)
 
 
@@ -219,8 +264,48 @@ class AdapterManager:
             # else continue normal processing
 
         # Normal processing (also fallback for Sync Storage errors)
+        realtime_uploader = self.__get_realtime_uploader()
+        if realtime_uploader:
+            realtime_uploader.submit(test_result)
+            return
+
         self._write_test_realtime_internal(test_result)
 
+    def __get_realtime_uploader(self):
+        if self.__config.should_import_realtime_async() is not True:
+            return None
+
+        if self.__realtime_uploader is None:
+            self.__realtime_uploader = RealtimeUploader(
+                self._write_test_realtime_internal,
+                workers=self.__client_config.get_upload_threads())
+
+        return self.__realtime_uploader
+
+    def __get_offline_results_writer(self):
+        if self.__offline_results_writer or not get_retry_policy().is_open():
+            return self.__offline_results_writer
+
+        with self.__offline_results_writer_lock:
+            if not self.__offline_results_writer:
+                self.__offline_results_writer = OfflineResultsWriter(
+                    os.path.join(self.__offline_fallback_dir, str(uuid.uuid4())))
+                self.__offline_fallback = True
+                logging.warning(
+                    f'Test IT does not respond, the remaining results are saved to '
+                    f'"{self.__offline_results_writer.get_directory()}"')
+
+        return self.__offline_results_writer
+
+    def __get_results_journal(self):
+        if self.__config.should_use_results_journal() is not True:
+            return None
+
+        if self.__results_journal is None:
+            self.__results_journal = ResultJournal()
+
+        return self.__results_journal
+
     def _write_test_realtime_internal(self, test_result: TestResult) -> None:
         """Internal method for writing test results to maintain clean separation."""
         test_result.set_automatic_creation_test_cases(
@@ -228,7 +313,18 @@ class AdapterManager:
         )
 
         ext_id = test_result.get_external_id()
-        test_result_id = self.__api_client.write_test(test_result)
+
+        try:
+            test_result_id = self.__api_client.write_test(test_result)
+        except Exception as exc:
+            offline_results_writer = self.__get_offline_results_writer()
+            if not offline_results_writer:
+                raise
+
+            logging.warning(f'Test result of "{ext_id}" was not sent and is saved offline: {exc}')
+            offline_results_writer.write_test(test_result)
+            return
+
         if ext_id is None or test_result_id is None:
             logging.warning("test_result got empty external_id or test_result_id")
             logging.warning(test_result)
@@ -238,12 +334,57 @@ class AdapterManager:
 
     @adapter_logger
     def write_tests(self) -> None:
-        if self.__config.should_import_realtime():
-            self.__load_setup_and_teardown_step_results()
+        if self.__offline_results_writer and not self.__offline_fallback:
+            self.__offline_results_writer.finish(
+                self.__fixture_manager.get_all_items(),
+                self.__config.get_test_run_id())
+            return
+
+        try:
+            if self.__config.should_import_realtime():
+                if self.__realtime_uploader:
+                    self.__realtime_uploader.shutdown()
+
+                if not self.__get_offline_results_writer():
+                    self.__load_setup_and_teardown_step_results()
+            elif self.__get_offline_results_writer():
+                self.__write_pending_test_results_offline()
+            else:
+                self.__write_tests_after_all()
+
+            if self.__offline_results_writer:
+                self.__offline_results_writer.finish(
+                    self.__fixture_manager.get_all_items(),
+                    self.__config.get_test_run_id())
+        finally:
+            self.__log_retry_statistics()
+            if get_request_metrics():
+                get_request_metrics().report()
+
+    def __write_pending_test_results_offline(self) -> None:
+        self.__write_test_results_offline([self.__test_results])
+        self.__test_results = []
+
+        if self.__results_journal:
+            self.__write_test_results_offline(
+                self.__results_journal.read_chunks(self.__results_journal_chunk_size))
+            self.__results_journal.remove()
 
+    def __write_test_results_offline(self, chunks: Iterable[List[TestResult]]) -> None:
+        for test_results in chunks:
+            for test_result in test_results:
+                self.__offline_results_writer.write_test(test_result)
+
+    @staticmethod
+    def __log_retry_statistics() -> None:
+        statistics = get_retry_policy().get_statistics()
+        if not statistics['retries'] and not statistics['circuit_open']:
             return
 
-        self.__write_tests_after_all()
+        logging.info(
+            f'Requests to Test IT were retried {statistics["retries"]} times: '
+            f'{statistics["retry_sleep_sec"]} s waiting between retries, '
+            f'{statistics["failed_attempts_sec"]} s in failed attempts')
 
     @adapter_logger
     def __load_setup_and_teardown_step_results(self) -> None:
@@ -251,22 +392,81 @@ class AdapterManager:
         if not fixtures:
             return
 
-        self.__api_client.update_test_results(fixtures, self.__test_result_map)
+        self.__api_client.update_test_results(
+            self.__fixture_manager.get_containers_index(), self.__test_result_map)
 
     @adapter_logger
     def __write_tests_after_all(self) -> None:
 
-        fixtures = self.__fixture_manager.get_all_items()
+        fixtures = self.__fixture_manager.get_containers_index()
 
+        if self.__results_journal:
+            self.__write_tests_from_results_journal(fixtures)
+            return
+
+        self.__prepare_test_results_for_bulk(self.__test_results)
+        sent_test_results = []
+        try:
+            self.__api_client.write_tests(
+                self.__test_results, fixtures, on_results_sent=sent_test_results.extend)
+        except Exception as exc:
+            if not self.__get_offline_results_writer():
+                raise
+
+            logging.warning(f'Test results were not sent and are saved offline: {exc}')
+            self.__test_results = self.__get_unsent_test_results(self.__test_results, sent_test_results)
+            self.__write_pending_test_results_offline()
+
+    def __write_tests_from_results_journal(self, fixtures: FixturesContainersIndex) -> None:
+        logging.debug(
+            f'Uploading {self.__results_journal.get_count()} test results '
+            f'from journal "{self.__results_journal.get_path()}"')
+
+        chunks = self.__results_journal.read_chunks(self.__results_journal_chunk_size)
+
+        try:
+            for test_results in chunks:
+                self.__prepare_test_results_for_bulk(test_results)
+                sent_test_results = []
+                try:
+                    self.__api_client.write_tests(
+                        test_results, fixtures, on_results_sent=sent_test_results.extend)
+                except Exception as exc:
+                    if not self.__get_offline_results_writer():
+                        raise
+
+                    logging.warning(f'Test results were not sent and are saved offline: {exc}')
+                    self.__write_test_results_offline(itertools.chain(
+                        [self.__get_unsent_test_results(test_results, sent_test_results)], chunks))
+                    break
+        except Exception:
+            logging.error(
+                f'Test results upload failed, journal is kept in "{self.__results_journal.get_path()}"')
+            raise
+
+        self.__results_journal.remove()
+
+    @staticmethod
+    def __get_unsent_test_results(
+            test_results: List[TestResult],
+            sent_test_results: List[TestResult]) -> List[TestResult]:
+        # Results of a partly sent upload are left out of the offline export, so they are not imported twice
+        sent_ids = {id(test_result) for test_result in sent_test_results}
+
+        return [test_result for test_result in test_results if id(test_result) not in sent_ids]
+
+    def __prepare_test_results_for_bulk(self, test_results) -> None:
         # Ensure this option is propagated for each buffered test result in bulk mode.
         should_create_work_item = self.__config.should_automatic_creation_test_cases()
-        for test_result in self.__test_results:
+        for test_result in test_results:
             test_result.set_automatic_creation_test_cases(should_create_work_item)
 
-        self.__api_client.write_tests(self.__test_results, fixtures)
-
     @adapter_logger
     def load_attachments(self, attach_paths):
+        offline_results_writer = self.__get_offline_results_writer()
+        if offline_results_writer:
+            return offline_results_writer.load_attachments(attach_paths)
+
         return self.__api_client.load_attachments(attach_paths)
 
     @adapter_logger
@@ -274,16 +474,13 @@ class AdapterManager:
         if name is None:
             name = str(uuid.uuid4()) + "-attachment.txt"
 
-        path = os.path.join(os.path.abspath(""), name)
-
-        with open(path, "wb") as attached_file:
-            attached_file.write(Utils.convert_body_of_attachment(body))
-
-        attachment_id = self.__api_client.load_attachments((path,))
+        body = Utils.convert_body_of_attachment(body)
 
-        os.remove(path)
+        offline_results_writer = self.__get_offline_results_writer()
+        if offline_results_writer:
+            return offline_results_writer.create_attachment(body, name)
 
-        return attachment_id
+        return self.__api_client.create_attachment(body, name)
 
     @adapter_logger
     def on_block_completed(self):
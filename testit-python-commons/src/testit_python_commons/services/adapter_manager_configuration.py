@@ -21,6 +21,11 @@ class AdapterManagerConfiguration:
 
         self.__import_realtime = Utils.convert_value_str_to_bool(
             app_properties.get(PropertiesNames.IMPORT_REALTIME).lower())
+        self.__import_realtime_async = Utils.convert_value_str_to_bool(
+            (app_properties.get(PropertiesNames.IMPORT_REALTIME_ASYNC) or '').lower())
+        self.__results_journal = Utils.convert_value_str_to_bool(
+            (app_properties.get(PropertiesNames.RESULTS_JOURNAL) or '').lower())
+        self.__offline_export_dir = app_properties.get(PropertiesNames.OFFLINE_EXPORT_DIR) or None
         self.__test_run_name = app_properties.get(PropertiesNames.TEST_RUN_NAME)
         self.__test_run_tags = parse_test_run_tags(app_properties.get(PropertiesNames.TEST_RUN_TAGS))
         self.__test_run_links = parse_test_run_links(app_properties.get(PropertiesNames.TEST_RUN_LINKS))
@@ -56,3 +61,19 @@ class AdapterManagerConfiguration:
     @adapter_logger
     def should_import_realtime(self) -> bool:
         return self.__import_realtime
+
+    @adapter_logger
+    def should_import_realtime_async(self) -> bool:
+        return self.__import_realtime_async
+
+    @adapter_logger
+    def should_use_results_journal(self) -> bool:
+        return self.__results_journal
+
+    @adapter_logger
+    def get_offline_export_dir(self):
+        return self.__offline_export_dir
+
+    @adapter_logger
+    def should_export_results_offline(self) -> bool:
+        return self.__offline_export_dir is not None
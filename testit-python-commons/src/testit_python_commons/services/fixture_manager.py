@@ -1,4 +1,7 @@
-from testit_python_commons.services.fixture_storage import ThreadContextFixtures
+from contextvars import Token
+
+from testit_python_commons.services.fixture_storage import FixturesContainersIndex, ThreadContextFixtures
+from testit_python_commons.models.fixture import FixturesContainer
 from testit_python_commons.models.step_result import StepResult
 
 
@@ -6,9 +9,17 @@ class FixtureManager:
     def __init__(self):
         self._items = ThreadContextFixtures()
         self._orphan_items = []
+        self._containers_index = FixturesContainersIndex()
+
+    def start_context(self) -> Token:
+        return self._items.start_context()
+
+    def end_context(self, token: Token) -> None:
+        self._items.end_context(token)
 
     def _update_item(self, uuid, **kwargs):
-        item = self._items[uuid] if uuid else self._items[next(reversed(self._items))]
+        uuid = uuid or next(reversed(self._items))
+        item = self._items[uuid]
         for name, value in kwargs.items():
             attr = getattr(item, name)
             if isinstance(attr, list):
@@ -16,6 +27,9 @@ class FixtureManager:
             else:
                 setattr(item, name, value)
 
+            if name == 'external_ids' and isinstance(item, FixturesContainer):
+                self._containers_index.add_external_id(uuid, item, value)
+
     def _last_executable(self):
         for _uuid in reversed(self._items):
             if isinstance(self._items[_uuid], StepResult):
@@ -34,6 +48,15 @@ class FixtureManager:
     def start_group(self, uuid, group):
         self._items[uuid] = group
 
+        if isinstance(group, FixturesContainer):
+            self._containers_index.add_container(uuid, group)
+
+    def has_external_id(self, uuid, external_id: str) -> bool:
+        return self._containers_index.has_external_id(uuid, external_id)
+
+    def get_containers_index(self) -> FixturesContainersIndex:
+        return self._containers_index
+
     def stop_group(self, uuid, **kwargs):
         self._update_item(uuid, **kwargs)
 
@@ -1,28 +1,70 @@
+import logging
 import threading
 from collections import OrderedDict, defaultdict
+from contextvars import ContextVar, Token
 
 
 class ThreadContextFixtures:
-    _thread_context = defaultdict(OrderedDict)
-    _init_thread: threading.Thread
+    """Fixture items by uuid, ordered separately for every thread or test context.
+
+    Items of the creating thread and items left in ended test contexts (fixture groups) are kept
+    in the root storage. Lookups by uuid fall back to it, so a group started by one test can be
+    finished by another. Contexts of other threads are released with the thread.
+    """
+
+    def __init__(self):
+        self._root = OrderedDict()
+        self._root_lock = threading.Lock()
+        self._context = ContextVar(f'testit_fixtures_{id(self)}', default=None)
+        self._context.set(self._root)
 
     @property
-    def thread_context(self):
-        context = self._thread_context[threading.current_thread()]
-        if not context and threading.current_thread() is not self._init_thread:
-            uuid, last_item = next(reversed(self._thread_context[self._init_thread].items()))
-            context[uuid] = last_item
+    def thread_context(self) -> OrderedDict:
+        context = self._context.get()
+        if context is None:
+            context = OrderedDict()
+            self._context.set(context)
+        if not context and context is not self._root:
+            self.__add_last_root_item(context)
         return context
 
-    def __init__(self, *args, **kwargs):
-        self._init_thread = threading.current_thread()
-        super().__init__(*args, **kwargs)
+    def start_context(self) -> Token:
+        """Gives the test running in the current thread or task its own fixture items until end_context."""
+        context = OrderedDict()
+        self.__add_last_root_item(context)
+
+        return self._context.set(context)
+
+    def end_context(self, token: Token) -> None:
+        context = self._context.get()
+
+        try:
+            self._context.reset(token)
+        except ValueError as exc:
+            logging.debug(f'Fixtures context was ended in another context: {exc}')
+            self._context.set(None)
+
+        if context is None or context is self._root:
+            return
+
+        with self._root_lock:
+            for key, item in context.items():
+                self._root.setdefault(key, item)
+
+    def __add_last_root_item(self, context: OrderedDict) -> None:
+        with self._root_lock:
+            if self._root:
+                uuid, last_item = next(reversed(self._root.items()))
+                context[uuid] = last_item
 
     def __setitem__(self, key, value):
         self.thread_context.__setitem__(key, value)
 
     def __getitem__(self, item):
-        return self.thread_context.__getitem__(item)
+        context = self.thread_context
+        if item in context:
+            return context[item]
+        return self._root[item]
 
     def __iter__(self):
         return self.thread_context.__iter__()
@@ -31,10 +73,70 @@ class ThreadContextFixtures:
         return self.thread_context.__reversed__()
 
     def get(self, key):
-        return self.thread_context.get(key)
+        item = self.thread_context.get(key)
+        if item is None:
+            item = self._root.get(key)
+        return item
 
     def pop(self, key):
-        return self.thread_context.pop(key)
+        context = self.thread_context
+        if key in context or context is self._root:
+            return context.pop(key)
+        with self._root_lock:
+            return self._root.pop(key)
 
     def get_all(self):
-        return dict(self.thread_context.items())
+        context = self.thread_context
+        with self._root_lock:
+            items = dict(self._root.items())
+        if context is not self._root:
+            items.update(context.items())
+        return items
+
+
+class FixturesContainersIndex:
+    """Inverted index from an external id to the fixtures containers the test uses.
+
+    Containers of a test are returned in the order the containers were added.
+    """
+
+    def __init__(self):
+        self.__order = {}
+        self.__containers_by_external_id = defaultdict(dict)
+
+    @classmethod
+    def of(cls, fixtures_containers) -> 'FixturesContainersIndex':
+        """Returns fixtures_containers if it is an index, otherwise indexes the {uuid: container} dict."""
+        if isinstance(fixtures_containers, cls):
+            return fixtures_containers
+
+        index = cls()
+        for uuid, container in (fixtures_containers or {}).items():
+            index.add_container(uuid, container)
+
+        return index
+
+    def add_container(self, uuid, container) -> None:
+        self.__order.setdefault(uuid, len(self.__order))
+
+        for external_id in getattr(container, 'external_ids', None) or []:
+            self.add_external_id(uuid, container, external_id)
+
+    def add_external_id(self, uuid, container, external_id: str) -> None:
+        self.__order.setdefault(uuid, len(self.__order))
+        self.__containers_by_external_id[external_id][uuid] = container
+
+    def has_external_id(self, uuid, external_id: str) -> bool:
+        containers = self.__containers_by_external_id.get(external_id)
+
+        return containers is not None and uuid in containers
+
+    def get_containers(self, external_id: str) -> list:
+        containers = self.__containers_by_external_id.get(external_id)
+        if not containers:
+            return []
+
+        return [containers[uuid] for uuid in sorted(containers, key=self.__order.__getitem__)]
+
+    def __bool__(self):
+        return bool(self.__containers_by_external_id)
@@ -1,3 +1,4 @@
+import logging
 from functools import wraps
 
 from testit_python_commons.services.plugin_manager import TmsPluginManager
@@ -6,11 +7,14 @@ from testit_python_commons.services.plugin_manager import TmsPluginManager
 def adapter_logger(function):
     @wraps(function)
     def wrapper(*args, **kwargs):
-        from testit_python_commons.services.utils import Utils
-
         logger = TmsPluginManager.get_logger()
 
-        parameters = Utils.get_function_parameters(function, *args, **kwargs)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return function(*args, **kwargs)
+
+        from testit_python_commons.services.utils import Utils
+
+        parameters = Utils.get_function_parameters_for_log(function, *args, **kwargs)
 
         message = f'Method "{function.__name__}" started'
 
@@ -24,7 +28,7 @@ def adapter_logger(function):
         message = f'Method "{function.__name__}" finished'
 
         if result is not None:
-            message += f' with result: {result}'
+            message += f' with result: {Utils.shorten_for_log(result)}'
 
         logger.debug(message)
 
@@ -0,0 +1,257 @@
+"""Offline export of test results into a local directory and its later upload to Test IT."""
+import json
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from adapters_api.model.attachment_put_model import AttachmentPutModel
+
+from testit_python_commons.client.api_client import ApiClientWorker
+from testit_python_commons.models.fixture import FixtureResult, FixturesContainer
+from testit_python_commons.models.step_result import StepResult
+from testit_python_commons.models.test_result import TestResult
+from testit_python_commons.services.fixture_storage import FixturesContainersIndex
+from testit_python_commons.services.result_journal import (
+    ResultJournal,
+    deserialize_step_result,
+    serialize_step_result,
+)
+
+_MANIFEST_FILE = 'manifest.json'
+_RESULTS_DIR = 'results'
+_FIXTURES_DIR = 'fixtures'
+_ATTACHMENTS_DIR = 'attachments'
+_FIXTURE_VALUE_FIELDS = ('title', 'outcome', 'description', 'message', 'stacktrace', 'parameters', 'start', 'stop')
+
+
+class OfflineResultsWriter:
+    """Records test results, fixtures and attachments of one adapter process into a results directory."""
+
+    def __init__(self, directory: str):
+        self.__directory = os.path.abspath(directory)
+        self.__session_id = str(uuid.uuid4())
+        self.__journal = ResultJournal(
+            os.path.join(self.__directory, _RESULTS_DIR, f'{self.__session_id}.jsonl'))
+
+    def get_directory(self) -> str:
+        return self.__directory
+
+    def write_test(self, test_result: TestResult) -> None:
+        self.__journal.append(test_result)
+
+    def load_attachments(self, attach_paths: list or tuple) -> List[AttachmentPutModel]:
+        attachments = []
+
+        for path in attach_paths:
+            if not os.path.isfile(path):
+                logging.error(f'File "{path}" was not found!')
+                continue
+
+            attachment_id = str(uuid.uuid4())
+            attachment_dir = os.path.join(self.__directory, _ATTACHMENTS_DIR, attachment_id)
+            os.makedirs(attachment_dir, exist_ok=True)
+            shutil.copyfile(path, os.path.join(attachment_dir, os.path.basename(path)))
+
+            attachments.append(AttachmentPutModel(id=attachment_id))
+            logging.debug(f'Attachment "{path}" was exported as {attachment_id}')
+
+        return attachments
+
+    def create_attachment(self, body, name: str) -> List[AttachmentPutModel]:
+        attachment_id = str(uuid.uuid4())
+        attachment_dir = os.path.join(self.__directory, _ATTACHMENTS_DIR, attachment_id)
+        os.makedirs(attachment_dir, exist_ok=True)
+
+        with open(os.path.join(attachment_dir, os.path.basename(name)), 'wb') as file:
+            if hasattr(body, 'read'):
+                shutil.copyfileobj(body, file)
+            else:
+                file.write(body)
+
+        return [AttachmentPutModel(id=attachment_id)]
+
+    def finish(self, fixtures: dict, test_run_id: str = None) -> None:
+        self.__journal.close()
+
+        containers = [
+            _serialize_fixtures_container(container)
+            for container in (fixtures or {}).values()
+            if isinstance(container, FixturesContainer)
+        ]
+        _write_json(os.path.join(self.__directory, _FIXTURES_DIR, f'{self.__session_id}.json'), containers)
+
+        if test_run_id:
+            _write_json(os.path.join(self.__directory, _MANIFEST_FILE), {'test_run_id': test_run_id})
+
+        logging.info(
+            f'{self.__journal.get_count()} test results were exported to "{self.__directory}". '
+            f'Upload them with "python -m testit_python_commons upload {self.__directory}"')
+
+
+class OfflineResultsUploader:
+    """Uploads a results directory recorded by OfflineResultsWriter through the bulk import paths."""
+    __chunk_size = 500
+
+    def __init__(self, directory: str, api_client: ApiClientWorker, upload_threads: int = 1):
+        self.__directory = os.path.abspath(directory)
+        self.__api_client = api_client
+        self.__upload_threads = max(1, upload_threads)
+
+    def get_test_run_id(self) -> str:
+        manifest = _read_json(os.path.join(self.__directory, _MANIFEST_FILE)) or {}
+
+        return manifest.get('test_run_id')
+
+    def upload(self, automatic_creation_test_cases: bool = False) -> int:
+        if not os.path.isdir(self.__directory):
+            raise FileNotFoundError(f'Results directory "{self.__directory}" was not found')
+
+        attachment_ids = self.__upload_attachments()
+        fixtures = self.__load_fixtures(attachment_ids)
+        uploaded = 0
+
+        for journal_path in self.__list_files(_RESULTS_DIR, '.jsonl'):
+            journal = ResultJournal(journal_path)
+
+            for test_results in journal.read_chunks(self.__chunk_size):
+                for test_result in test_results:
+                    _remap_test_result_attachments(test_result, attachment_ids)
+                    test_result.set_automatic_creation_test_cases(automatic_creation_test_cases)
+
+                self.__api_client.write_tests(test_results, fixtures)
+                uploaded += len(test_results)
+
+        logging.info(f'{uploaded} test results were uploaded from "{self.__directory}"')
+
+        return uploaded
+
+    def __upload_attachments(self) -> Dict[str, str]:
+        attachments_dir = os.path.join(self.__directory, _ATTACHMENTS_DIR)
+        if not os.path.isdir(attachments_dir):
+            return {}
+
+        local_ids = sorted(os.listdir(attachments_dir))
+        files = {}
+        for local_id in local_ids:
+            names = os.listdir(os.path.join(attachments_dir, local_id))
+            if names:
+                files[local_id] = os.path.join(attachments_dir, local_id, names[0])
+
+        # None marks exported attachments that failed to upload
+        attachment_ids = dict.fromkeys(local_ids)
+
+        with ThreadPoolExecutor(
+                max_workers=self.__upload_threads,
+                thread_name_prefix='testit-offline-upload') as executor:
+            uploaded = executor.map(lambda path: self.__api_client.load_attachments((path,)), files.values())
+
+            for local_id, attachments in zip(files.keys(), uploaded):
+                if attachments:
+                    attachment_ids[local_id] = attachments[0].id
+
+        return attachment_ids
+
+    def __load_fixtures(self, attachment_ids: Dict[str, str]) -> FixturesContainersIndex:
+        fixtures = FixturesContainersIndex()
+
+        for fixtures_path in self.__list_files(_FIXTURES_DIR, '.json'):
+            for record in _read_json(fixtures_path) or []:
+                container = _deserialize_fixtures_container(record)
+                for fixture in container.befores + container.afters:
+                    _remap_step_results_attachments(fixture.steps, attachment_ids)
+                fixtures.add_container(container.uuid, container)
+
+        return fixtures
+
+    def __list_files(self, sub_dir: str, extension: str) -> List[str]:
+        path = os.path.join(self.__directory, sub_dir)
+        if not os.path.isdir(path):
+            return []
+
+        return [
+            os.path.join(path, name)
+            for name in sorted(os.listdir(path))
+            if name.endswith(extension)
+        ]
+
+
+def _serialize_fixtures_container(container: FixturesContainer) -> dict:
+    return {
+        # The pytest adapter identifies containers by UUID objects
+        'uuid': str(container.uuid),
+        'external_ids': list(container.external_ids),
+        'befores': [_serialize_fixture_result(fixture) for fixture in container.befores],
+        'afters': [_serialize_fixture_result(fixture) for fixture in container.afters],
+    }
+
+
+def _deserialize_fixtures_container(record: dict) -> FixturesContainer:
+    return FixturesContainer(
+        uuid=record.get('uuid'),
+        external_ids=record.get('external_ids') or [],
+        befores=[_deserialize_fixture_result(fixture) for fixture in record.get('befores') or []],
+        afters=[_deserialize_fixture_result(fixture) for fixture in record.get('afters') or []])
+
+
+def _serialize_fixture_result(fixture: FixtureResult) -> dict:
+    record = {name: getattr(fixture, name) for name in _FIXTURE_VALUE_FIELDS}
+    record['steps'] = [serialize_step_result(step) for step in fixture.steps or []]
+    record['attachments'] = [getattr(attachment, 'id', attachment) for attachment in fixture.attachments or []]
+
+    return record
+
+
+def _deserialize_fixture_result(record: dict) -> FixtureResult:
+    fixture = FixtureResult(**{name: record.get(name) for name in _FIXTURE_VALUE_FIELDS})
+    fixture.steps = [deserialize_step_result(step) for step in record.get('steps') or []]
+    fixture.attachments = [AttachmentPutModel(id=attachment_id) for attachment_id in record.get('attachments') or []]
+
+    return fixture
+
+
+def _remap_test_result_attachments(test_result: TestResult, attachment_ids: Dict[str, str]) -> None:
+    test_result.set_attachments(_remap_attachments(test_result.get_attachments(), attachment_ids))
+
+    for step_results in (
+            test_result.get_step_results(),
+            test_result.get_setup_results(),
+            test_result.get_teardown_results()):
+        _remap_step_results_attachments(step_results, attachment_ids)
+
+
+def _remap_step_results_attachments(step_results: List[StepResult], attachment_ids: Dict[str, str]) -> None:
+    for step_result in step_results or []:
+        step_result.set_attachments(_remap_attachments(step_result.get_attachments(), attachment_ids))
+        _remap_step_results_attachments(step_result.get_step_results(), attachment_ids)
+
+
+def _remap_attachments(attachments: List[AttachmentPutModel], attachment_ids: Dict[str, str]) -> list:
+    # Attachments that failed to upload are dropped, as they would be in an online run. Attachments that
+    # were not exported were uploaded before the session switched to offline results and keep their ids.
+    return [
+        AttachmentPutModel(id=attachment_ids.get(attachment.id, attachment.id))
+        for attachment in attachments or []
+        if attachment_ids.get(attachment.id, attachment.id) is not None
+    ]
+
+
+def _read_json(path: str):
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def _write_json(path: str, value) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w', encoding='utf-8') as file:
+        json.dump(value, file)
+    os.replace(tmp_path, path)
@@ -39,12 +39,19 @@ class TmsPluginManager:
             from testit_python_commons.services.adapter_manager_configuration import (
                 AdapterManagerConfiguration,
             )
+            from testit_python_commons.services.request_metrics import RequestMetrics, set_request_metrics
+            from testit_python_commons.services.retry import RetryPolicy, set_retry_policy
 
             app_properties = AppProperties.load_properties(option)
 
             cls.get_logger(app_properties.get("logs") == "true")
 
             client_configuration = ClientConfiguration(app_properties)
+            set_retry_policy(RetryPolicy(
+                max_attempts=client_configuration.get_retry_max_attempts(),
+                budget_sec=client_configuration.get_retry_budget()))
+            if client_configuration.should_collect_request_metrics():
+                set_request_metrics(RequestMetrics(client_configuration.get_request_metrics_file()))
             adapter_configuration = AdapterManagerConfiguration(app_properties)
             fixture_manager = cls.get_fixture_manager()
 
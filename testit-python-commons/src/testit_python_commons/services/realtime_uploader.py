@@ -0,0 +1,71 @@
+import logging
+import queue
+import threading
+from typing import Callable, List
+
+from testit_python_commons.models.test_result import TestResult
+
+
+class RealtimeUploader:
+    """Sends realtime test results from background threads; submit blocks while the queue is full."""
+    __stop = object()
+
+    def __init__(
+            self,
+            write_test: Callable[[TestResult], None],
+            workers: int = 1,
+            max_queue_size: int = 100):
+        self.__write_test = write_test
+        self.__queue = queue.Queue(maxsize=max_queue_size)
+        self.__workers: List[threading.Thread] = []
+        self.__closed = False
+
+        for index in range(max(1, workers)):
+            worker = threading.Thread(
+                target=self.__run,
+                name=f'testit-realtime-upload-{index}',
+                daemon=True)
+            worker.start()
+            self.__workers.append(worker)
+
+    def submit(self, test_result: TestResult) -> None:
+        if self.__closed:
+            self.__write_test(test_result)
+            return
+
+        self.__queue.put(test_result)
+
+    def flush(self) -> None:
+        self.__queue.join()
+
+    def shutdown(self) -> None:
+        if self.__closed:
+            return
+
+        self.__closed = True
+        self.flush()
+
+        for _ in self.__workers:
+            self.__queue.put(self.__stop)
+
+        for worker in self.__workers:
+            worker.join()
+
+    def get_pending_count(self) -> int:
+        return self.__queue.qsize()
+
+    def __run(self) -> None:
+        while True:
+            test_result = self.__queue.get()
+
+            try:
+                if test_result is self.__stop:
+                    return
+
+                self.__write_test(test_result)
+            except Exception as exc:
+                logging.error(
+                    f'Cannot write test result "{test_result.get_external_id()}" in background: {exc}',
+                    exc_info=True)
+            finally:
+                self.__queue.task_done()
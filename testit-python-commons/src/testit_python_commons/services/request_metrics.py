@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from testit_python_commons.services.retry import get_retry_policy, pop_retry_mark
+
+# Upper bounds of the latency histogram buckets in milliseconds; slower requests fall into the last bucket
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class EndpointMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.total_sec = 0.0
+        self.max_sec = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, seconds: float, bytes_sent: int, bytes_received: int, failed: bool, retried: bool) -> None:
+        self.requests += 1
+        self.errors += failed
+        self.retries += retried
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+        self.total_sec += seconds
+        self.max_sec = max(self.max_sec, seconds)
+        self.histogram[_get_bucket(seconds * 1000)] += 1
+
+    def get_percentile_ms(self, percentile: float) -> float:
+        """Upper bound of the histogram bucket with the percentile, or the maximum for the last bucket."""
+        rank = self.requests * percentile / 100
+        count = 0
+
+        for bucket, bucket_count in enumerate(self.histogram):
+            count += bucket_count
+            if count >= rank and bucket < len(LATENCY_BUCKETS_MS):
+                return min(LATENCY_BUCKETS_MS[bucket], self.max_sec * 1000)
+
+        return self.max_sec * 1000
+
+    def to_dict(self) -> dict:
+        bucket_names = [str(bound) for bound in LATENCY_BUCKETS_MS] + ['+Inf']
+
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'total_sec': round(self.total_sec, 3),
+            'max_sec': round(self.max_sec, 3),
+            'latency_histogram_ms': dict(zip(bucket_names, self.histogram)),
+        }
+
+
+class RequestMetrics:
+    """Counts, latencies and sizes of requests to Test IT and Sync Storage, grouped by endpoint.
+
+    Endpoints are the path templates of the generated API clients, so requests for different
+    test runs or autotests are counted together.
+    """
+
+    def __init__(self, report_file: str = None):
+        self.__report_file = report_file
+        self.__endpoints: Dict[Tuple[str, str, str], EndpointMetrics] = {}
+        self.__lock = threading.Lock()
+        self.__current_request = threading.local()
+
+    def instrument(self, api_client, service: str) -> None:
+        """Wraps call_api of a generated API client and the requests of its connection pool."""
+        api_client.call_api = self.__wrap_call_api(api_client.call_api, service)
+        pool_manager = api_client.rest_client.pool_manager
+        pool_manager.request = self.__wrap_pool_request(pool_manager.request)
+
+    def record(
+            self,
+            service: str,
+            method: str,
+            path: str,
+            seconds: float,
+            bytes_sent: int = 0,
+            bytes_received: int = 0,
+            failed: bool = False,
+            retried: bool = False) -> None:
+        key = (service, method, path)
+
+        with self.__lock:
+            endpoint = self.__endpoints.get(key)
+            if endpoint is None:
+                endpoint = self.__endpoints[key] = EndpointMetrics()
+
+            endpoint.add(seconds, bytes_sent, bytes_received, failed, retried)
+
+    def get_endpoints(self) -> List[Tuple[Tuple[str, str, str], EndpointMetrics]]:
+        with self.__lock:
+            return sorted(self.__endpoints.items(), key=lambda item: item[1].total_sec, reverse=True)
+
+    def to_dict(self) -> dict:
+        endpoints = []
+        for (service, method, path), endpoint in self.get_endpoints():
+            endpoints.append(dict(service=service, method=method, path=path, **endpoint.to_dict()))
+
+        return {
+            'endpoints': endpoints,
+            'retry': get_retry_policy().get_statistics(),
+        }
+
+    def format_table(self) -> str:
+        endpoints = self.get_endpoints()
+        if not endpoints:
+            return 'No requests were sent'
+
+        names = [f'{service} {method} {path}' for (service, method, path), _ in endpoints]
+        width = max(len('endpoint'), *(len(name) for name in names))
+        lines = [
+            f'{"endpoint":<{width}}{"requests":>10}{"errors":>8}{"retries":>9}{"total, s":>10}'
+            f'{"avg, ms":>9}{"p95, ms":>9}{"max, ms":>9}{"sent, KB":>10}{"recv, KB":>10}']
+
+        total = EndpointMetrics()
+        for name, (_, endpoint) in zip(names, endpoints):
+            lines.append(self.__format_row(name, width, endpoint))
+            total.requests += endpoint.requests
+            total.errors += endpoint.errors
+            total.retries += endpoint.retries
+            total.bytes_sent += endpoint.bytes_sent
+            total.bytes_received += endpoint.bytes_received
+            total.total_sec += endpoint.total_sec
+            total.max_sec = max(total.max_sec, endpoint.max_sec)
+            total.histogram = [count + other for count, other in zip(total.histogram, endpoint.histogram)]
+
+        lines.append(self.__format_row('total', width, total))
+
+        return '\n'.join(lines)
+
+    def report(self) -> None:
+        """Prints the summary table and writes the metrics to the report file, if it is set."""
+        print(f'\nRequests by endpoint:\n{self.format_table()}')
+
+        if not self.__report_file:
+            return
+
+        report_file = self.get_report_file()
+        try:
+            directory = os.path.dirname(os.path.abspath(report_file))
+            os.makedirs(directory, exist_ok=True)
+            with open(report_file, 'w', encoding='utf-8') as file:
+                json.dump(self.to_dict(), file, indent=2)
+        except OSError as exc:
+            logging.warning(f'Cannot write request metrics to "{report_file}": {exc}')
+
+    def get_report_file(self) -> Optional[str]:
+        """Report file of this process: pytest-xdist workers add their id, e.g. requests.gw0.json."""
+        worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+        if not self.__report_file or not worker_id:
+            return self.__report_file
+
+        root, extension = os.path.splitext(self.__report_file)
+
+        return f'{root}.{worker_id}{extension}'
+
+    @staticmethod
+    def __format_row(name: str, width: int, endpoint: EndpointMetrics) -> str:
+        return (
+            f'{name:<{width}}{endpoint.requests:>10}{endpoint.errors:>8}{endpoint.retries:>9}'
+            f'{endpoint.total_sec:>10.2f}{endpoint.total_sec / endpoint.requests * 1000:>9.0f}'
+            f'{endpoint.get_percentile_ms(95):>9.0f}{endpoint.max_sec * 1000:>9.0f}'
+            f'{endpoint.bytes_sent / 1024:>10.1f}{endpoint.bytes_received / 1024:>10.1f}')
+
+    def __wrap_call_api(self, call_api, service: str):
+        current_request = self.__current_request
+
+        def instrumented_call_api(resource_path, method, *args, **kwargs):
+            current_request.bytes_sent = 0
+            current_request.bytes_received = 0
+            retried = pop_retry_mark()
+            started_at = time.perf_counter()
+            failed = True
+
+            try:
+                result = call_api(resource_path, method, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self.record(
+                    service,
+                    method,
+                    resource_path,
+                    time.perf_counter() - started_at,
+                    current_request.bytes_sent,
+                    current_request.bytes_received,
+                    failed,
+                    retried)
+
+        return instrumented_call_api
+
+    def __wrap_pool_request(self, request):
+        current_request = self.__current_request
+
+        def instrumented_request(method, url, *args, **kwargs):
+            response = request(method, url, *args, **kwargs)
+
+            # A request may be sent twice, e.g. uncompressed after the server rejected a compressed body
+            current_request.bytes_sent = getattr(current_request, 'bytes_sent', 0) + _get_body_size(
+                kwargs.get('body'), kwargs.get('headers'))
+            current_request.bytes_received = getattr(current_request, 'bytes_received', 0) + _get_response_size(
+                response)
+
+            return response
+
+        return instrumented_request
+
+
+def _get_bucket(milliseconds: float) -> int:
+    for bucket, bound in enumerate(LATENCY_BUCKETS_MS):
+        if milliseconds <= bound:
+            return bucket
+
+    return len(LATENCY_BUCKETS_MS)
+
+
+def _get_body_size(body, headers: Optional[dict]) -> int:
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+
+    content_length = getattr(body, 'content_length', None) or (headers or {}).get('Content-Length')
+
+    return int(content_length or 0)
+
+
+def _get_response_size(response) -> int:
+    # tell() counts the bytes read from the wire, i.e. before decompression, once the content is preloaded
+    content_length = response.headers.get('Content-Length') if response.headers else None
+
+    return max(response.tell(), int(content_length or 0))
+
+
+_request_metrics: Optional[RequestMetrics] = None
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    return _request_metrics
+
+
+def set_request_metrics(metrics: Optional[RequestMetrics]) -> None:
+    global _request_metrics
+    _request_metrics = metrics
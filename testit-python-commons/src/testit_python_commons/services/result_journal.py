@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import date, datetime
+from typing import Iterator, List, Optional
+
+from adapters_api.model.attachment_put_model import AttachmentPutModel
+
+from testit_python_commons.models.link import Link
+from testit_python_commons.models.step_result import StepResult
+from testit_python_commons.models.test_result import TestResult
+
+
+class ResultJournal:
+    """Append-only JSON lines journal of finished test results, read back in chunks."""
+    __default_journal_dir = os.path.join('build', '.caches', 'testit_results')
+
+    def __init__(self, path: str = None):
+        self.__path = os.path.abspath(path or os.path.join(self.__default_journal_dir, f'{uuid.uuid4()}.jsonl'))
+        self.__file = None
+        self.__count = None if path and os.path.isfile(self.__path) else 0
+        self.__lock = threading.Lock()
+
+    def get_path(self) -> str:
+        return self.__path
+
+    def get_count(self) -> int:
+        if self.__count is None:
+            self.__count = sum(1 for _ in self.__read_records())
+
+        return self.__count
+
+    def append(self, test_result: TestResult) -> None:
+        line = json.dumps(serialize_test_result(test_result), default=_encode_value)
+
+        with self.__lock:
+            if self.__file is None:
+                os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+                self.__file = open(self.__path, 'a', encoding='utf-8')
+                logging.debug(f'Test results are journaled to "{self.__path}"')
+
+            self.__file.write(line + '\n')
+            # Flush every record so a crashed session leaves a complete journal behind
+            self.__file.flush()
+            self.__count = self.get_count() + 1
+
+    def read_chunks(self, chunk_size: int) -> Iterator[List[TestResult]]:
+        self.close()
+
+        chunk = []
+        for record in self.__read_records():
+            chunk.append(deserialize_test_result(record))
+
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    def remove(self) -> None:
+        self.close()
+
+        try:
+            os.remove(self.__path)
+        except FileNotFoundError:
+            pass
+
+    def __read_records(self) -> Iterator[dict]:
+        if not os.path.isfile(self.__path):
+            return
+
+        with open(self.__path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    yield json.loads(line, object_hook=_decode_value)
+                except ValueError as exc:
+                    # The last line may be cut off if the session crashed while writing it
+                    logging.warning(f'Skipping broken record {line_number} in "{self.__path}": {exc}')
+
+
+_TEST_RESULT_VALUE_FIELDS = (
+    'external_id', 'autotest_name', 'outcome', 'status_type', 'title', 'description', 'duration',
+    'started_on', 'completed_on', 'namespace', 'classname', 'message', 'traces', 'labels', 'tags',
+    'work_item_ids', 'parameters', 'properties', 'automatic_creation_test_cases', 'external_key')
+_TEST_RESULT_STEP_FIELDS = ('step_results', 'setup_results', 'teardown_results')
+_TEST_RESULT_LINK_FIELDS = ('links', 'result_links')
+_STEP_RESULT_VALUE_FIELDS = ('title', 'outcome', 'description', 'duration', 'started_on', 'completed_on', 'parameters')
+_LINK_FIELDS = ('url', 'title', 'link_type', 'description')
+
+
+def serialize_test_result(test_result: TestResult) -> dict:
+    record = {name: getattr(test_result, f'get_{name}')() for name in _TEST_RESULT_VALUE_FIELDS}
+
+    for name in _TEST_RESULT_STEP_FIELDS:
+        record[name] = [serialize_step_result(step) for step in getattr(test_result, f'get_{name}')() or []]
+
+    for name in _TEST_RESULT_LINK_FIELDS:
+        record[name] = [_link_to_dict(link) for link in getattr(test_result, f'get_{name}')() or []]
+
+    record['attachments'] = _attachments_to_ids(test_result.get_attachments())
+
+    return record
+
+
+def deserialize_test_result(record: dict) -> TestResult:
+    test_result = TestResult()
+
+    for name in _TEST_RESULT_VALUE_FIELDS:
+        if record.get(name) is not None:
+            getattr(test_result, f'set_{name}')(record[name])
+
+    for name in _TEST_RESULT_STEP_FIELDS:
+        getattr(test_result, f'set_{name}')([deserialize_step_result(step) for step in record.get(name) or []])
+
+    for name in _TEST_RESULT_LINK_FIELDS:
+        getattr(test_result, f'set_{name}')([_link_from_dict(link) for link in record.get(name) or []])
+
+    test_result.set_attachments(_ids_to_attachments(record.get('attachments')))
+
+    return test_result
+
+
+def serialize_step_result(step_result: StepResult) -> dict:
+    record = {name: getattr(step_result, f'get_{name}')() for name in _STEP_RESULT_VALUE_FIELDS}
+    record['step_results'] = [serialize_step_result(step) for step in step_result.get_step_results() or []]
+    record['attachments'] = _attachments_to_ids(step_result.get_attachments())
+
+    return record
+
+
+def deserialize_step_result(record: dict) -> StepResult:
+    step_result = StepResult()
+
+    for name in _STEP_RESULT_VALUE_FIELDS:
+        if record.get(name) is not None:
+            getattr(step_result, f'set_{name}')(record[name])
+
+    step_result.set_step_results([deserialize_step_result(step) for step in record.get('step_results') or []])
+    step_result.set_attachments(_ids_to_attachments(record.get('attachments')))
+
+    return step_result
+
+
+def _link_to_dict(link: Link) -> dict:
+    return {name: getattr(link, f'get_{name}')() for name in _LINK_FIELDS}
+
+
+def _link_from_dict(record: dict) -> Link:
+    link = Link()
+
+    for name in _LINK_FIELDS:
+        getattr(link, f'set_{name}')(record.get(name))
+
+    return link
+
+
+def _attachments_to_ids(attachments: Optional[list]) -> List[str]:
+    return [getattr(attachment, 'id', attachment) for attachment in attachments or []]
+
+
+def _ids_to_attachments(attachment_ids: Optional[List[str]]) -> List[AttachmentPutModel]:
+    return [AttachmentPutModel(id=attachment_id) for attachment_id in attachment_ids or []]
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def _decode_value(record: dict):
+    if '__datetime__' in record:
+        return datetime.fromisoformat(record['__datetime__'])
+    if '__date__' in record:
+        return date.fromisoformat(record['__date__'])
+
+    return record
@@ -1,15 +1,22 @@
 ﻿import logging
 import random
+import threading
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from http.client import RemoteDisconnected
+from typing import Optional
 
 import adapters_api
 import urllib3
 
 CONNECTION_RETRIES = 3
-CONNECTION_RETRY_DELAY_SEC = 1
 API_EXCEPTION_RETRIES = 10
+RETRY_BASE_DELAY_SEC = 0.5
+RETRY_MAX_DELAY_SEC = 30
+RETRY_BUDGET_SEC = 300
 NON_RETRIABLE_API_STATUS_CODES = (400, 404)
+RETRY_AFTER_STATUS_CODES = (429, 503)
 
 _RETRIABLE_CONNECTION_TYPES = (
     urllib3.exceptions.ProtocolError,
@@ -20,6 +27,102 @@ _RETRIABLE_CONNECTION_TYPES = (
     RemoteDisconnected,
     TimeoutError,
 )
+# Set on errors that a decorated call has already retried, so that decorated callers do not retry them again
+_RETRIED_ATTRIBUTE = '_testit_retried'
+# Marks the thread whose next request repeats a failed one, for request metrics
+_retry_state = threading.local()
+
+
+class RetryPolicy:
+    """Retries of failed TMS requests: exponential backoff with full jitter within a session budget.
+
+    The budget limits the time a session spends in failed attempts and sleeping between retries; each failed attempt
+    is charged at most max_delay_sec, so that one slow timeout does not spend it.
+    When a retry would exceed it, the circuit opens for the rest of the session: failed requests are no longer retried
+    and the adapter manager saves test results offline instead of sending them.
+    A Retry-After longer than max_delay_sec that does not fit in the budget only fails its own request.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = API_EXCEPTION_RETRIES,
+            connection_retries: int = CONNECTION_RETRIES,
+            base_delay_sec: float = RETRY_BASE_DELAY_SEC,
+            max_delay_sec: float = RETRY_MAX_DELAY_SEC,
+            budget_sec: float = RETRY_BUDGET_SEC):
+        self.__max_attempts = max_attempts
+        self.__connection_retries = connection_retries
+        self.__base_delay_sec = base_delay_sec
+        self.__max_delay_sec = max_delay_sec
+        self.__budget_sec = budget_sec
+        self.__retries = 0
+        self.__sleep_sec = 0.0
+        self.__failed_attempts_sec = 0.0
+        self.__open = False
+        self.__lock = threading.Lock()
+
+    def get_max_attempts(self) -> int:
+        return self.__max_attempts
+
+    def get_connection_retries(self) -> int:
+        return self.__connection_retries
+
+    def get_delay(self, retry_number: int, exc: BaseException) -> float:
+        retry_after = get_retry_after(exc)
+        if retry_after is not None:
+            return retry_after
+
+        return random.uniform(0, min(self.__max_delay_sec, self.__base_delay_sec * 2 ** (retry_number - 1)))
+
+    def acquire(self, delay: float, failed_attempt_sec: float) -> bool:
+        """Takes the failed attempt and the delay of one retry from the budget.
+
+        Opens the circuit and returns False if the budget is spent.
+        """
+        with self.__lock:
+            if self.__open:
+                return False
+
+            self.__failed_attempts_sec += min(failed_attempt_sec, self.__max_delay_sec)
+            if self.__failed_attempts_sec + self.__sleep_sec + delay > self.__budget_sec:
+                if delay > self.__max_delay_sec:
+                    logging.warning(f'Retry-After of {delay} s does not fit in the retry budget, request is not retried')
+                    return False
+
+                self.__open = True
+                logging.error(
+                    f'Retry budget of {self.__budget_sec} s is spent, requests to Test IT are no longer retried')
+                return False
+
+            self.__retries += 1
+            self.__sleep_sec += delay
+
+            return True
+
+    def is_open(self) -> bool:
+        return self.__open
+
+    def get_statistics(self) -> dict:
+        with self.__lock:
+            return {
+                'retries': self.__retries,
+                'retry_sleep_sec': round(self.__sleep_sec, 3),
+                'failed_attempts_sec': round(self.__failed_attempts_sec, 3),
+                'budget_sec': self.__budget_sec,
+                'circuit_open': self.__open,
+            }
+
+
+_retry_policy = RetryPolicy()
+
+
+def get_retry_policy() -> RetryPolicy:
+    return _retry_policy
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    global _retry_policy
+    _retry_policy = policy
 
 
 def is_non_retriable_api_exception(exc: BaseException) -> bool:
@@ -40,53 +143,107 @@ def is_retriable_connection_error(exc: BaseException) -> bool:
     return False
 
 
-def _execute_with_connection_retries(func, args, kwargs):
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds to wait from the Retry-After header of a 429 or 503 response, if there is one."""
+    if not isinstance(exc, adapters_api.exceptions.ApiException) or exc.status is None \
+            or int(exc.status) not in RETRY_AFTER_STATUS_CODES:
+        return None
+
+    headers = exc.headers or {}
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _mark_retried(exc: BaseException) -> None:
+    try:
+        setattr(exc, _RETRIED_ATTRIBUTE, True)
+    except AttributeError:
+        pass
+
+
+def _execute_with_retries(func, args, kwargs, retry_api_exceptions: bool):
+    policy = get_retry_policy()
     connection_attempts = 0
+    api_attempts = 0
 
     while True:
+        started_at = time.monotonic()
+        if connection_attempts or api_attempts:
+            _retry_state.retrying = True
+
         try:
             return func(*args, **kwargs)
         except BaseException as e:
-            if not is_retriable_connection_error(e):
+            if getattr(e, _RETRIED_ATTRIBUTE, False):
                 raise
 
-            connection_attempts += 1
-            logging.warning(
-                'Connection error in %s (attempt %d/%d): %s',
-                func.__name__,
-                connection_attempts,
-                CONNECTION_RETRIES,
-                e,
-            )
-            if connection_attempts > CONNECTION_RETRIES:
+            if is_retriable_connection_error(e):
+                connection_attempts += 1
+                logging.warning(
+                    'Connection error in %s (attempt %d/%d): %s',
+                    func.__name__,
+                    connection_attempts,
+                    policy.get_connection_retries(),
+                    e,
+                )
+                if connection_attempts > policy.get_connection_retries():
+                    _mark_retried(e)
+                    raise
+            elif retry_api_exceptions and isinstance(e, adapters_api.exceptions.ApiException):
+                if is_non_retriable_api_exception(e):
+                    raise
+
+                api_attempts += 1
+                logging.error(e)
+                if api_attempts >= policy.get_max_attempts():
+                    _mark_retried(e)
+                    raise
+            else:
                 raise
 
-            time.sleep(CONNECTION_RETRY_DELAY_SEC)
+            delay = policy.get_delay(connection_attempts + api_attempts, e)
+            if not policy.acquire(delay, time.monotonic() - started_at):
+                _mark_retried(e)
+                raise
+
+            time.sleep(delay)
+        finally:
+            _retry_state.retrying = False
+
+
+def pop_retry_mark() -> bool:
+    """Returns True once for the first request of a retry attempt in the current thread."""
+    retrying = getattr(_retry_state, 'retrying', False)
+    _retry_state.retrying = False
+
+    return retrying
 
 
 def retry_on_connection_error(func):
     def retry_wrapper(*args, **kwargs):
-        return _execute_with_connection_retries(func, args, kwargs)
+        return _execute_with_retries(func, args, kwargs, retry_api_exceptions=False)
 
     return retry_wrapper
 
 
 def retry(func):
     def retry_wrapper(*args, **kwargs):
-        api_attempts = 0
-
-        while True:
-            try:
-                return _execute_with_connection_retries(func, args, kwargs)
-            except adapters_api.exceptions.ApiException as e:
-                if is_non_retriable_api_exception(e):
-                    raise
-
-                api_attempts += 1
-                logging.error(e)
-                if api_attempts >= API_EXCEPTION_RETRIES:
-                    raise
-
-                time.sleep(random.randrange(0, 100) / 100)
+        return _execute_with_retries(func, args, kwargs, retry_api_exceptions=True)
 
     return retry_wrapper
@@ -1,3 +1,4 @@
+from contextvars import Token
 from typing import List
 
 from testit_python_commons.models.step_result import StepResult
@@ -5,11 +6,17 @@ from testit_python_commons.services.step_result_storage import StepResultStorage
 
 
 class StepManager:
-    __steps_tree: List[StepResult] = []
-
     def __init__(self):
         self.__storage = StepResultStorage()
 
+    @staticmethod
+    def start_context() -> Token:
+        return StepResultStorage.start_context()
+
+    @staticmethod
+    def end_context(token: Token) -> None:
+        StepResultStorage.end_context(token)
+
     def start_step(self, step: StepResult):
         if self.__storage.get_count():
             parent_step: StepResult = self.__storage.get_last()
@@ -22,7 +29,7 @@ class StepManager:
 
     def stop_step(self):
         if self.__storage.get_count() == 1:
-            self.__steps_tree.append(self.__storage.get_last())
+            self.__storage.add_to_steps_tree(self.__storage.get_last())
 
         self.__storage.remove_last()
 
@@ -30,7 +37,4 @@ class StepManager:
         return self.__storage.get_last()
 
     def get_steps_tree(self) -> List[StepResult]:
-        steps_tree = self.__steps_tree.copy()
-        self.__steps_tree.clear()
-
-        return steps_tree
+        return self.__storage.pop_steps_tree()
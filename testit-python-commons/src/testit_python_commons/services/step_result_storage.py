@@ -1,26 +1,93 @@
 import logging
-from typing import List
+import threading
+from contextvars import ContextVar, Token
+from typing import Dict, List
 
 from testit_python_commons.models.step_result import StepResult
 
 
+class StepContext:
+    """Steps of one test: the stack of open steps and the finished top-level steps."""
+
+    def __init__(self):
+        self.open_steps: List[StepResult] = []
+        self.steps_tree: List[StepResult] = []
+
+
 class StepResultStorage:
-    __storage: List[StepResult] = []
+    # Used where no test context was started; shared by all threads
+    __default_context = StepContext()
+    __context: ContextVar = ContextVar('testit_step_context', default=None)
+    # id of the start_context token -> context of a test that is running
+    __active_contexts: Dict[int, StepContext] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def start_context(cls) -> Token:
+        """Gives the test running in the current thread or task its own steps until end_context."""
+        context = StepContext()
+        token = cls.__context.set(context)
+
+        with cls.__lock:
+            cls.__active_contexts[id(token)] = context
+
+        return token
+
+    @classmethod
+    def end_context(cls, token: Token) -> None:
+        with cls.__lock:
+            cls.__active_contexts.pop(id(token), None)
+
+        try:
+            cls.__context.reset(token)
+        except ValueError as exc:
+            logging.debug(f'Step context was ended in another context: {exc}')
+            cls.__context.set(None)
+
+    @classmethod
+    def get_context(cls) -> StepContext:
+        context = cls.__context.get()
+        if context is not None:
+            return context
+
+        # Threads started by a test do not inherit its context; their steps belong to the test
+        # when it is the only one running
+        with cls.__lock:
+            if len(cls.__active_contexts) == 1:
+                return next(iter(cls.__active_contexts.values()))
+
+        return cls.__default_context
 
     def add(self, step_result: StepResult):
-        self.__storage.append(step_result)
+        self.get_context().open_steps.append(step_result)
 
     def get_last(self):
-        if not self.__storage:
+        open_steps = self.get_context().open_steps
+        if not open_steps:
             return
 
-        return self.__storage[-1]
+        return open_steps[-1]
 
     def remove_last(self):
         try:
-            self.__storage.pop()
+            self.get_context().open_steps.pop()
         except Exception as exc:
             logging.error(f'Cannot remove last step from storage. Storage is empty. {exc}')
 
     def get_count(self) -> int:
-        return len(self.__storage)
+        return len(self.get_context().open_steps)
+
+    def add_to_steps_tree(self, step_result: StepResult):
+        self.get_context().steps_tree.append(step_result)
+
+    def pop_steps_tree(self) -> List[StepResult]:
+        context = self.get_context()
+        steps_tree, context.steps_tree = context.steps_tree, []
+
+        default_context = self.__default_context
+        if context is not default_context and default_context.steps_tree:
+            # Steps finished where no single test could be told apart
+            default_steps_tree, default_context.steps_tree = default_context.steps_tree, []
+            steps_tree = default_steps_tree + steps_tree
+
+        return steps_tree
@@ -25,6 +25,7 @@ from api_client_syncstorage.model.register_request import RegisterRequest
 from urllib3.exceptions import InsecureRequestWarning
 from api_client_syncstorage.model.set_worker_status_request import SetWorkerStatusRequest
 from testit_python_commons.models.test_result import TestResult
+from testit_python_commons.services.request_metrics import get_request_metrics
 
 
 # Disable SSL warnings
@@ -507,6 +508,8 @@ class SyncStorageRunner:
             config.verify_ssl = False  # Disable SSL verification for localhost
 
             api_client = SyncStorageApiClient(configuration=config)
+            if get_request_metrics():
+                get_request_metrics().instrument(api_client, 'sync-storage')
 
             # Initialize APIs
             self.workers_api = WorkersApi(api_client=api_client)
@@ -1,3 +1,4 @@
+import functools
 import inspect
 import logging
 import re
@@ -12,6 +13,15 @@ if TYPE_CHECKING:
     from testit_python_commons.models.link import Link
 
 
+LOG_VALUE_MAX_LENGTH = 1000
+LOG_VALUE_MAX_ITEMS = 20
+
+
+@functools.lru_cache(maxsize=None)
+def _get_full_arg_spec(function) -> inspect.FullArgSpec:
+    return inspect.getfullargspec(function)
+
+
 class Utils:
     @staticmethod
     def uuid_check(uuid: str):
@@ -52,25 +62,52 @@ class Utils:
 
     @staticmethod
     def get_function_parameters(function, *args, **kwargs):
+        return {
+            name: str(value)
+            for name, value in Utils.__bind_function_parameters(function, args, kwargs).items()
+        }
+
+    @staticmethod
+    def get_function_parameters_for_log(function, *args, **kwargs):
+        return {
+            name: Utils.shorten_for_log(value)
+            for name, value in Utils.__bind_function_parameters(function, args, kwargs).items()
+        }
+
+    @staticmethod
+    def shorten_for_log(value) -> str:
+        if isinstance(value, (list, tuple, set, dict)) and len(value) > LOG_VALUE_MAX_ITEMS:
+            return f'<{type(value).__name__} with {len(value)} items>'
+
+        text = str(value)
+
+        if len(text) > LOG_VALUE_MAX_LENGTH:
+            return f'{text[:LOG_VALUE_MAX_LENGTH]}... ({len(text)} chars)'
+
+        return text
+
+    @staticmethod
+    def __bind_function_parameters(function, args: tuple, kwargs: dict) -> dict:
         parameters = {}
-        args_default_values = inspect.getfullargspec(function).defaults
+        arg_spec = _get_full_arg_spec(function)
+        args_default_values = arg_spec.defaults
 
         if args or args_default_values:
-            all_keys = inspect.getfullargspec(function).args
+            all_keys = arg_spec.args
             all_args = list(args)
 
             if args_default_values:
                 all_args += list(args_default_values[len(args) - (len(all_keys) - len(args_default_values)):])
 
-            method_args = [arg_name for arg_name in all_keys if arg_name not in list(kwargs)]
+            method_args = [arg_name for arg_name in all_keys if arg_name not in kwargs]
 
             if len(method_args) == len(all_args):
                 for index in range(0, len(method_args)):
-                    parameters[method_args[index]] = str(all_args[index])
+                    parameters[method_args[index]] = all_args[index]
 
         if kwargs:
             for key, parameter in kwargs.items():
-                parameters[key] = str(parameter)
+                parameters[key] = parameter
 
         return parameters
 
@@ -118,7 +155,7 @@ class Utils:
     @staticmethod
     @adapter_logger
     def convert_body_of_attachment(body):
-        if isinstance(body, bytes):
+        if isinstance(body, (bytes, bytearray, memoryview)) or hasattr(body, 'read'):
             return body
 
         return str(body).encode('utf-8')
@@ -130,3 +167,21 @@ class Utils:
             return value == 'true'
 
         return False
+
+    @staticmethod
+    @adapter_logger
+    def convert_value_str_to_int(value: str, default: int, minimum: int = None) -> int:
+        if value is None or value == '':
+            return default
+
+        try:
+            result = int(value)
+        except (TypeError, ValueError):
+            logging.warning(f'The wrong integer value "{value}"! Using default value {default}')
+            return default
+
+        if minimum is not None and result < minimum:
+            logging.warning(f'The value {result} is less than {minimum}! Using {minimum}')
+            return minimum
+
+        return result
@@ -1,7 +1,7 @@
 import os
 import re
 import logging
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 from uuid import UUID
@@ -24,6 +24,11 @@ class HtmlEscapeUtils:
     _LESS_THAN_PATTERN = re.compile('<')
     _GREATER_THAN_PATTERN = re.compile('>')
     
+    _EXTERNAL_ID_PREFIXES = ("external_id", "externalId", "auto_test_external_id", "autoTestExternalId")
+    
+    # Class -> whether it is a generated API model
+    _generated_models: Dict[type, bool] = {}
+    
     @staticmethod
     def escape_html_tags(text: Optional[str]) -> Optional[str]:
         """
@@ -63,6 +68,8 @@ class HtmlEscapeUtils:
         Escapes HTML tags in all string attributes of an object using reflection.
         Also processes list attributes: if list of objects - calls escape_html_in_object_list,
         if list of strings - escapes each string.
+        Generated API models keep their fields in _data_store, which reflection does not reach,
+        so they are left as they are.
         Can be disabled by setting NO_ESCAPE_HTML environment variable to "true".
         
         Args:
@@ -74,13 +81,12 @@ class HtmlEscapeUtils:
         if obj is None:
             return None
             
-        # Check if escaping is disabled via environment variable
-        no_escape_html = os.environ.get(HtmlEscapeUtils.NO_ESCAPE_HTML_ENV_VAR, "").lower()
-        if no_escape_html == "true":
+        # Check if escaping is disabled via environment variable (once per call tree)
+        if HtmlEscapeUtils._is_escape_disabled():
             return obj
             
         try:
-            HtmlEscapeUtils._process_object_attributes(obj)
+            HtmlEscapeUtils._process_value(obj)
         except Exception as e:
             # Silently ignore reflection errors
             logging.debug(f"Error processing object attributes: {e}")
@@ -103,15 +109,67 @@ class HtmlEscapeUtils:
             return None
             
         # Check if escaping is disabled via environment variable
-        no_escape_html = os.environ.get(HtmlEscapeUtils.NO_ESCAPE_HTML_ENV_VAR, "").lower()
-        if no_escape_html == "true":
+        if HtmlEscapeUtils._is_escape_disabled():
             return obj_list
             
         for obj in obj_list:
-            HtmlEscapeUtils.escape_html_in_object(obj)
+            if obj is None:
+                continue
+            try:
+                HtmlEscapeUtils._process_value(obj)
+            except Exception as e:
+                logging.debug(f"Error processing object attributes: {e}")
             
         return obj_list
     
+    @staticmethod
+    def _is_escape_disabled() -> bool:
+        no_escape_html = os.environ.get(HtmlEscapeUtils.NO_ESCAPE_HTML_ENV_VAR, "").lower()
+        return no_escape_html == "true"
+    
+    @staticmethod
+    def _escape_text(text: str) -> str:
+        """
+        Same as escape_html_tags, without the environment check (already done by the caller).
+        """
+        if not HtmlEscapeUtils._HTML_TAG_PATTERN.search(text):
+            return text
+            
+        result = HtmlEscapeUtils._LESS_THAN_PATTERN.sub('&lt;', text)
+        return HtmlEscapeUtils._GREATER_THAN_PATTERN.sub('&gt;', result)
+    
+    @staticmethod
+    def _is_external_id_name(attr_name: str) -> bool:
+        return attr_name.startswith(HtmlEscapeUtils._EXTERNAL_ID_PREFIXES)
+    
+    @staticmethod
+    def _process_value(obj: Any) -> None:
+        """
+        Process an object for HTML escaping.
+        """
+        if HtmlEscapeUtils._is_generated_model(type(obj)):
+            return
+            
+        HtmlEscapeUtils._process_object_attributes(obj)
+    
+    @staticmethod
+    def _is_generated_model(obj_type: type) -> bool:
+        """
+        Checks (once per class) if a type is a generated API model.
+        Their public non-callable attributes are only class-level metadata without text to escape.
+        """
+        try:
+            return HtmlEscapeUtils._generated_models[obj_type]
+        except KeyError:
+            pass
+            
+        is_generated = (
+            isinstance(getattr(obj_type, 'attribute_map', None), dict) and
+            hasattr(obj_type, 'openapi_types')
+        )
+        HtmlEscapeUtils._generated_models[obj_type] = is_generated
+        return is_generated
+    
     @staticmethod
     def _process_object_attributes(obj: Any) -> None:
         """
@@ -121,18 +179,13 @@ class HtmlEscapeUtils:
         if hasattr(obj, '__dict__'):
             for attr_name in dir(obj):
                 # Skip private/protected attributes and methods
-                if attr_name.startswith('_') or callable(getattr(obj, attr_name, None)):
-                    continue
-                if (
-                    attr_name.startswith("external_id")
-                    or attr_name.startswith("externalId")
-                    or attr_name.startswith("auto_test_external_id")
-                    or attr_name.startswith("autoTestExternalId")
-                ):
+                if attr_name.startswith('_') or HtmlEscapeUtils._is_external_id_name(attr_name):
                     continue
                     
                 try:
                     value = getattr(obj, attr_name)
+                    if callable(value):
+                        continue
                     HtmlEscapeUtils._process_attribute_value(obj, attr_name, value)
                 except Exception as e:
                     # Silently ignore attribute errors
@@ -142,11 +195,11 @@ class HtmlEscapeUtils:
         elif isinstance(obj, dict):
             for key, value in obj.items():
                 if isinstance(value, str):
-                    obj[key] = HtmlEscapeUtils.escape_html_tags(value)
+                    obj[key] = HtmlEscapeUtils._escape_text(value)
                 elif isinstance(value, list):
                     HtmlEscapeUtils._process_list(value)
                 elif not HtmlEscapeUtils._is_simple_type(type(value)):
-                    HtmlEscapeUtils.escape_html_in_object(value)
+                    HtmlEscapeUtils._process_value(value)
     
     @staticmethod
     def _process_attribute_value(obj: Any, attr_name: str, value: Any) -> None:
@@ -154,9 +207,12 @@ class HtmlEscapeUtils:
         Process a single attribute value for HTML escaping.
         """
         if isinstance(value, str):
+            escaped = HtmlEscapeUtils._escape_text(value)
+            if escaped is value:
+                return
             # Escape string attributes
             try:
-                setattr(obj, attr_name, HtmlEscapeUtils.escape_html_tags(value))
+                setattr(obj, attr_name, escaped)
             except AttributeError:
                 # Attribute might be read-only
                 pass
@@ -164,7 +220,7 @@ class HtmlEscapeUtils:
             HtmlEscapeUtils._process_list(value)
         elif value is not None and not HtmlEscapeUtils._is_simple_type(type(value)):
             # Process nested objects (but not simple types)
-            HtmlEscapeUtils.escape_html_in_object(value)
+            HtmlEscapeUtils._process_value(value)
     
     @staticmethod
     def _process_list(lst: List[Any]) -> None:
@@ -180,11 +236,12 @@ class HtmlEscapeUtils:
             # List of strings - escape each string
             for i, item in enumerate(lst):
                 if isinstance(item, str):
-                    lst[i] = HtmlEscapeUtils.escape_html_tags(item)
+                    lst[i] = HtmlEscapeUtils._escape_text(item)
         elif first_element is not None:
             # List of objects - process each object
             for item in lst:
-                HtmlEscapeUtils.escape_html_in_object(item)
+                if item is not None:
+                    HtmlEscapeUtils._process_value(item)
     
     @staticmethod
     def _is_simple_type(obj_type: type) -> bool:
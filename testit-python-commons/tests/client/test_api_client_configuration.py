@@ -0,0 +1,89 @@
+import gzip
+import json
+import socket
+from unittest import mock
+
+import pytest
+
+from adapters_api import Configuration
+from adapters_api.rest import RESTClientObject
+
+from testit_python_commons.client.api_client import ApiClientWorker
+
+
+def _get_configuration(**kwargs) -> Configuration:
+    return ApiClientWorker._ApiClientWorker__get_api_client_configuration(url="https://tms.example", **kwargs)
+
+
+def _response(status):
+    return mock.Mock(status=status)
+
+
+class TestApiClientConfiguration:
+    def test_pool_size_is_taken_from_config(self):
+        assert _get_configuration(pool_size=2, upload_threads=64).connection_pool_maxsize == 2
+
+    def test_pool_is_not_smaller_than_upload_threads_by_default(self):
+        assert _get_configuration(upload_threads=1000).connection_pool_maxsize == 1000
+        assert _get_configuration(upload_threads=1).connection_pool_maxsize == Configuration().connection_pool_maxsize
+
+    def test_timeouts_zero_means_no_timeout(self):
+        timeout = _get_configuration(connect_timeout=5, read_timeout=0).timeout
+
+        assert timeout.connect_timeout == 5
+        assert timeout.read_timeout is None
+
+    def test_tcp_keep_alive_socket_options(self):
+        assert _get_configuration().socket_options is None
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in _get_configuration(tcp_keep_alive=True).socket_options
+
+    def test_rest_client_uses_configured_timeout_by_default(self, mocker):
+        configuration = _get_configuration(connect_timeout=5, read_timeout=60)
+        rest_client = RESTClientObject(configuration)
+        request = mocker.patch.object(rest_client.pool_manager, "request")
+        request.return_value.status = 200
+
+        rest_client.request("GET", "https://tms.example/api", _preload_content=False)
+        rest_client.request("GET", "https://tms.example/api", _preload_content=False, _request_timeout=(1, 2))
+
+        default_timeout, explicit_timeout = [call.kwargs["timeout"] for call in request.call_args_list]
+        assert default_timeout is configuration.timeout
+        assert (explicit_timeout.connect_timeout, explicit_timeout.read_timeout) == (1, 2)
+
+
+class TestRequestCompression:
+    @pytest.fixture
+    def rest_client(self, mocker):
+        rest_client = RESTClientObject(_get_configuration(request_compression_threshold=100))
+        mocker.patch.object(rest_client.pool_manager, "request").return_value.status = 200
+        return rest_client
+
+    @staticmethod
+    def _sent(rest_client):
+        return rest_client.pool_manager.request.call_args.kwargs
+
+    def test_small_body_is_sent_as_is(self, rest_client):
+        rest_client.request("POST", "https://tms.example/api", body={"a": 1}, _preload_content=False)
+
+        assert json.loads(self._sent(rest_client)["body"]) == {"a": 1}
+        assert "Content-Encoding" not in self._sent(rest_client)["headers"]
+
+    def test_large_body_is_gzip_compressed(self, rest_client):
+        body = [{"title": "step", "outcome": "Passed"}] * 50
+
+        rest_client.request("POST", "https://tms.example/api", body=body, _preload_content=False)
+
+        assert self._sent(rest_client)["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(self._sent(rest_client)["body"])) == body
+
+    def test_unsupported_compression_falls_back_to_plain_body(self, rest_client):
+        rest_client.pool_manager.request.side_effect = [
+            _response(415), _response(200), _response(200)]
+        body = [{"title": "step"}] * 50
+
+        rest_client.request("POST", "https://tms.example/api", body=body, _preload_content=False)
+        rest_client.request("POST", "https://tms.example/api", body=body, _preload_content=False)
+
+        sent = [call.kwargs for call in rest_client.pool_manager.request.call_args_list]
+        assert ["Content-Encoding" in request["headers"] for request in sent] == [True, False, False]
+        assert json.loads(sent[1]["body"]) == body
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+import urllib3
+
+from adapters_api.models import AttachmentPutModel
+
+from testit_python_commons.client.helpers.attachment_uploader import AttachmentUploader
+
+
+class TestAttachmentUploader:
+    @staticmethod
+    def _files(tmp_path, contents):
+        paths = []
+        for index, content in enumerate(contents):
+            path = tmp_path / f"file-{index}.txt"
+            path.write_text(content)
+            paths.append(str(path))
+        return paths
+
+    def test_upload_keeps_input_order_with_parallel_uploads(self, tmp_path):
+        paths = self._files(tmp_path, [f"content-{index}" for index in range(8)])
+        threads = set()
+
+        def upload_file(path):
+            threads.add(threading.current_thread().name)
+            return AttachmentPutModel(f"id-{path.rsplit('-', 1)[-1]}")
+
+        uploader = AttachmentUploader(upload_file, threads=4)
+
+        attachments = uploader.upload(paths)
+
+        assert [attachment.id for attachment in attachments] == [f"id-{index}.txt" for index in range(8)]
+        assert all(name.startswith("testit-attachment-upload") for name in threads)
+
+    def test_identical_content_is_uploaded_once_per_run(self, tmp_path, mocker):
+        first, other = self._files(tmp_path, ["screenshot", "log"])
+        (tmp_path / "copy").mkdir()
+        duplicate = str(tmp_path / "copy" / "file-0.txt")
+        (tmp_path / "copy" / "file-0.txt").write_text("screenshot")
+        upload_file = mocker.Mock(side_effect=lambda path: AttachmentPutModel(f"id-{path}"))
+        uploader = AttachmentUploader(upload_file, threads=2)
+
+        attachments = uploader.upload([first, duplicate])
+        attachments += uploader.upload([duplicate, other])
+
+        assert [attachment.id for attachment in attachments] == \
+            [f"id-{first}", f"id-{first}", f"id-{first}", f"id-{other}"]
+        assert upload_file.call_count == 2
+        assert uploader.get_cached_count() == 2
+
+    def test_identical_content_with_other_name_is_uploaded_again(self, tmp_path, mocker):
+        first, renamed = self._files(tmp_path, ["screenshot", "screenshot"])
+        upload_file = mocker.Mock(side_effect=lambda path: AttachmentPutModel(f"id-{path}"))
+        uploader = AttachmentUploader(upload_file)
+
+        attachments = uploader.upload([first, renamed])
+
+        assert [attachment.id for attachment in attachments] == [f"id-{first}", f"id-{renamed}"]
+        assert upload_file.call_count == 2
+
+    def test_missing_and_failed_files_are_skipped(self, tmp_path, mocker):
+        good, bad = self._files(tmp_path, ["good", "bad"])
+
+        def upload_file(path):
+            if path == bad:
+                raise ValueError("rejected")
+            return AttachmentPutModel("id-good")
+
+        uploader = AttachmentUploader(upload_file, threads=2)
+
+        attachments = uploader.upload([str(tmp_path / "missing.txt"), bad, good])
+
+        assert [attachment.id for attachment in attachments] == ["id-good"]
+
+    def test_connection_errors_are_raised(self, tmp_path):
+        [path] = self._files(tmp_path, ["content"])
+
+        def upload_file(path):
+            raise urllib3.exceptions.ProtocolError("connection aborted")
+
+        with pytest.raises(urllib3.exceptions.ProtocolError):
+            AttachmentUploader(upload_file).upload([path])
@@ -0,0 +1,93 @@
+from adapters_api.models import AutoTestStepApiModel, AutoTestUpdateApiModel
+
+from testit_python_commons.client.helpers.autotest_fingerprint_cache import AutotestFingerprintCache
+from testit_python_commons.client.helpers.bulk_autotest_helper import BulkAutotestHelper
+
+
+def _update_model(external_id="ext-1", title="step"):
+    return AutoTestUpdateApiModel(
+        external_id=external_id,
+        project_id="proj",
+        name="name",
+        reset_layer=False,
+        steps=[AutoTestStepApiModel(title=title)])
+
+
+class TestAutotestFingerprintCache:
+    def test_fingerprint_depends_on_model_content(self):
+        fingerprint = AutotestFingerprintCache.get_fingerprint(_update_model())
+
+        assert fingerprint == AutotestFingerprintCache.get_fingerprint(_update_model())
+        assert fingerprint != AutotestFingerprintCache.get_fingerprint(_update_model(title="other"))
+
+    def test_fingerprint_tells_escaped_text_from_plain_text(self):
+        fingerprint = AutotestFingerprintCache.get_fingerprint(_update_model(title="a < b"))
+
+        assert fingerprint != AutotestFingerprintCache.get_fingerprint(_update_model(title="a &lt; b"))
+
+    def test_update_is_shared_between_processes_by_url_and_project(self, tmp_path):
+        fingerprint = AutotestFingerprintCache.get_fingerprint(_update_model())
+        AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path)).update({"ext-1": fingerprint})
+
+        assert AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path)).is_unchanged("ext-1", fingerprint)
+        assert not AutotestFingerprintCache("https://a", "other", 60, str(tmp_path)).is_unchanged(
+            "ext-1", fingerprint)
+        assert not AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path)).is_unchanged("ext-1", "changed")
+
+    def test_update_keeps_entries_of_other_processes(self, tmp_path):
+        first = AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path))
+        second = AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path))
+        first.is_unchanged("ext-1", "f1")
+
+        second.update({"ext-2": "f2"})
+        first.update({"ext-1": "f1"})
+
+        reloaded = AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path))
+        assert reloaded.is_unchanged("ext-1", "f1")
+        assert reloaded.is_unchanged("ext-2", "f2")
+
+    def test_expired_entry_is_changed(self, tmp_path, mocker):
+        cache = AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path))
+        cache.update({"ext-1": "f1"})
+        mocker.patch(
+            "testit_python_commons.client.helpers.autotest_fingerprint_cache.time.time",
+            return_value=10 ** 12,
+        )
+
+        assert not cache.is_unchanged("ext-1", "f1")
+
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        cache = AutotestFingerprintCache("https://a", "proj", 0, str(tmp_path))
+        cache.update({"ext-1": "f1"})
+
+        assert not cache.is_unchanged("ext-1", "f1")
+        assert not list(tmp_path.iterdir())
+
+
+class TestBulkAutotestHelperSkipsUnchanged:
+    def test_unchanged_autotests_are_not_sent_but_results_are(self, mocker, tmp_path):
+        config = mocker.Mock()
+        config.get_test_run_id.return_value = "run-1"
+        config.get_automatic_updation_links_to_test_cases.return_value = False
+        config.get_upload_threads.return_value = 1
+        mocker.patch(
+            "testit_python_commons.client.helpers.bulk_autotest_helper.HtmlEscapeUtils.escape_html_in_object",
+            side_effect=lambda obj: obj,
+        )
+        autotests_api = mocker.Mock()
+        autotests_api.adapters_auto_tests_id_work_items_get.return_value = []
+        test_runs_api = mocker.Mock()
+        cache = AutotestFingerprintCache("https://a", "proj", 60, str(tmp_path))
+
+        for expected_put in (True, False):
+            autotests_api.adapters_auto_tests_bulk_put.reset_mock()
+            test_runs_api.adapters_test_runs_id_test_results_post.reset_mock()
+
+            helper = BulkAutotestHelper(autotests_api, test_runs_api, config, fingerprint_cache=cache)
+            helper.add_for_update(_update_model(), mocker.Mock(auto_test_external_id="ext-1"), {"at-1": []})
+            helper.teardown()
+
+            assert autotests_api.adapters_auto_tests_bulk_put.called is expected_put
+            test_runs_api.adapters_test_runs_id_test_results_post.assert_called_once()
+
+        assert helper.get_upload_statistics()["skipped_autotests"] == 1
@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from testit_python_commons.client.helpers.bulk_autotest_helper import BulkAutotestHelper
+
+
+class TestBulkAutotestHelperUpload:
+    @pytest.fixture
+    def config(self, mocker):
+        config = mocker.Mock()
+        config.get_test_run_id.return_value = "run-1"
+        config.get_automatic_updation_links_to_test_cases.return_value = False
+        config.get_upload_threads.return_value = 1
+        return config
+
+    @pytest.fixture(autouse=True)
+    def no_escape(self, mocker):
+        mocker.patch(
+            "testit_python_commons.client.helpers.bulk_autotest_helper.HtmlEscapeUtils.escape_html_in_object",
+            side_effect=lambda obj: obj,
+        )
+
+    @staticmethod
+    def _models(mocker, count):
+        create_models = [mocker.Mock(external_id=f"ext-{i}") for i in range(count)]
+        result_models = [mocker.Mock(auto_test_external_id=f"ext-{i}") for i in range(count)]
+        return create_models, result_models
+
+    def test_sequential_upload_sends_results_after_autotests(self, mocker, config):
+        events = []
+        autotests_api = mocker.Mock()
+        autotests_api.adapters_auto_tests_bulk_post.side_effect = \
+            lambda auto_test_create_api_model: events.append(("create", len(auto_test_create_api_model)))
+        test_runs_api = mocker.Mock()
+        test_runs_api.adapters_test_runs_id_test_results_post.side_effect = \
+            lambda id, auto_test_results_for_test_run_model: events.append(
+                ("results", len(auto_test_results_for_test_run_model)))
+
+        helper = BulkAutotestHelper(autotests_api, test_runs_api, config)
+        for create_model, result_model in zip(*self._models(mocker, 150)):
+            helper.add_for_create(create_model, result_model)
+        helper.teardown()
+
+        assert events == [("create", 100), ("results", 100), ("create", 50), ("results", 50)]
+        assert helper.get_upload_statistics()["autotests"] == 150
+        assert helper.get_upload_statistics()["results"] == 150
+
+    def test_parallel_upload_keeps_per_chunk_ordering(self, mocker, config):
+        config.get_upload_threads.return_value = 4
+        created = set()
+        lock = threading.Lock()
+        violations = []
+        worker_threads = set()
+
+        def bulk_post(auto_test_create_api_model):
+            worker_threads.add(threading.current_thread().name)
+            with lock:
+                created.update(model.external_id for model in auto_test_create_api_model)
+
+        def results_post(id, auto_test_results_for_test_run_model):
+            with lock:
+                violations.extend(
+                    model.auto_test_external_id for model in auto_test_results_for_test_run_model
+                    if model.auto_test_external_id not in created)
+
+        autotests_api = mocker.Mock()
+        autotests_api.adapters_auto_tests_bulk_post.side_effect = bulk_post
+        test_runs_api = mocker.Mock()
+        test_runs_api.adapters_test_runs_id_test_results_post.side_effect = results_post
+
+        helper = BulkAutotestHelper(autotests_api, test_runs_api, config)
+        for create_model, result_model in zip(*self._models(mocker, 450)):
+            helper.add_for_create(create_model, result_model)
+        helper.teardown()
+
+        assert not violations
+        assert len(created) == 450
+        assert autotests_api.adapters_auto_tests_bulk_post.call_count == 5
+        assert all(name.startswith("testit-bulk-upload") for name in worker_threads)
+        assert helper.get_upload_statistics()["results"] == 450
+
+    def test_parallel_upload_propagates_errors(self, mocker, config):
+        config.get_upload_threads.return_value = 2
+        autotests_api = mocker.Mock()
+        autotests_api.adapters_auto_tests_bulk_post.side_effect = RuntimeError("boom")
+
+        helper = BulkAutotestHelper(autotests_api, mocker.Mock(), config)
+        create_models, result_models = self._models(mocker, 1)
+        helper.add_for_create(create_models[0], result_models[0])
+
+        with pytest.raises(RuntimeError):
+            helper.teardown()
+
+    def test_sent_results_are_reported_before_upload_fails(self, mocker, config):
+        test_runs_api = mocker.Mock()
+        test_runs_api.adapters_test_runs_id_test_results_post.side_effect = [None, RuntimeError("boom")]
+        sent = []
+
+        helper = BulkAutotestHelper(mocker.Mock(), test_runs_api, config, on_results_sent=sent.extend)
+        create_models, result_models = self._models(mocker, 150)
+        for create_model, result_model in zip(create_models, result_models):
+            helper.add_for_create(create_model, result_model)
+
+        with pytest.raises(RuntimeError):
+            helper.teardown()
+
+        assert sent == result_models[:100]
@@ -0,0 +1,108 @@
+import io
+import json
+
+import pytest
+import urllib3
+
+from testit_python_commons.client.api_client import ApiClientWorker
+from testit_python_commons.client.helpers.multipart_body import MultipartFileBody
+from testit_python_commons.services.retry import RetryPolicy, set_retry_policy
+
+ATTACHMENT = {
+    "id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    "fileId": "file-1",
+    "type": "text/plain",
+    "size": 4.0,
+    "createdDate": "2026-01-01T00:00:00Z",
+    "createdById": "3fa85f64-5717-4562-b3fc-2c963f66afa7",
+    "name": "log.txt",
+}
+
+
+class _Pipe(io.RawIOBase):
+    def __init__(self, data: bytes):
+        self.__data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        return self.__data.readinto(buffer)
+
+
+def _response(body: bytes, status: int = 200):
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers={"Content-Type": "application/json"},
+        preload_content=True)
+
+
+@pytest.fixture(autouse=True)
+def policy():
+    set_retry_policy(RetryPolicy(base_delay_sec=0))
+    yield
+    set_retry_policy(RetryPolicy())
+
+
+@pytest.fixture
+def worker(mocker):
+    config = mocker.Mock()
+    config.get_url.return_value = "https://tms.example"
+    config.get_private_token.return_value = "token"
+    config.get_proxy.return_value = None
+    config.get_connection_pool_size.return_value = 0
+    config.get_upload_threads.return_value = 1
+    config.get_connect_timeout.return_value = 0
+    config.get_read_timeout.return_value = 0
+    config.is_tcp_keep_alive.return_value = False
+    config.is_http_compression.return_value = False
+    config.get_request_compression_threshold.return_value = 0
+
+    return ApiClientWorker(config)
+
+
+@pytest.fixture
+def request_mock(worker, mocker):
+    api_client = worker._ApiClientWorker__attachments_api.api_client
+    return mocker.patch.object(api_client.rest_client.pool_manager, "request")
+
+
+def test_attachment_is_sent_through_generated_client(worker, request_mock):
+    request_mock.return_value = _response(json.dumps(ATTACHMENT).encode("utf-8"))
+
+    [attachment] = worker.create_attachment(b"data", "log.txt")
+
+    assert attachment.id == ATTACHMENT["id"]
+    method, url = request_mock.call_args.args
+    headers = request_mock.call_args.kwargs["headers"]
+    assert (method, url) == ("POST", "https://tms.example/adapters/attachments")
+    assert headers["Authorization"] == "PrivateToken token"
+    assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert isinstance(request_mock.call_args.kwargs["body"], MultipartFileBody)
+
+
+def test_seekable_stream_is_rewound_when_upload_is_retried(worker, request_mock):
+    sent = []
+
+    def request(method, url, body=None, **kwargs):
+        sent.append(body.read())
+        if len(sent) == 1:
+            raise urllib3.exceptions.ProtocolError("Connection aborted.")
+        return _response(json.dumps(ATTACHMENT).encode("utf-8"))
+
+    request_mock.side_effect = request
+    stream = io.BytesIO(b"data")
+
+    assert len(worker.create_attachment(stream, "log.txt")) == 1
+    assert len(sent) == 2
+    assert all(b"\r\n\r\ndata\r\n" in body for body in sent)
+
+
+def test_non_seekable_stream_is_not_retried(worker, request_mock):
+    request_mock.side_effect = urllib3.exceptions.ProtocolError("Connection aborted.")
+
+    with pytest.raises(urllib3.exceptions.ProtocolError):
+        worker.create_attachment(_Pipe(b"data"), "log.txt")
+
+    assert request_mock.call_count == 1
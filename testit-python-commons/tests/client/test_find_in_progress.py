@@ -1,6 +1,8 @@
 import pytest
+from adapters_api.models import TestStatusApiType
 
 from testit_python_commons.client.api_client import ApiClientWorker
+from testit_python_commons.client.helpers.in_progress_index import InProgressTestResultIndex
 from testit_python_commons.client.helpers.test_result_matching import (
     normalize_parameters,
     parameters_empty,
@@ -184,3 +186,116 @@ class TestFindInProgressAndUpdate:
         worker.find_in_progress_test_result_id.assert_called_once_with("ext-1", {"x": "1"})
         update.assert_called_once()
         create_post.assert_not_called()
+
+    def test_find_loads_in_progress_results_once(self, worker, mocker):
+        results = [
+            mocker.Mock(id=f"res-{i}", autotest_external_id=f"ext-{i}") for i in range(3)
+        ]
+        get_test_results = mocker.patch.object(
+            worker,
+            "_ApiClientWorker__get_test_results",
+            return_value=results,
+        )
+        get_by_id = mocker.patch.object(
+            worker,
+            "get_test_result_by_id",
+            return_value=mocker.Mock(test_point_id="tp", parameters={}),
+        )
+
+        found = [worker.find_in_progress_test_result_id(f"ext-{i}") for i in range(3)]
+
+        assert found == ["res-0", "res-1", "res-2"]
+        get_test_results.assert_called_once()
+        assert get_by_id.call_count == 3
+
+    def test_result_finished_by_another_process_is_not_overwritten(self, worker, mocker):
+        mocker.patch.object(
+            worker,
+            "_ApiClientWorker__get_test_results",
+            return_value=[
+                mocker.Mock(id="res-a", autotest_external_id="ext-1"),
+                mocker.Mock(id="res-b", autotest_external_id="ext-1"),
+            ],
+        )
+        statuses = {"res-a": ["InProgress", "Succeeded"], "res-b": ["InProgress", "InProgress"]}
+        mocker.patch.object(
+            worker,
+            "get_test_result_by_id",
+            side_effect=lambda rid: mocker.Mock(
+                test_point_id="tp",
+                parameters={},
+                status=mocker.Mock(type=TestStatusApiType(statuses[rid].pop(0)))),
+        )
+        mocker.patch(
+            "testit_python_commons.client.api_client.Converter.convert_test_result_model_to_test_results_id_put_request")
+        put = worker._ApiClientWorker__test_results_api.adapters_test_results_id_put
+        test_result = mocker.Mock()
+        test_result.get_external_id.return_value = "ext-1"
+        test_result.get_parameters.return_value = {}
+        test_result.get_outcome.return_value = None
+        test_result.get_duration.return_value = None
+        test_result.get_message.return_value = None
+        test_result.get_traces.return_value = None
+
+        assert worker._ApiClientWorker__load_test_result(test_result) == "res-b"
+        assert [call.kwargs["id"] for call in put.call_args_list] == ["res-b"]
+
+
+class TestInProgressTestResultIndex:
+    def test_claimed_results_are_removed(self, mocker):
+        index = InProgressTestResultIndex(
+            lambda: [mocker.Mock(id="res-a", autotest_external_id="ext-1")],
+            lambda result_id: {"has_test_point": True, "parameters": {}},
+            refresh_interval_sec=3600,
+        )
+
+        assert index.claim("ext-1") == "res-a"
+        assert index.claim("ext-1") is None
+
+    def test_results_no_longer_in_progress_are_dropped(self, mocker):
+        index = InProgressTestResultIndex(
+            lambda: [
+                mocker.Mock(id="res-a", autotest_external_id="ext-1"),
+                mocker.Mock(id="res-b", autotest_external_id="ext-1"),
+            ],
+            lambda result_id: {"has_test_point": True, "parameters": {}, "in_progress": result_id == "res-b"},
+            refresh_interval_sec=3600,
+        )
+
+        assert index.claim("ext-1") == "res-b"
+        assert index.claim("ext-1") is None
+
+    def test_results_are_described_without_holding_the_lock(self, mocker):
+        index = None
+
+        def describe(result_id):
+            assert not index._InProgressTestResultIndex__lock.locked()
+            return {"has_test_point": True, "parameters": {}}
+
+        index = InProgressTestResultIndex(
+            lambda: [mocker.Mock(id="res-a", autotest_external_id="ext-1")],
+            describe,
+            refresh_interval_sec=3600,
+        )
+
+        assert index.claim("ext-1") == "res-a"
+
+    def test_refreshes_on_miss_without_readding_known_results(self, mocker):
+        pages = [
+            [mocker.Mock(id="res-a", autotest_external_id="ext-1")],
+            [
+                mocker.Mock(id="res-a", autotest_external_id="ext-1"),
+                mocker.Mock(id="res-b", autotest_external_id="ext-2"),
+            ],
+        ]
+        load = mocker.Mock(side_effect=pages + [[]])
+        index = InProgressTestResultIndex(
+            load,
+            lambda result_id: {"has_test_point": True, "parameters": {}},
+            refresh_interval_sec=0,
+        )
+
+        assert index.claim("ext-1") == "res-a"
+        assert index.claim("ext-2") == "res-b"
+        assert index.claim("ext-1") is None
+        assert load.call_count == 3
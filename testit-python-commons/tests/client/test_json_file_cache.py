@@ -0,0 +1,37 @@
+import time
+
+from testit_python_commons.client.helpers.json_file_cache import JsonFileCache
+
+
+class TestJsonFileCache:
+    def test_written_entries_are_read_back(self, tmp_path):
+        cache = JsonFileCache("testit_cache.json", "test", str(tmp_path))
+
+        cache.write({"key": {"value": 1}})
+
+        assert JsonFileCache("testit_cache.json", "test", str(tmp_path)).read() == {"key": {"value": 1}}
+        assert [path.name for path in tmp_path.iterdir()] == ["testit_cache.json"]
+
+    def test_missing_or_corrupt_file_reads_as_empty(self, tmp_path):
+        cache = JsonFileCache("testit_cache.json", "test", str(tmp_path))
+        assert cache.read() == {}
+
+        (tmp_path / "testit_cache.json").write_text("[1, 2", encoding="utf-8")
+        assert cache.read() == {}
+
+        (tmp_path / "testit_cache.json").write_text("[1, 2]", encoding="utf-8")
+        assert cache.read() == {}
+
+    def test_failed_write_keeps_previous_file_and_removes_temporary_file(self, tmp_path):
+        cache = JsonFileCache("testit_cache.json", "test", str(tmp_path))
+        cache.write({"key": 1})
+
+        cache.write({"key": object()})
+
+        assert cache.read() == {"key": 1}
+        assert [path.name for path in tmp_path.iterdir()] == ["testit_cache.json"]
+
+    def test_is_fresh(self):
+        assert JsonFileCache.is_fresh(time.time() - 10, 60)
+        assert not JsonFileCache.is_fresh(time.time() - 120, 60)
+        assert not JsonFileCache.is_fresh(None, 60)
@@ -0,0 +1,74 @@
+import json
+from datetime import datetime
+
+import pytest
+from adapters_api import ApiClient
+from adapters_api.serializer import JsonSerializer
+
+from testit_python_commons.client.converter import Converter
+from testit_python_commons.models.link import Link
+from testit_python_commons.models.link_type import LinkType
+from testit_python_commons.models.step_result import StepResult
+from testit_python_commons.models.test_result import TestResult
+
+
+def _test_result() -> TestResult:
+    step = StepResult()
+    step.set_title("outer <step>")
+    step.set_outcome("Passed")
+    step.set_duration(5)
+    step.set_started_on(datetime(2024, 1, 1, 12, 0, 0, 123456))
+    step.set_parameters({"key": "значение"})
+    nested = StepResult()
+    nested.set_title("inner")
+    nested.set_outcome("Failed")
+    step.set_step_results([nested])
+
+    test_result = TestResult()
+    test_result.set_external_id("ext-1")
+    test_result.set_autotest_name("name")
+    test_result.set_outcome("Failed")
+    test_result.set_status_type("Failed")
+    test_result.set_duration(10)
+    test_result.set_traces("Traceback\n  line")
+    test_result.set_step_results([step])
+    test_result.set_setup_results([])
+    test_result.set_teardown_results([])
+    test_result.set_links([Link().set_url("https://a").set_link_type(LinkType.ISSUE)])
+    test_result.set_result_links([Link().set_url("https://b").set_link_type(LinkType.DEFECT)])
+    test_result.set_attachments([])
+    test_result.set_parameters({"p": "1"})
+    test_result.set_properties({})
+    test_result.set_labels([])
+    test_result.set_tags(["tag"])
+    test_result.set_started_on(datetime(2024, 1, 1, 12, 0, 0))
+
+    return test_result
+
+
+def _payloads():
+    test_result = _test_result()
+    autotest = type("AutoTest", (), {"is_flaky": False})()
+
+    return [
+        [Converter.test_result_to_testrun_result_post_model(test_result, "cfg", ["FAILED"])],
+        Converter.prepare_to_update_autotest(test_result, autotest, "proj"),
+        [Converter.prepare_to_mass_update_autotest(test_result, autotest, "proj")],
+        {"plain": [1, 2.5, None, True, "x"]},
+    ]
+
+
+class TestJsonSerializer:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("payload", _payloads())
+    def test_same_json_as_generated_client(self, payload, use_orjson):
+        serializer = JsonSerializer(use_orjson=use_orjson)
+        expected = ApiClient.sanitize_for_serialization(payload)
+
+        sanitized = serializer.sanitize(payload)
+
+        assert sanitized == expected
+        assert json.loads(serializer.dumps(sanitized)) == json.loads(json.dumps(expected))
+
+    def test_falls_back_to_json_for_values_orjson_rejects(self):
+        assert json.loads(JsonSerializer().dumps({1: 2 ** 70})) == {"1": 2 ** 70}
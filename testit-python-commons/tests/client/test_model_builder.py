@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+from adapters_api.exceptions import ApiAttributeError, ApiTypeError, ApiValueError
+from adapters_api.models import (
+    AttachmentPutModelAutoTestStepResultsModel,
+    AutoTestStepApiModel,
+    AvailableTestResultOutcome,
+)
+
+from testit_python_commons.client.helpers.model_builder import ModelBuilder
+
+
+def _fields(**overrides):
+    fields = dict(
+        title="step",
+        outcome=AvailableTestResultOutcome("Passed"),
+        description=None,
+        duration=5,
+        parameters={"key": "value"},
+        attachments=[],
+        started_on=datetime(2024, 1, 1),
+        completed_on=None,
+        step_results=[AttachmentPutModelAutoTestStepResultsModel(title="inner")])
+    fields.update(overrides)
+    return fields
+
+
+class TestModelBuilder:
+    def test_built_model_equals_constructed_model(self):
+        built = ModelBuilder.build(AttachmentPutModelAutoTestStepResultsModel, **_fields())
+
+        assert built == AttachmentPutModelAutoTestStepResultsModel(**_fields())
+        assert built.to_dict() == AttachmentPutModelAutoTestStepResultsModel(**_fields()).to_dict()
+
+    def test_schema_validations_are_kept(self):
+        with pytest.raises(ApiValueError):
+            ModelBuilder.build(AttachmentPutModelAutoTestStepResultsModel, **_fields(duration=-1))
+        with pytest.raises(ApiValueError):
+            ModelBuilder.build(AutoTestStepApiModel, title="")
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ApiAttributeError):
+            ModelBuilder.build(AutoTestStepApiModel, title="step", unknown="value")
+
+    def test_later_assignments_are_type_checked(self):
+        model = ModelBuilder.build(AutoTestStepApiModel, title="step")
+
+        with pytest.raises(ApiTypeError):
+            model.title = 1
+
+    def test_simple_models_are_validated_once_and_shared(self):
+        first = ModelBuilder.simple(AvailableTestResultOutcome, "Passed")
+
+        assert first is ModelBuilder.simple(AvailableTestResultOutcome, "Passed")
+        assert first == AvailableTestResultOutcome("Passed")
+        with pytest.raises(ApiValueError):
+            ModelBuilder.simple(AvailableTestResultOutcome, "Unknown")
@@ -0,0 +1,61 @@
+import io
+
+from testit_python_commons.client.helpers.multipart_body import MultipartFileBody
+
+
+class TestMultipartFileBody:
+    @staticmethod
+    def _read(body, size):
+        chunks = []
+        while True:
+            chunk = body.read(size)
+            if not chunk:
+                return b"".join(chunks), chunks
+            chunks.append(chunk)
+
+    def test_bytes_body_is_encoded_as_single_file_field(self):
+        body = MultipartFileBody("file", "report.json", b'{"ok": true}')
+        boundary = body.content_type.split("boundary=")[1]
+
+        data, _ = self._read(body, 7)
+
+        assert body.content_type.startswith("multipart/form-data; boundary=")
+        assert data == (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="report.json"\r\n'
+            f"Content-Type: application/json\r\n\r\n"
+            '{"ok": true}'
+            f"\r\n--{boundary}--\r\n").encode("utf-8")
+        assert body.content_length == len(data)
+
+    def test_stream_body_is_read_in_bounded_chunks(self):
+        payload = b"x" * 100000
+        stream = io.BytesIO(payload)
+        stream.seek(10)
+        body = MultipartFileBody("file", "video.bin", stream)
+
+        data, chunks = self._read(body, 4096)
+
+        assert max(len(chunk) for chunk in chunks) <= 4096
+        assert payload[10:] in data
+        assert payload not in data
+        assert body.content_length == len(data)
+
+    def test_non_seekable_stream_has_unknown_length(self):
+        class Pipe(io.RawIOBase):
+            def __init__(self):
+                self.__data = io.BytesIO(b"data")
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                return self.__data.readinto(buffer)
+
+        body = MultipartFileBody("file", 'my "log".txt', Pipe())
+
+        data, _ = self._read(body, 1024)
+
+        assert body.content_length is None
+        assert b'filename="my \\"log\\".txt"' in data
+        assert b"\r\n\r\ndata\r\n" in data
@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from testit_python_commons.client.api_client import ApiClientWorker
+from testit_python_commons.client.helpers.paginator import iterate_pages
+
+
+def _loader(total, requests, max_take=None):
+    def load_page(skip, take):
+        requests.append(skip)
+        return list(range(skip, min(skip + min(take, max_take or take), total)))
+
+    return load_page
+
+
+class TestIteratePages:
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_short_page_ends_iteration(self, prefetch):
+        requests = []
+
+        pages = list(iterate_pages(_loader(25, requests), 10, prefetch))
+
+        assert pages == [list(range(0, 10)), list(range(10, 20)), list(range(20, 25))]
+        assert requests == [0, 10, 20]
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_empty_page_after_full_pages_is_not_yielded(self, prefetch):
+        requests = []
+
+        pages = list(iterate_pages(_loader(20, requests), 10, prefetch))
+
+        assert pages == [list(range(0, 10)), list(range(10, 20))]
+        assert requests == [0, 10, 20]
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_pages_capped_by_server_are_read_until_empty_page(self, prefetch):
+        requests = []
+
+        pages = list(iterate_pages(_loader(25, requests, max_take=10), 100, prefetch, short_page_is_last=False))
+
+        assert pages == [list(range(0, 10)), list(range(10, 20)), list(range(20, 25))]
+        assert requests == [0, 10, 20, 25]
+
+    def test_next_page_is_loaded_while_current_page_is_processed(self):
+        second_page_requested = threading.Event()
+
+        def load_page(skip, take):
+            if skip:
+                second_page_requested.set()
+                return []
+            return list(range(take))
+
+        pages = iterate_pages(load_page, 10)
+        next(pages)
+
+        assert second_page_requested.wait(5)
+        assert list(pages) == []
+
+    def test_errors_of_prefetched_page_are_raised(self):
+        def load_page(skip, take):
+            if skip:
+                raise ValueError("page failed")
+            return list(range(take))
+
+        pages = iterate_pages(load_page, 10)
+        next(pages)
+
+        with pytest.raises(ValueError, match="page failed"):
+            next(pages)
+
+
+class TestExternalIdsForTestRun:
+    @pytest.fixture
+    def worker(self, mocker):
+        mocker.patch.object(ApiClientWorker, "_ApiClientWorker__get_api_client_configuration")
+        mocker.patch.object(ApiClientWorker, "_ApiClientWorker__get_api_client")
+        mocker.patch("testit_python_commons.client.api_client.TestRunsApi")
+        mocker.patch("testit_python_commons.client.api_client.AutoTestsApi")
+        mocker.patch("testit_python_commons.client.api_client.AttachmentsApi")
+        mocker.patch("testit_python_commons.client.api_client.TestResultsApi")
+        mocker.patch("testit_python_commons.client.api_client.WorkItemsApi")
+        mocker.patch("testit_python_commons.client.api_client.ProjectsApi")
+        mocker.patch("testit_python_commons.client.api_client.WorkflowsApi")
+
+        config = mocker.Mock()
+        config.get_test_run_id.return_value = "run-1"
+        config.get_configuration_id.return_value = "cfg-1"
+        config.get_test_results_page_size.return_value = 2
+
+        return ApiClientWorker(config)
+
+    def test_external_ids_of_configuration_are_collected_from_all_pages(self, worker, mocker):
+        search = worker._ApiClientWorker__test_results_api.adapters_test_results_search_post
+        search.side_effect = [
+            [mocker.Mock(autotest_external_id="ext-1", configuration_id="cfg-1"),
+             mocker.Mock(autotest_external_id="ext-2", configuration_id="cfg-2")],
+            [mocker.Mock(autotest_external_id="ext-1", configuration_id="cfg-1")],
+        ]
+
+        external_ids = worker.get_external_ids_for_test_run_id()
+
+        assert external_ids == ["ext-1"]
+        assert [call.kwargs["skip"] for call in search.call_args_list] == [0, 2]
+        assert all(call.kwargs["take"] == 2 for call in search.call_args_list)
+
+    def test_page_size_above_server_limit_does_not_drop_results(self, worker, mocker):
+        worker._ApiClientWorker__config.get_test_results_page_size.return_value = 500
+        results = [mocker.Mock(autotest_external_id=f"ext-{index}", configuration_id="cfg-1") for index in range(250)]
+        search = worker._ApiClientWorker__test_results_api.adapters_test_results_search_post
+        search.side_effect = lambda skip, take, **kwargs: results[skip:skip + min(take, 100)]
+
+        external_ids = worker.get_external_ids_for_test_run_id()
+
+        assert sorted(external_ids) == sorted(f"ext-{index}" for index in range(250))
+        assert [call.kwargs["skip"] for call in search.call_args_list] == [0, 100, 200, 250]
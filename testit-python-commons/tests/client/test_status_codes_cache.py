@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from testit_python_commons.client.api_client import ApiClientWorker
+from testit_python_commons.client.helpers.status_codes_cache import StatusCodesCache
+
+
+class TestStatusCodesCache:
+    def test_set_and_get_by_url_and_project(self, tmp_path):
+        StatusCodesCache("https://a", "proj", 60, str(tmp_path)).set(["PASSED", "FAILED"])
+
+        assert StatusCodesCache("https://a", "proj", 60, str(tmp_path)).get() == ["PASSED", "FAILED"]
+        assert StatusCodesCache("https://b", "proj", 60, str(tmp_path)).get() is None
+        assert StatusCodesCache("https://a", "other", 60, str(tmp_path)).get() is None
+
+    def test_expired_entry_is_ignored(self, tmp_path, mocker):
+        cache = StatusCodesCache("https://a", "proj", 60, str(tmp_path))
+        cache.set(["PASSED"])
+        mocker.patch(
+            "testit_python_commons.client.helpers.status_codes_cache.time.time",
+            return_value=10 ** 12,
+        )
+
+        assert cache.get() is None
+
+    def test_invalidate_removes_only_own_entry(self, tmp_path):
+        own = StatusCodesCache("https://a", "proj", 60, str(tmp_path))
+        other = StatusCodesCache("https://a", "other", 60, str(tmp_path))
+        own.set(["PASSED"])
+        other.set(["FAILED"])
+
+        own.invalidate()
+
+        assert own.get() is None
+        assert other.get() == ["FAILED"]
+
+    def test_zero_ttl_disables_cache(self, tmp_path):
+        cache = StatusCodesCache("https://a", "proj", 0, str(tmp_path))
+        cache.set(["PASSED"])
+
+        assert cache.get() is None
+        assert not list(tmp_path.iterdir())
+
+    def test_corrupted_file_is_ignored(self, tmp_path):
+        (tmp_path / "testit_status_codes.json").write_text("{not json")
+
+        assert StatusCodesCache("https://a", "proj", 60, str(tmp_path)).get() is None
+
+
+class TestApiClientWorkerStatusCodes:
+    @pytest.fixture
+    def worker(self, mocker, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        for api in ("TestRunsApi", "AutoTestsApi", "AttachmentsApi", "TestResultsApi",
+                    "WorkItemsApi", "ProjectsApi", "WorkflowsApi"):
+            mocker.patch(f"testit_python_commons.client.api_client.{api}")
+        mocker.patch.object(ApiClientWorker, "_ApiClientWorker__get_api_client_configuration")
+        mocker.patch.object(ApiClientWorker, "_ApiClientWorker__get_api_client")
+
+        config = mocker.Mock()
+        config.get_url.return_value = "https://tms.example"
+        config.get_project_id.return_value = "proj"
+        config.get_status_codes_cache_ttl.return_value = 600
+        return ApiClientWorker(config)
+
+    @staticmethod
+    def _workflow(mocker, worker, codes):
+        worker._ApiClientWorker__projects_api.adapters_projects_id_get.return_value = mocker.Mock(workflow_id="wf")
+        worker._ApiClientWorker__workflows_api.adapters_workflows_id_get.return_value = mocker.Mock(
+            statuses=[mocker.Mock(code=code) for code in codes])
+
+    def test_status_codes_are_resolved_lazily_and_cached_on_disk(self, worker, mocker, tmp_path):
+        self._workflow(mocker, worker, ["PASSED", "FAILED"])
+        projects_get = worker._ApiClientWorker__projects_api.adapters_projects_id_get
+
+        projects_get.assert_not_called()
+        assert worker._ApiClientWorker__get_cached_status_codes() == ["PASSED", "FAILED"]
+        assert worker._ApiClientWorker__get_cached_status_codes() == ["PASSED", "FAILED"]
+        projects_get.assert_called_once()
+
+        cache_file = tmp_path / "build" / ".caches" / "testit_status_codes.json"
+        assert json.loads(cache_file.read_text())["https://tms.example|proj"]["status_codes"] == ["PASSED", "FAILED"]
+
+    def test_invalidate_status_codes_fetches_again(self, worker, mocker):
+        self._workflow(mocker, worker, ["PASSED"])
+        worker._ApiClientWorker__get_cached_status_codes()
+
+        self._workflow(mocker, worker, ["PASSED", "BLOCKED"])
+        worker.invalidate_status_codes()
+
+        assert worker._ApiClientWorker__get_cached_status_codes() == ["PASSED", "BLOCKED"]
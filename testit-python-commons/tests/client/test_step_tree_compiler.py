@@ -0,0 +1,115 @@
+from adapters_api.models import (
+    AttachmentPutModelAutoTestStepResultsModel,
+    AutoTestStepApiModel,
+    AutoTestStepResultUpdateRequest,
+    AvailableTestResultOutcome,
+)
+
+from testit_python_commons.client.converter import Converter
+from testit_python_commons.client.helpers.step_tree_compiler import StepTreeCompiler
+from testit_python_commons.models.step_result import StepResult
+
+
+def _step(title, *children):
+    return (StepResult()
+            .set_title(title)
+            .set_description(f"{title} description")
+            .set_outcome("Passed")
+            .set_duration(10)
+            .set_parameters({"key": title})
+            .set_attachments([])
+            .set_step_results(list(children)))
+
+
+def _expected_autotest_step(step_result):
+    return AutoTestStepApiModel(
+        title=step_result.get_title(),
+        description=step_result.get_description(),
+        steps=[_expected_autotest_step(child) for child in step_result.get_step_results()])
+
+
+def _expected_step_result(step_result):
+    return AttachmentPutModelAutoTestStepResultsModel(
+        title=step_result.get_title(),
+        outcome=AvailableTestResultOutcome(step_result.get_outcome()),
+        description=step_result.get_description(),
+        duration=step_result.get_duration(),
+        parameters=step_result.get_parameters(),
+        attachments=step_result.get_attachments(),
+        started_on=None,
+        completed_on=None,
+        step_results=[_expected_step_result(child) for child in step_result.get_step_results()])
+
+
+class TestStepTreeCompiler:
+    def test_children_are_converted_before_parents_in_order(self):
+        built = []
+        compiler = StepTreeCompiler({"titles": lambda step, children: built.append(step.get_title()) or children})
+
+        compiler.compile([_step("a", _step("a1"), _step("a2", _step("a21"))), _step("b")])
+
+        assert built == ["a1", "a21", "a2", "a", "b"]
+
+    def test_all_targets_are_built_in_one_pass(self):
+        steps = [_step("a", _step("a1"), _step("a2"))]
+        compiler = StepTreeCompiler({
+            "titles": lambda step, children: (step.get_title(), children),
+            "sizes": lambda step, children: 1 + sum(children),
+        })
+
+        compiled = compiler.compile(steps)
+
+        assert compiled == {"titles": [("a", [("a1", []), ("a2", [])])], "sizes": [3]}
+
+    def test_shared_steps_are_converted_once(self):
+        shared = _step("fixture", _step("fixture inner"))
+        builds = []
+        compiler = StepTreeCompiler({"titles": lambda step, children: builds.append(step) or step.get_title()})
+
+        first = compiler.compile([shared, _step("test 1")])
+        second = compiler.compile([_step("test 2"), shared])
+
+        assert first["titles"] == ["fixture", "test 1"]
+        assert second["titles"] == ["test 2", "fixture"]
+        assert builds.count(shared) == 1
+
+    def test_deep_trees_do_not_hit_the_recursion_limit(self):
+        root = _step("step 0")
+        step = root
+        for depth in range(1, 5000):
+            child = _step(f"step {depth}")
+            step.set_step_results([child])
+            step = child
+
+        compiled = Converter.create_step_tree_compiler().compile([root])
+
+        autotest_step = compiled["autotest_steps"][0]
+        for _ in range(4999):
+            autotest_step = autotest_step.steps[0]
+        assert autotest_step.title == "step 4999"
+        assert autotest_step.steps == []
+
+
+class TestConverterStepTrees:
+    def test_converted_steps_match_recursive_conversion(self):
+        steps = [_step("a", _step("a1"), _step("a2", _step("a21"))), _step("b")]
+        compiler = Converter.create_step_tree_compiler()
+
+        autotest_steps = Converter.step_results_to_autotest_steps_model(steps, compiler)
+        step_results = Converter.step_results_to_attachment_put_model_autotest_step_results_model(steps, compiler)
+
+        assert autotest_steps == [_expected_autotest_step(step) for step in steps]
+        assert step_results == [_expected_step_result(step) for step in steps]
+        assert Converter.step_results_to_autotest_steps_model(steps) == autotest_steps
+        assert Converter.step_results_to_attachment_put_model_autotest_step_results_model(steps) == step_results
+
+    def test_fixture_steps_shared_by_test_results_are_reused(self):
+        fixture_steps = [_step("fixture", _step("fixture inner"))]
+        compiler = Converter.create_fixture_step_tree_compiler()
+
+        first = Converter.step_results_to_auto_test_step_result_update_request(fixture_steps, compiler)
+        second = Converter.step_results_to_auto_test_step_result_update_request(fixture_steps, compiler)
+
+        assert isinstance(first[0], AutoTestStepResultUpdateRequest)
+        assert first[0].step_results[0].title == "fixture inner"
+        assert second[0] is first[0]
@@ -0,0 +1,47 @@
+import threading
+
+from testit_python_commons.client.helpers.work_item_linker import WorkItemLinker
+
+
+class TestWorkItemLinker:
+    @staticmethod
+    def _linked(mocker, *global_ids):
+        return [mocker.Mock(global_id=int(global_id), id=f"uuid-{global_id}") for global_id in global_ids]
+
+    def test_update_links_sends_only_differences(self, mocker):
+        autotests_api = mocker.Mock()
+        autotests_api.adapters_auto_tests_id_work_items_get.side_effect = \
+            lambda id: {"at-1": self._linked(mocker, "1", "2"), "at-2": []}[id]
+        linker = WorkItemLinker(autotests_api, automatic_updation_links_to_test_cases=True)
+
+        linker.update_links({"at-1": ["1", "3"], "at-2": ["4", "4"]})
+
+        unlinked = [call.kwargs for call in autotests_api.adapters_auto_tests_id_work_items_delete.call_args_list]
+        linked = [
+            (call.kwargs["id"], call.kwargs["adapters_auto_tests_id_work_items_post_request"].id)
+            for call in autotests_api.adapters_auto_tests_id_work_items_post.call_args_list
+        ]
+        assert unlinked == [{"id": "at-1", "work_item_id": "2"}]
+        assert sorted(linked) == [("at-1", "3"), ("at-2", "4")]
+
+    def test_update_links_keeps_extra_links_without_automatic_updation(self, mocker):
+        autotests_api = mocker.Mock()
+        autotests_api.adapters_auto_tests_id_work_items_get.return_value = self._linked(mocker, "2")
+        linker = WorkItemLinker(autotests_api)
+
+        linker.update_links({"at-1": []})
+
+        autotests_api.adapters_auto_tests_id_work_items_delete.assert_not_called()
+        autotests_api.adapters_auto_tests_id_work_items_post.assert_not_called()
+
+    def test_update_links_sends_requests_concurrently(self, mocker):
+        barrier = threading.Barrier(3, timeout=5)
+        autotests_api = mocker.Mock()
+        autotests_api.adapters_auto_tests_id_work_items_get.return_value = []
+        autotests_api.adapters_auto_tests_id_work_items_post.side_effect = lambda **kwargs: barrier.wait()
+        linker = WorkItemLinker(autotests_api, threads=3)
+
+        linker.update_links({f"at-{i}": [str(i)] for i in range(3)})
+
+        assert autotests_api.adapters_auto_tests_id_work_items_post.call_count == 3
+
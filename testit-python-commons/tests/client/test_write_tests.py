@@ -0,0 +1,104 @@
+import pytest
+
+from testit_python_commons.client.api_client import ApiClientWorker
+
+
+class TestWriteTestsAutotestLookup:
+    @pytest.fixture
+    def worker(self, mocker):
+        mocker.patch.object(
+            ApiClientWorker,
+            "_ApiClientWorker__get_status_codes",
+            return_value=["PASSED", "FAILED"],
+        )
+        mocker.patch.object(ApiClientWorker, "_ApiClientWorker__get_api_client_configuration")
+        mocker.patch.object(ApiClientWorker, "_ApiClientWorker__get_api_client")
+        mocker.patch("testit_python_commons.client.api_client.TestRunsApi")
+        mocker.patch("testit_python_commons.client.api_client.AutoTestsApi")
+        mocker.patch("testit_python_commons.client.api_client.AttachmentsApi")
+        mocker.patch("testit_python_commons.client.api_client.TestResultsApi")
+        mocker.patch("testit_python_commons.client.api_client.WorkItemsApi")
+        mocker.patch("testit_python_commons.client.api_client.ProjectsApi")
+        mocker.patch("testit_python_commons.client.api_client.WorkflowsApi")
+
+        config = mocker.Mock()
+        config.get_project_id.return_value = "proj"
+        config.get_test_run_id.return_value = "run-1"
+        config.get_configuration_id.return_value = "cfg-1"
+        config.get_upload_threads.return_value = 1
+
+        return ApiClientWorker(config)
+
+    @staticmethod
+    def _search(worker):
+        return worker._ApiClientWorker__autotest_api.adapters_auto_tests_search_post
+
+    def test_lookup_deduplicates_and_indexes_by_external_id(self, worker, mocker):
+        first = mocker.Mock(external_id="ext-1")
+        duplicate = mocker.Mock(external_id="ext-1")
+        second = mocker.Mock(external_id="ext-2")
+        self._search(worker).return_value = [first, second, duplicate]
+
+        index = worker._ApiClientWorker__get_autotests_by_external_ids(["ext-1", "ext-2", "ext-1", None])
+
+        assert index == {"ext-1": first, "ext-2": second}
+        self._search(worker).assert_called_once()
+        request = self._search(worker).call_args.kwargs["adapters_auto_tests_search_post_request"]
+        assert request.filter.external_ids == ["ext-1", "ext-2"]
+
+    def test_lookup_chunks_external_ids_and_pages_until_short_page(self, worker, mocker):
+        limit = ApiClientWorker._ApiClientWorker__tests_limit
+        external_ids = [f"ext-{i}" for i in range(limit + 1)]
+        full_page = [mocker.Mock(external_id=external_id) for external_id in external_ids[:limit]]
+        self._search(worker).side_effect = [full_page, [], [mocker.Mock(external_id=external_ids[-1])]]
+
+        index = worker._ApiClientWorker__get_autotests_by_external_ids(external_ids)
+
+        assert len(index) == limit + 1
+        assert [call.kwargs["skip"] for call in self._search(worker).call_args_list] == [0, limit, 0]
+
+    def test_write_tests_splits_create_and_update_from_index(self, worker, mocker):
+        helper = mocker.patch("testit_python_commons.client.api_client.BulkAutotestHelper").return_value
+        mocker.patch("testit_python_commons.client.api_client.Converter.test_result_to_testrun_result_post_model")
+        mocker.patch("testit_python_commons.client.api_client.Converter.prepare_to_mass_update_autotest")
+        mocker.patch("testit_python_commons.client.api_client.Converter.prepare_to_mass_create_autotest")
+        link = mocker.patch.object(worker, "_ApiClientWorker__update_autotests_links_from_work_items")
+        existing = mocker.Mock(id="at-1", external_id="ext-1")
+        created = mocker.Mock(id="at-2", external_id="ext-2")
+        self._search(worker).side_effect = [[existing], [created]]
+
+        test_results = []
+        for external_id in ("ext-1", "ext-2"):
+            test_result = mocker.Mock()
+            test_result.get_external_id.return_value = external_id
+            test_result.get_work_item_ids.return_value = []
+            test_results.append(test_result)
+
+        worker.write_tests(test_results, {})
+
+        assert self._search(worker).call_count == 2
+        helper.add_for_update.assert_called_once()
+        helper.add_for_create.assert_called_once()
+        link.assert_called_once_with({"at-2": []})
+
+    def test_write_tests_reports_sent_test_results(self, worker, mocker):
+        helper_class = mocker.patch("testit_python_commons.client.api_client.BulkAutotestHelper")
+        result_models = [mocker.Mock(), mocker.Mock()]
+        mocker.patch(
+            "testit_python_commons.client.api_client.Converter.test_result_to_testrun_result_post_model",
+            side_effect=result_models)
+        mocker.patch("testit_python_commons.client.api_client.Converter.prepare_to_mass_create_autotest")
+        mocker.patch.object(worker, "_ApiClientWorker__update_autotests_links_from_work_items")
+        self._search(worker).return_value = []
+        test_results = []
+        for external_id in ("ext-1", "ext-2"):
+            test_result = mocker.Mock()
+            test_result.get_external_id.return_value = external_id
+            test_results.append(test_result)
+        sent = []
+
+        worker.write_tests(test_results, {}, on_results_sent=sent.extend)
+        on_results_sent = helper_class.call_args.args[5]
+        on_results_sent([result_models[1]])
+
+        assert sent == [test_results[1]]
@@ -6,6 +6,8 @@ from testit_python_commons.services.adapter_manager_configuration import Adapter
 from testit_python_commons.client.client_configuration import ClientConfiguration
 from testit_python_commons.services.fixture_manager import FixtureManager
 from testit_python_commons.models.adapter_mode import AdapterMode
+from testit_python_commons.models.test_result import TestResult
+from testit_python_commons.services.result_journal import ResultJournal
 
 class TestAdapterManager:
     @pytest.fixture
@@ -104,6 +106,7 @@ class TestAdapterManager:
         mock_adapter_config.should_import_realtime.return_value = True
         all_fixture_items = ["setup1", "teardown1"]
         mock_fixture_manager.get_all_items.return_value = all_fixture_items
+        containers_index = mock_fixture_manager.get_containers_index.return_value
         adapter_manager._AdapterManager__test_result_map = {"test1": "result1"}
 
         adapter_manager.write_tests()
@@ -111,7 +114,7 @@ class TestAdapterManager:
         mock_adapter_config.should_import_realtime.assert_called_once()
         mock_fixture_manager.get_all_items.assert_called_once()
         mock_api_client_worker.update_test_results.assert_called_once_with(
-            all_fixture_items, {"test1": "result1"}
+            containers_index, {"test1": "result1"}
         )
         mock_api_client_worker.write_tests.assert_not_called()
 
@@ -144,8 +147,7 @@ class TestAdapterManager:
             mocker):
         mock_adapter_config.should_import_realtime.return_value = False
         mock_adapter_config.should_automatic_creation_test_cases.return_value = True
-        fixtures = {"fixture": "value"}
-        mock_fixture_manager.get_all_items.return_value = fixtures
+        fixtures = mock_fixture_manager.get_containers_index.return_value
 
         test_result_1 = mocker.Mock()
         test_result_2 = mocker.Mock()
@@ -158,6 +160,7 @@ class TestAdapterManager:
         mock_api_client_worker.write_tests.assert_called_once_with(
             [test_result_1, test_result_2],
             fixtures,
+            on_results_sent=mocker.ANY,
         )
 
     def test_write_test_realtime_sets_automatic_creation_for_each_test(
@@ -188,6 +191,255 @@ class TestAdapterManager:
         assert adapter_manager._AdapterManager__test_result_map["ext-1"] == "tr-1"
         assert adapter_manager._AdapterManager__test_result_map["ext-2"] == "tr-2"
 
+    def test_write_test_realtime_async_uploads_in_background(
+            self,
+            adapter_manager,
+            mock_adapter_config,
+            mock_client_config,
+            mock_api_client_worker,
+            mock_fixture_manager,
+            mocker):
+        mock_adapter_config.should_import_realtime.return_value = True
+        mock_adapter_config.should_import_realtime_async.return_value = True
+        mock_client_config.get_upload_threads.return_value = 2
+        mock_fixture_manager.get_all_items.return_value = {}
+        mock_api_client_worker.write_test.side_effect = lambda result: "tr-" + result.get_external_id()
+        adapter_manager._AdapterManager__sync_storage_runner = None
+
+        for external_id in ("ext-1", "ext-2", "ext-3"):
+            test_result = mocker.Mock()
+            test_result.get_external_id.return_value = external_id
+            adapter_manager.write_test(test_result)
+
+        adapter_manager.write_tests()
+
+        assert mock_api_client_worker.write_test.call_count == 3
+        assert adapter_manager._AdapterManager__test_result_map == {
+            "ext-1": "tr-ext-1",
+            "ext-2": "tr-ext-2",
+            "ext-3": "tr-ext-3",
+        }
+
+    def test_write_tests_uploads_journaled_results_in_chunks(
+            self,
+            adapter_manager,
+            mock_adapter_config,
+            mock_api_client_worker,
+            mock_fixture_manager,
+            mocker,
+            tmp_path):
+        mock_adapter_config.should_import_realtime.return_value = False
+        mock_adapter_config.should_use_results_journal.return_value = True
+        mock_adapter_config.should_automatic_creation_test_cases.return_value = True
+        mock_fixture_manager.get_all_items.return_value = {}
+        adapter_manager._AdapterManager__sync_storage_runner = None
+        adapter_manager._AdapterManager__results_journal_chunk_size = 2
+        journal_path = tmp_path / "results.jsonl"
+        mocker.patch(
+            "testit_python_commons.services.adapter_manager.ResultJournal",
+            side_effect=lambda: ResultJournal(str(journal_path)))
+        uploaded = []
+        mock_api_client_worker.write_tests.side_effect = lambda test_results, fixtures, **kwargs: uploaded.append(
+            [(test_result.get_external_id(), test_result.get_automatic_creation_test_cases())
+             for test_result in test_results])
+
+        for external_id in ("ext-1", "ext-2", "ext-3"):
+            adapter_manager.write_test(TestResult().set_external_id(external_id))
+
+        assert adapter_manager._AdapterManager__test_results == []
+        assert journal_path.exists()
+
+        adapter_manager.write_tests()
+
+        assert uploaded == [[("ext-1", True), ("ext-2", True)], [("ext-3", True)]]
+        assert not journal_path.exists()
+
+    def test_offline_export_does_not_call_test_it(
+            self,
+            mocker,
+            mock_adapter_config,
+            mock_client_config,
+            mock_fixture_manager,
+            mock_api_client_worker,
+            tmp_path):
+        mock_adapter_config.should_export_results_offline.return_value = True
+        mock_adapter_config.get_offline_export_dir.return_value = str(tmp_path)
+        mock_adapter_config.get_mode.return_value = AdapterMode.NEW_TEST_RUN
+        mock_adapter_config.get_test_run_id.return_value = None
+        mock_fixture_manager.get_all_items.return_value = {}
+        manager = AdapterManager(
+            adapter_configuration=mock_adapter_config,
+            client_configuration=mock_client_config,
+            fixture_manager=mock_fixture_manager
+        )
+
+        assert manager.get_test_run_id() == ""
+        manager.write_test(TestResult().set_external_id("ext-1"))
+        manager.write_tests()
+
+        mock_api_client_worker.create_test_run.assert_not_called()
+        mock_api_client_worker.write_test.assert_not_called()
+        mock_api_client_worker.write_tests.assert_not_called()
+        assert len(list((tmp_path / "results").iterdir())) == 1
+
+    @pytest.fixture
+    def open_circuit(self, mocker, mock_adapter_config, tmp_path):
+        mock_adapter_config.get_test_run_id.return_value = "run-1"
+        mocker.patch.object(AdapterManager, "_AdapterManager__offline_fallback_dir", str(tmp_path / "offline"))
+        policy = mocker.Mock()
+        policy.is_open.return_value = False
+        policy.get_statistics.return_value = {"retries": 0, "circuit_open": False}
+        mocker.patch("testit_python_commons.services.adapter_manager.get_retry_policy", return_value=policy)
+        return policy
+
+    @staticmethod
+    def _exported_results(tmp_path):
+        [export_dir] = (tmp_path / "offline").iterdir()
+        [journal_path] = (export_dir / "results").iterdir()
+        return [
+            test_result.get_external_id()
+            for test_results in ResultJournal(str(journal_path)).read_chunks(100)
+            for test_result in test_results
+        ]
+
+    def test_realtime_results_are_saved_offline_once_circuit_opens(
+            self,
+            adapter_manager,
+            mock_adapter_config,
+            mock_api_client_worker,
+            mock_fixture_manager,
+            open_circuit,
+            tmp_path):
+        mock_adapter_config.should_import_realtime.return_value = True
+        mock_adapter_config.should_import_realtime_async.return_value = False
+        mock_adapter_config.should_automatic_creation_test_cases.return_value = False
+        mock_fixture_manager.get_all_items.return_value = {}
+
+        def write_test(test_result):
+            open_circuit.is_open.return_value = True
+            raise ConnectionError("Test IT is down")
+
+        mock_api_client_worker.write_test.side_effect = write_test
+
+        adapter_manager.write_test(TestResult().set_external_id("ext-1"))
+        adapter_manager.write_test(TestResult().set_external_id("ext-2"))
+        adapter_manager.write_tests()
+
+        assert mock_api_client_worker.write_test.call_count == 1
+        mock_api_client_worker.update_test_results.assert_not_called()
+        assert self._exported_results(tmp_path) == ["ext-1", "ext-2"]
+
+    def test_buffered_results_are_saved_offline_when_circuit_is_open(
+            self,
+            adapter_manager,
+            mock_adapter_config,
+            mock_api_client_worker,
+            mock_fixture_manager,
+            open_circuit,
+            tmp_path):
+        mock_adapter_config.should_import_realtime.return_value = False
+        mock_fixture_manager.get_all_items.return_value = {}
+        adapter_manager._AdapterManager__sync_storage_runner = None
+
+        adapter_manager.write_test(TestResult().set_external_id("ext-1"))
+        open_circuit.is_open.return_value = True
+        adapter_manager.write_tests()
+
+        mock_api_client_worker.write_tests.assert_not_called()
+        assert self._exported_results(tmp_path) == ["ext-1"]
+
+    def test_buffered_results_are_saved_offline_when_circuit_opens_during_upload(
+            self,
+            adapter_manager,
+            mock_adapter_config,
+            mock_api_client_worker,
+            mock_fixture_manager,
+            open_circuit,
+            tmp_path):
+        mock_adapter_config.should_import_realtime.return_value = False
+        mock_adapter_config.should_use_results_journal.return_value = False
+        mock_adapter_config.should_automatic_creation_test_cases.return_value = False
+        mock_fixture_manager.get_all_items.return_value = {}
+        adapter_manager._AdapterManager__sync_storage_runner = None
+
+        def write_tests(test_results, fixtures, on_results_sent):
+            open_circuit.is_open.return_value = True
+            raise ConnectionError("Test IT is down")
+
+        mock_api_client_worker.write_tests.side_effect = write_tests
+
+        adapter_manager.write_test(TestResult().set_external_id("ext-1"))
+        adapter_manager.write_test(TestResult().set_external_id("ext-2"))
+        adapter_manager.write_tests()
+
+        assert self._exported_results(tmp_path) == ["ext-1", "ext-2"]
+
+    def test_results_sent_before_circuit_opens_are_not_saved_offline(
+            self,
+            adapter_manager,
+            mock_adapter_config,
+            mock_api_client_worker,
+            mock_fixture_manager,
+            open_circuit,
+            tmp_path):
+        mock_adapter_config.should_import_realtime.return_value = False
+        mock_adapter_config.should_use_results_journal.return_value = False
+        mock_adapter_config.should_automatic_creation_test_cases.return_value = False
+        mock_fixture_manager.get_all_items.return_value = {}
+        adapter_manager._AdapterManager__sync_storage_runner = None
+
+        def write_tests(test_results, fixtures, on_results_sent):
+            on_results_sent(test_results[:1])
+            open_circuit.is_open.return_value = True
+            raise ConnectionError("Test IT is down")
+
+        mock_api_client_worker.write_tests.side_effect = write_tests
+
+        adapter_manager.write_test(TestResult().set_external_id("ext-1"))
+        adapter_manager.write_test(TestResult().set_external_id("ext-2"))
+        adapter_manager.write_tests()
+
+        assert self._exported_results(tmp_path) == ["ext-2"]
+
+    def test_journaled_results_are_saved_offline_when_circuit_opens_during_upload(
+            self,
+            adapter_manager,
+            mock_adapter_config,
+            mock_api_client_worker,
+            mock_fixture_manager,
+            open_circuit,
+            mocker,
+            tmp_path):
+        mock_adapter_config.should_import_realtime.return_value = False
+        mock_adapter_config.should_use_results_journal.return_value = True
+        mock_adapter_config.should_automatic_creation_test_cases.return_value = False
+        mock_fixture_manager.get_all_items.return_value = {}
+        adapter_manager._AdapterManager__sync_storage_runner = None
+        adapter_manager._AdapterManager__results_journal_chunk_size = 2
+        journal_path = tmp_path / "results.jsonl"
+        mocker.patch(
+            "testit_python_commons.services.adapter_manager.ResultJournal",
+            side_effect=lambda: ResultJournal(str(journal_path)))
+        uploaded = []
+
+        def write_tests(test_results, fixtures, on_results_sent):
+            sent = test_results if not uploaded else test_results[:1]
+            uploaded.extend(test_result.get_external_id() for test_result in sent)
+            on_results_sent(sent)
+            if len(uploaded) > 2:
+                open_circuit.is_open.return_value = True
+                raise ConnectionError("Test IT is down")
+
+        mock_api_client_worker.write_tests.side_effect = write_tests
+
+        for external_id in ("ext-1", "ext-2", "ext-3", "ext-4", "ext-5"):
+            adapter_manager.write_test(TestResult().set_external_id(external_id))
+        adapter_manager.write_tests()
+
+        assert uploaded == ["ext-1", "ext-2", "ext-3"]
+        assert self._exported_results(tmp_path) == ["ext-4", "ext-5"]
+        assert not journal_path.exists()
+
     def test_write_test_without_sync_storage_runner_does_not_crash(
             self,
             adapter_manager,
@@ -234,10 +486,7 @@ class TestAdapterManager:
         sync_runner.set_is_already_in_progress.assert_called_with(True)
 
     def test_create_attachment_with_name(self, adapter_manager, mock_api_client_worker, mocker):
-        mock_os_path_join = mocker.patch("os.path.join")
-        mock_os_path_abspath = mocker.patch("os.path.abspath", return_value="/abs/path")
         mock_open = mocker.patch("builtins.open", mocker.mock_open())
-        mock_os_remove = mocker.patch("os.remove")
         mock_utils_convert = mocker.patch(
             "testit_python_commons.services.adapter_manager.Utils.convert_body_of_attachment",
             return_value=b"converted_body"
@@ -245,20 +494,15 @@ class TestAdapterManager:
 
         file_body = "Hello Attachment"
         file_name = "custom_attachment.txt"
-        expected_file_path = "/abs/path/custom_name.txt"
-        mock_os_path_join.return_value = expected_file_path
         expected_attachment_id = str(uuid.uuid4())
-        mock_api_client_worker.load_attachments.return_value = expected_attachment_id
+        mock_api_client_worker.create_attachment.return_value = expected_attachment_id
 
         attachment_id = adapter_manager.create_attachment(file_body, file_name)
 
-        mock_os_path_abspath.assert_called_once_with('')
-        mock_os_path_join.assert_called_once_with("/abs/path", file_name)
-        mock_open.assert_called_once_with(expected_file_path, 'wb')
-        mock_open().write.assert_called_once_with(b"converted_body")
         mock_utils_convert.assert_called_once_with(file_body)
-        mock_api_client_worker.load_attachments.assert_called_once_with((expected_file_path,))
-        mock_os_remove.assert_called_once_with(expected_file_path)
+        mock_api_client_worker.create_attachment.assert_called_once_with(b"converted_body", file_name)
+        mock_api_client_worker.load_attachments.assert_not_called()
+        mock_open.assert_not_called()
         assert attachment_id == expected_attachment_id
 
     def test_init_does_not_create_test_run_for_new_test_run_mode_without_id(
@@ -1,7 +1,10 @@
 import pytest
+import threading
 import uuid
 
 from testit_python_commons.services.fixture_manager import FixtureManager
+from testit_python_commons.services.fixture_storage import FixturesContainersIndex
+from testit_python_commons.models.fixture import FixtureResult, FixturesContainer
 from testit_python_commons.models.step_result import StepResult
 
 class TestFixtureManager:
@@ -120,4 +123,82 @@ class TestFixtureManager:
 
         result = fixture_manager.get_all_items()
 
-        assert result == expected_items
\ No newline at end of file
+        assert result == expected_items
+
+class TestFixturesContainersIndex:
+    @pytest.fixture
+    def fixture_manager(self):
+        manager = FixtureManager()
+        manager._items.thread_context.clear()
+        return manager
+
+    def test_containers_are_indexed_by_recorded_external_ids(self, fixture_manager):
+        session_container = FixturesContainer(uuid="session")
+        module_container = FixturesContainer(uuid="module")
+        fixture_manager.start_group("session", session_container)
+        fixture_manager.start_group("module", module_container)
+
+        fixture_manager.update_group("module", external_ids="test-1")
+        fixture_manager.update_group("session", external_ids="test-1")
+        fixture_manager.update_group("session", external_ids="test-2")
+
+        index = fixture_manager.get_containers_index()
+        assert index.get_containers("test-1") == [session_container, module_container]
+        assert index.get_containers("test-2") == [session_container]
+        assert index.get_containers("test-3") == []
+        assert fixture_manager.has_external_id("module", "test-1")
+        assert not fixture_manager.has_external_id("module", "test-2")
+
+    def test_index_of_containers_dict_keeps_dict_order(self):
+        first = FixturesContainer(uuid="first", external_ids=["test-1"])
+        second = FixturesContainer(uuid="second", external_ids=["test-1", "test-2"])
+
+        index = FixturesContainersIndex.of({"first": first, "second": second})
+
+        assert index.get_containers("test-1") == [first, second]
+        assert index.get_containers("test-2") == [second]
+        assert FixturesContainersIndex.of(index) is index
+
+
+class TestFixturesContext:
+    def test_groups_of_ended_test_context_are_kept(self):
+        fixture_manager = FixtureManager()
+        container = FixturesContainer(uuid="group")
+
+        first_test = fixture_manager.start_context()
+        fixture_manager.start_group("group", container)
+        fixture_manager.start_before_fixture("group", "before", FixtureResult(title="setup"))
+        fixture_manager.stop_before_fixture("before", steps=[])
+        fixture_manager.end_context(first_test)
+
+        last_test = fixture_manager.start_context()
+        fixture_manager.start_after_fixture("group", "after", FixtureResult(title="teardown"))
+        fixture_manager.stop_after_fixture("after", steps=[])
+        fixture_manager.end_context(last_test)
+
+        assert fixture_manager.get_all_items() == {"group": container}
+        assert [fixture.title for fixture in container.befores + container.afters] == ["setup", "teardown"]
+
+    def test_threads_see_only_their_own_last_items(self):
+        fixture_manager = FixtureManager()
+        fixture_manager.start_group("group", FixturesContainer(uuid="group"))
+        last_items = {}
+
+        def run_test(name):
+            token = fixture_manager.start_context()
+            try:
+                fixture_manager.start_before_fixture("group", name, FixtureResult(title=name))
+                started.wait()
+                last_items[name] = fixture_manager.get_last_item(FixtureResult).title
+                fixture_manager.stop_before_fixture(name)
+            finally:
+                fixture_manager.end_context(token)
+
+        started = threading.Barrier(2)
+        threads = [threading.Thread(target=run_test, args=(name,)) for name in ("first", "second")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert last_items == {"first": "first", "second": "second"}
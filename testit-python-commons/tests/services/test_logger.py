@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+from testit_python_commons.services.logger import adapter_logger
+from testit_python_commons.services.plugin_manager import TmsPluginManager
+from testit_python_commons.services.utils import Utils
+
+
+class TestAdapterLogger:
+    @pytest.fixture
+    def logger(self):
+        logger = TmsPluginManager.get_logger()
+        level = logger.level
+        yield logger
+        logger.setLevel(level)
+
+    def test_skips_parameter_formatting_when_debug_disabled(self, logger, mocker):
+        logger.setLevel(logging.WARNING)
+        get_parameters = mocker.spy(Utils, "get_function_parameters_for_log")
+        debug = mocker.spy(logger, "debug")
+
+        @adapter_logger
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        get_parameters.assert_not_called()
+        debug.assert_not_called()
+
+    def test_logs_shortened_parameters_and_result_when_debug_enabled(self, logger, mocker):
+        logger.setLevel(logging.DEBUG)
+        debug = mocker.patch.object(logger, "debug")
+
+        @adapter_logger
+        def echo(value):
+            return value
+
+        echo(list(range(100)))
+
+        started, finished = [call.args[0] for call in debug.call_args_list]
+        assert started == 'Method "echo" started with parameters: {\'value\': \'<list with 100 items>\'}'
+        assert finished == 'Method "echo" finished with result: <list with 100 items>'
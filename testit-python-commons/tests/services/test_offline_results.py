@@ -0,0 +1,92 @@
+import uuid
+
+from adapters_api.model.attachment_put_model import AttachmentPutModel
+
+from testit_python_commons.models.fixture import FixtureResult, FixturesContainer
+from testit_python_commons.models.step_result import StepResult
+from testit_python_commons.models.test_result import TestResult
+from testit_python_commons.services.offline_results import OfflineResultsUploader, OfflineResultsWriter
+
+
+class TestOfflineResults:
+    @staticmethod
+    def _export(tmp_path, test_run_id=None):
+        attachment_path = tmp_path / "log.txt"
+        attachment_path.write_text("log")
+
+        writer = OfflineResultsWriter(str(tmp_path / "results"))
+        [attachment] = writer.load_attachments([str(attachment_path), str(tmp_path / "missing.txt")])
+        step = StepResult().set_title("step").set_attachments([attachment])
+        writer.write_test(
+            TestResult().set_external_id("ext-1").set_step_results([step]).set_attachments([attachment]))
+        writer.write_test(TestResult().set_external_id("ext-2"))
+
+        setup = FixtureResult(title="setup", steps=[StepResult().set_title("fixture step")])
+        container = FixturesContainer(uuid="container-1", external_ids=["ext-1"], befores=[setup])
+        writer.finish({"container-1": container, "fixture-1": setup}, test_run_id)
+
+        return writer.get_directory()
+
+    def test_uploader_sends_exported_results_through_bulk_path(self, tmp_path, mocker):
+        directory = self._export(tmp_path, test_run_id="run-1")
+        api_client = mocker.Mock()
+        api_client.load_attachments.return_value = [AttachmentPutModel(id="remote-1")]
+        uploaded = []
+        api_client.write_tests.side_effect = lambda test_results, fixtures: uploaded.append((test_results, fixtures))
+
+        uploader = OfflineResultsUploader(directory, api_client, upload_threads=2)
+
+        assert uploader.get_test_run_id() == "run-1"
+        assert uploader.upload(automatic_creation_test_cases=True) == 2
+
+        [(test_results, fixtures)] = uploaded
+        assert [test_result.get_external_id() for test_result in test_results] == ["ext-1", "ext-2"]
+        assert all(test_result.get_automatic_creation_test_cases() for test_result in test_results)
+        assert [attachment.id for attachment in test_results[0].get_attachments()] == ["remote-1"]
+        assert [attachment.id for attachment in test_results[0].get_step_results()[0].get_attachments()] == \
+            ["remote-1"]
+        api_client.load_attachments.assert_called_once()
+
+        [container] = fixtures.get_containers("ext-1")
+        assert container.uuid == "container-1"
+        assert container.befores[0].steps[0].get_title() == "fixture step"
+        assert fixtures.get_containers("ext-2") == []
+
+    def test_uploader_without_manifest_has_no_test_run_id(self, tmp_path):
+        directory = self._export(tmp_path)
+
+        assert OfflineResultsUploader(directory, api_client=None).get_test_run_id() is None
+
+    def test_fixtures_containers_with_uuid_objects_are_exported(self, tmp_path, mocker):
+        container_uuid = uuid.uuid4()
+        writer = OfflineResultsWriter(str(tmp_path / "results"))
+        writer.write_test(TestResult().set_external_id("ext-1"))
+        writer.finish({container_uuid: FixturesContainer(uuid=container_uuid, external_ids=["ext-1"])})
+
+        api_client = mocker.Mock()
+        uploaded = []
+        api_client.write_tests.side_effect = lambda test_results, fixtures: uploaded.append(fixtures)
+        OfflineResultsUploader(writer.get_directory(), api_client).upload(automatic_creation_test_cases=False)
+
+        [fixtures] = uploaded
+        assert [container.uuid for container in fixtures.get_containers("ext-1")] == [str(container_uuid)]
+
+    def test_attachments_uploaded_before_export_keep_their_ids(self, tmp_path, mocker):
+        attachment_path = tmp_path / "log.txt"
+        attachment_path.write_text("log")
+        writer = OfflineResultsWriter(str(tmp_path / "results"))
+        [exported] = writer.load_attachments([str(attachment_path)])
+        [failed] = writer.create_attachment(b"body", "failed.txt")
+        uploaded_before = AttachmentPutModel(id="remote-0")
+        writer.write_test(TestResult().set_external_id("ext-1").set_attachments([uploaded_before, exported, failed]))
+        writer.finish({})
+
+        api_client = mocker.Mock()
+        api_client.load_attachments.side_effect = lambda paths: \
+            [] if paths[0].endswith("failed.txt") else [AttachmentPutModel(id="remote-1")]
+        uploaded = []
+        api_client.write_tests.side_effect = lambda test_results, fixtures: uploaded.extend(test_results)
+        OfflineResultsUploader(writer.get_directory(), api_client).upload()
+
+        [test_result] = uploaded
+        assert [attachment.id for attachment in test_result.get_attachments()] == ["remote-0", "remote-1"]
@@ -3,6 +3,8 @@ import logging
 
 from testit_python_commons.services.plugin_manager import TmsPluginManager
 from testit_python_commons.services.fixture_manager import FixtureManager
+from testit_python_commons.services.request_metrics import set_request_metrics
+from testit_python_commons.services.retry import RetryPolicy, set_retry_policy
 
 @pytest.fixture(autouse=True)
 def reset_tms_plugin_manager_singletons():
@@ -12,6 +14,9 @@ def reset_tms_plugin_manager_singletons():
     TmsPluginManager._TmsPluginManager__step_manager = None
     TmsPluginManager._TmsPluginManager__logger = None
     TmsPluginManager.set_pytest_tms_report(None)
+    yield
+    set_retry_policy(RetryPolicy())
+    set_request_metrics(None)
 
 class TestTmsPluginManager:
     def test_get_plugin_manager_creates_instance(self):
@@ -0,0 +1,60 @@
+import threading
+
+from testit_python_commons.services.realtime_uploader import RealtimeUploader
+
+
+class TestRealtimeUploader:
+    def test_shutdown_drains_all_submitted_results(self, mocker):
+        written = []
+        uploader = RealtimeUploader(written.append, workers=2, max_queue_size=3)
+
+        results = [mocker.Mock() for _ in range(20)]
+        for result in results:
+            uploader.submit(result)
+        uploader.shutdown()
+
+        assert sorted(map(id, written)) == sorted(map(id, results))
+        assert uploader.get_pending_count() == 0
+
+    def test_submit_blocks_while_queue_is_full(self, mocker):
+        release = threading.Event()
+        uploader = RealtimeUploader(lambda result: release.wait(), workers=1, max_queue_size=1)
+
+        uploader.submit(mocker.Mock())
+        uploader.submit(mocker.Mock())
+
+        blocked = threading.Thread(target=uploader.submit, args=(mocker.Mock(),))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(timeout=5)
+        assert not blocked.is_alive()
+        uploader.shutdown()
+
+    def test_worker_errors_do_not_stop_uploads(self, mocker):
+        written = []
+
+        def write_test(result):
+            if result.fail:
+                raise RuntimeError("boom")
+            written.append(result)
+
+        uploader = RealtimeUploader(write_test)
+        uploader.submit(mocker.Mock(fail=True))
+        ok = mocker.Mock(fail=False)
+        uploader.submit(ok)
+        uploader.shutdown()
+
+        assert written == [ok]
+
+    def test_submit_after_shutdown_writes_synchronously(self, mocker):
+        written = []
+        uploader = RealtimeUploader(written.append)
+        uploader.shutdown()
+
+        result = mocker.Mock()
+        uploader.submit(result)
+
+        assert written == [result]
@@ -0,0 +1,177 @@
+import io
+import json
+
+import pytest
+import urllib3
+from adapters_api import ApiClient, Configuration
+from adapters_api.exceptions import ApiException
+
+from testit_python_commons.client.api_client import ApiClientWorker
+from testit_python_commons.services.request_metrics import RequestMetrics, set_request_metrics
+from testit_python_commons.services.retry import RetryPolicy, retry, set_retry_policy
+
+
+@pytest.fixture(autouse=True)
+def policy():
+    set_retry_policy(RetryPolicy(base_delay_sec=0))
+    yield
+    set_retry_policy(RetryPolicy())
+
+
+@pytest.fixture
+def api_client(mocker):
+    api_client = ApiClient(Configuration(host='http://tms'))
+    api_client.rest_client.pool_manager = mocker.Mock()
+
+    return api_client
+
+
+def _response(body: bytes, status: int = 200):
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers={'Content-Type': 'application/json'},
+        preload_content=True)
+
+
+def _get_test_run(api_client, test_run_id: str):
+    return api_client.call_api(
+        '/api/v2/testRuns/{id}', 'GET',
+        path_params={'id': test_run_id},
+        response_type=None,
+        _return_http_data_only=True)
+
+
+def test_requests_are_grouped_by_endpoint_template(api_client):
+    metrics = RequestMetrics()
+    api_client.rest_client.pool_manager.request.side_effect = lambda *args, **kwargs: _response(b'{"id": 1}')
+    metrics.instrument(api_client, 'tms')
+
+    _get_test_run(api_client, 'run-1')
+    _get_test_run(api_client, 'run-2')
+
+    [((service, method, path), endpoint)] = metrics.get_endpoints()
+    assert (service, method, path) == ('tms', 'GET', '/api/v2/testRuns/{id}')
+    assert endpoint.requests == 2
+    assert endpoint.errors == 0
+    assert endpoint.bytes_received == 2 * len(b'{"id": 1}')
+    assert sum(endpoint.histogram) == 2
+
+
+def test_sent_bytes_errors_and_retries_are_counted(api_client):
+    metrics = RequestMetrics()
+    request = api_client.rest_client.pool_manager.request
+    request.side_effect = [_response(b'', 500), _response(b'')]
+    metrics.instrument(api_client, 'tms')
+
+    @retry
+    def set_result():
+        api_client.call_api(
+            '/api/v2/testRuns/{id}/testResults', 'POST',
+            path_params={'id': 'run-1'},
+            body=[{'outcome': 'Passed'}],
+            _return_http_data_only=True)
+
+    set_result()
+
+    [(_, endpoint)] = metrics.get_endpoints()
+    assert endpoint.requests == 2
+    assert endpoint.errors == 1
+    assert endpoint.retries == 1
+    assert endpoint.bytes_sent == sum(len(call.kwargs['body']) for call in request.call_args_list) > 0
+
+
+def test_failed_request_without_retry_is_not_counted_as_retry(api_client):
+    metrics = RequestMetrics()
+    api_client.rest_client.pool_manager.request.return_value = _response(b'', 404)
+    metrics.instrument(api_client, 'tms')
+
+    with pytest.raises(ApiException):
+        _get_test_run(api_client, 'run-1')
+
+    [(_, endpoint)] = metrics.get_endpoints()
+    assert (endpoint.requests, endpoint.errors, endpoint.retries) == (1, 1, 0)
+
+
+def test_attachment_uploads_are_reported(mocker, capsys):
+    metrics = RequestMetrics()
+    set_request_metrics(metrics)
+    config = mocker.Mock()
+    config.get_url.return_value = 'http://tms'
+    config.get_private_token.return_value = 'token'
+    config.get_proxy.return_value = None
+    config.get_connection_pool_size.return_value = 0
+    config.get_upload_threads.return_value = 1
+    config.get_connect_timeout.return_value = 0
+    config.get_read_timeout.return_value = 0
+    config.is_tcp_keep_alive.return_value = False
+    config.is_http_compression.return_value = False
+    config.get_request_compression_threshold.return_value = 0
+    request = mocker.patch.object(urllib3.PoolManager, 'request')
+    try:
+        worker = ApiClientWorker(config)
+    finally:
+        set_request_metrics(None)
+    request.return_value = _response(json.dumps({
+        'id': '3fa85f64-5717-4562-b3fc-2c963f66afa6',
+        'fileId': 'file-1',
+        'type': 'text/plain',
+        'size': 4.0,
+        'createdDate': '2026-01-01T00:00:00Z',
+        'createdById': '3fa85f64-5717-4562-b3fc-2c963f66afa7',
+        'name': 'log.txt',
+    }).encode('utf-8'))
+
+    worker.create_attachment(b'x' * 4096, 'log.txt')
+    metrics.report()
+
+    [((service, method, path), endpoint)] = metrics.get_endpoints()
+    assert (service, method, path) == ('tms', 'POST', '/adapters/attachments')
+    assert endpoint.bytes_sent == request.call_args.kwargs['body'].content_length > 4096
+    assert endpoint.bytes_received > 0
+    assert 'tms POST /adapters/attachments' in capsys.readouterr().out
+
+
+def test_percentile_is_upper_bound_of_its_bucket():
+    metrics = RequestMetrics()
+    for seconds in [0.005] * 19 + [0.3]:
+        metrics.record('tms', 'GET', '/api/v2/autoTests', seconds)
+
+    [(_, endpoint)] = metrics.get_endpoints()
+    assert endpoint.get_percentile_ms(50) == 10
+    assert endpoint.get_percentile_ms(95) == 10
+    assert endpoint.get_percentile_ms(100) == 300
+
+
+def test_report_prints_table_and_writes_json(tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv('PYTEST_XDIST_WORKER', raising=False)
+    report_file = tmp_path / 'metrics' / 'requests.json'
+    metrics = RequestMetrics(str(report_file))
+    metrics.record('tms', 'POST', '/api/v2/autoTests', 0.2, bytes_sent=2048, bytes_received=1024)
+    metrics.record('tms', 'GET', '/api/v2/testRuns/{id}', 0.05, failed=True)
+
+    metrics.report()
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert lines[2].startswith('tms POST /api/v2/autoTests')
+    assert lines[-1].split()[:4] == ['total', '2', '1', '0']
+
+    report = json.loads(report_file.read_text(encoding='utf-8'))
+    assert [endpoint['path'] for endpoint in report['endpoints']] == ['/api/v2/autoTests', '/api/v2/testRuns/{id}']
+    assert report['endpoints'][0]['bytes_sent'] == 2048
+    assert report['endpoints'][0]['latency_histogram_ms']['250'] == 1
+    assert report['retry']['retries'] == 0
+
+
+def test_each_xdist_worker_writes_own_report(tmp_path, monkeypatch, capsys):
+    report_file = tmp_path / 'requests.json'
+    for worker_id in ('gw0', 'gw1'):
+        monkeypatch.setenv('PYTEST_XDIST_WORKER', worker_id)
+        metrics = RequestMetrics(str(report_file))
+        metrics.record('tms', 'GET', f'/api/v2/{worker_id}', 0.01)
+        metrics.report()
+
+    assert not report_file.exists()
+    for worker_id in ('gw0', 'gw1'):
+        report = json.loads((tmp_path / f'requests.{worker_id}.json').read_text(encoding='utf-8'))
+        assert [endpoint['path'] for endpoint in report['endpoints']] == [f'/api/v2/{worker_id}']
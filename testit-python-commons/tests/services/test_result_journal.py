@@ -0,0 +1,90 @@
+from datetime import datetime
+
+from adapters_api.model.attachment_put_model import AttachmentPutModel
+
+from testit_python_commons.models.link import Link
+from testit_python_commons.models.link_type import LinkType
+from testit_python_commons.models.step_result import StepResult
+from testit_python_commons.models.test_result import TestResult
+from testit_python_commons.services.result_journal import ResultJournal
+
+
+def _test_result(external_id):
+    nested_step = StepResult().set_title("nested").set_outcome("Passed")
+    step = StepResult()\
+        .set_title("<b>step</b>")\
+        .set_outcome("Passed")\
+        .set_duration(5)\
+        .set_parameters({"arg": "1"})\
+        .set_step_results([nested_step])\
+        .set_attachments([AttachmentPutModel(id="step-attachment")])
+
+    return TestResult()\
+        .set_external_id(external_id)\
+        .set_autotest_name(f"test {external_id}")\
+        .set_outcome("Failed")\
+        .set_duration(10)\
+        .set_started_on(datetime(2024, 1, 2, 3, 4, 5))\
+        .set_traces("Traceback")\
+        .set_step_results([step])\
+        .set_links([Link().set_url("https://example.com").set_title("docs").set_link_type(LinkType.ISSUE)])\
+        .set_attachments([AttachmentPutModel(id="attachment")])\
+        .set_labels(["smoke"])\
+        .set_work_item_ids(["123"])\
+        .set_parameters({"param": "value"})\
+        .set_automatic_creation_test_cases(True)
+
+
+class TestResultJournal:
+    def test_round_trip_keeps_test_result_fields(self, tmp_path):
+        journal = ResultJournal(str(tmp_path / "results.jsonl"))
+        journal.append(_test_result("ext-1"))
+
+        [[restored]] = list(journal.read_chunks(10))
+
+        assert restored.get_external_id() == "ext-1"
+        assert restored.get_outcome() == "Failed"
+        assert restored.get_started_on() == datetime(2024, 1, 2, 3, 4, 5)
+        assert restored.get_labels() == ["smoke"]
+        assert restored.get_parameters() == {"param": "value"}
+        assert restored.get_automatic_creation_test_cases() is True
+        assert [attachment.id for attachment in restored.get_attachments()] == ["attachment"]
+        assert restored.get_links()[0].get_link_type() == LinkType.ISSUE
+
+        step = restored.get_step_results()[0]
+        assert step.get_title() == "&lt;b&gt;step&lt;/b&gt;"
+        assert step.get_parameters() == {"arg": "1"}
+        assert step.get_step_results()[0].get_title() == "nested"
+        assert [attachment.id for attachment in step.get_attachments()] == ["step-attachment"]
+
+    def test_read_chunks_is_bounded_by_chunk_size(self, tmp_path):
+        journal = ResultJournal(str(tmp_path / "results.jsonl"))
+        for index in range(5):
+            journal.append(_test_result(f"ext-{index}"))
+
+        chunks = [[result.get_external_id() for result in chunk] for chunk in journal.read_chunks(2)]
+
+        assert chunks == [["ext-0", "ext-1"], ["ext-2", "ext-3"], ["ext-4"]]
+        assert journal.get_count() == 5
+
+    def test_reopened_journal_skips_record_cut_off_by_crash(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        journal = ResultJournal(str(path))
+        journal.append(_test_result("ext-1"))
+        journal.close()
+        with open(path, "a", encoding="utf-8") as file:
+            file.write('{"external_id": "ext-2", "outc')
+
+        reopened = ResultJournal(str(path))
+
+        assert reopened.get_count() == 1
+        assert [result.get_external_id() for chunk in reopened.read_chunks(10) for result in chunk] == ["ext-1"]
+
+    def test_remove_deletes_journal_file(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        journal = ResultJournal(str(path))
+        journal.append(_test_result("ext-1"))
+
+        journal.remove()
+
+        assert not path.exists()
@@ -1,12 +1,19 @@
-﻿import urllib3
+﻿from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import urllib3
 from adapters_api.exceptions import ApiException
 
 from testit_python_commons.services.retry import (
     CONNECTION_RETRIES,
+    RetryPolicy,
+    get_retry_after,
     is_non_retriable_api_exception,
     is_retriable_connection_error,
     retry,
     retry_on_connection_error,
+    set_retry_policy,
 )
 
 
@@ -71,3 +78,104 @@ def test_retry_on_connection_error_does_not_retry_api_exception():
         pass
 
     assert calls['count'] == 1
+
+
+@pytest.fixture
+def policy(mocker):
+    mocker.patch('testit_python_commons.services.retry.time.sleep')
+    policy = RetryPolicy(max_attempts=3, connection_retries=2, base_delay_sec=0.5, max_delay_sec=4, budget_sec=60)
+    set_retry_policy(policy)
+    yield policy
+    set_retry_policy(RetryPolicy())
+
+
+def _api_exception(status, headers=None):
+    exc = ApiException(status=status, reason='error')
+    exc.headers = headers
+    return exc
+
+
+def test_delay_is_full_jitter_of_capped_exponential_backoff(policy):
+    for retry_number, cap in ((1, 0.5), (2, 1), (3, 2), (4, 4), (10, 4)):
+        delays = [policy.get_delay(retry_number, _api_exception(500)) for _ in range(200)]
+
+        assert all(0 <= delay <= cap for delay in delays)
+        assert max(delays) > cap / 2
+
+
+def test_retry_after_is_used_for_429_and_503():
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+    assert get_retry_after(_api_exception(429, {'Retry-After': '7'})) == 7
+    assert 25 < get_retry_after(_api_exception(503, {'Retry-After': retry_at})) <= 30
+    assert get_retry_after(_api_exception(500, {'Retry-After': '7'})) is None
+    assert get_retry_after(_api_exception(429)) is None
+
+
+def test_nested_retries_do_not_multiply(policy):
+    calls = {'inner': 0, 'outer': 0}
+
+    @retry
+    def inner():
+        calls['inner'] += 1
+        raise _api_exception(500)
+
+    @retry
+    def outer():
+        calls['outer'] += 1
+        inner()
+
+    with pytest.raises(ApiException):
+        outer()
+
+    assert calls == {'inner': 3, 'outer': 1}
+
+
+def test_spent_budget_opens_circuit_and_stops_retries(policy):
+    calls = {'count': 0}
+
+    @retry
+    def failing():
+        calls['count'] += 1
+        raise _api_exception(500)
+
+    for _ in range(7):
+        assert policy.acquire(4, 4)
+    assert policy.acquire(0, 4)
+
+    with pytest.raises(ApiException):
+        failing()
+    assert calls['count'] == 1
+    assert policy.is_open()
+
+    with pytest.raises(ApiException):
+        failing()
+    assert calls['count'] == 2
+
+    statistics = policy.get_statistics()
+    assert statistics['retries'] == 8
+    assert statistics['retry_sleep_sec'] == 28
+    assert statistics['circuit_open'] is True
+
+
+def test_long_retry_after_fails_only_its_request(policy):
+    calls = {'count': 0}
+
+    @retry
+    def throttled():
+        calls['count'] += 1
+        raise _api_exception(429, {'Retry-After': '40'})
+
+    with pytest.raises(ApiException):
+        throttled()
+
+    assert calls['count'] == 2
+    assert not policy.is_open()
+    assert policy.get_statistics()['retry_sleep_sec'] == 40
+
+
+def test_failed_attempts_are_charged_to_budget_up_to_max_delay(policy):
+    assert policy.acquire(1, 300)
+    assert policy.acquire(1, 2)
+    assert not policy.is_open()
+    assert policy.get_statistics()['failed_attempts_sec'] == 6
@@ -42,13 +42,27 @@ class TestStepManager:
         mock_step_result_storage.get_last.assert_called_once()
         assert result == mock_step_result
 
-    def test_get_steps_tree_returns_copy_and_clears(self, step_manager, mocker):
+    def test_stop_step_when_last_step_adds_it_to_steps_tree(
+            self, step_manager, mock_step_result, mock_step_result_storage):
+        mock_step_result_storage.get_count.return_value = 1
+        mock_step_result_storage.get_last.return_value = mock_step_result
+        step_manager.stop_step()
+        mock_step_result_storage.add_to_steps_tree.assert_called_once_with(mock_step_result)
+        mock_step_result_storage.remove_last.assert_called_once()
+
+    def test_get_steps_tree_returns_copy_and_clears(self, mocker):
+        step_manager = StepManager()
         mock_step1 = mocker.Mock(spec=StepResult)
         mock_step2 = mocker.Mock(spec=StepResult)
-        step_manager._StepManager__steps_tree = [mock_step1, mock_step2]
-        result = step_manager.get_steps_tree()
-        assert len(result) == 2
-        assert mock_step1 in result
-        assert mock_step2 in result
+        token = step_manager.start_context()
+        try:
+            for step in (mock_step1, mock_step2):
+                step.get_step_results.return_value = []
+                step_manager.start_step(step)
+                step_manager.stop_step()
 
-        assert len(step_manager._StepManager__steps_tree) == 0
\ No newline at end of file
+            result = step_manager.get_steps_tree()
+            assert result == [mock_step1, mock_step2]
+            assert step_manager.get_steps_tree() == []
+        finally:
+            step_manager.end_context(token)
\ No newline at end of file
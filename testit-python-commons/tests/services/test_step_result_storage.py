@@ -0,0 +1,99 @@
+import contextvars
+import threading
+
+from testit_python_commons.models.step_result import StepResult
+from testit_python_commons.services.step_manager import StepManager
+from testit_python_commons.services.step_result_storage import StepResultStorage
+
+
+def _run_test(step_manager: StepManager, title: str, started: threading.Barrier, results: dict):
+    token = step_manager.start_context()
+    try:
+        step_manager.start_step(StepResult().set_title(title).set_step_results([]))
+        started.wait()
+        step_manager.start_step(StepResult().set_title(f"{title} inner").set_step_results([]))
+        step_manager.stop_step()
+        step_manager.stop_step()
+        results[title] = step_manager.get_steps_tree()
+    finally:
+        step_manager.end_context(token)
+
+
+class TestStepContext:
+    def test_concurrent_tests_keep_their_own_steps(self):
+        step_manager = StepManager()
+        started = threading.Barrier(2)
+        results = {}
+        threads = [
+            threading.Thread(target=_run_test, args=(step_manager, title, started, results))
+            for title in ("first", "second")
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for title in ("first", "second"):
+            [step] = results[title]
+            assert step.get_title() == title
+            assert [inner.get_title() for inner in step.get_step_results()] == [f"{title} inner"]
+
+    def test_steps_from_helper_thread_belong_to_running_test(self):
+        step_manager = StepManager()
+        token = step_manager.start_context()
+        try:
+            thread = threading.Thread(
+                target=lambda: (
+                    step_manager.start_step(StepResult().set_title("helper").set_step_results([])),
+                    step_manager.stop_step(),
+                ))
+            thread.start()
+            thread.join()
+
+            assert [step.get_title() for step in step_manager.get_steps_tree()] == ["helper"]
+        finally:
+            step_manager.end_context(token)
+
+    def test_steps_without_single_test_are_taken_by_next_steps_tree(self):
+        step_manager = StepManager()
+        tokens = [contextvars.Context().run(step_manager.start_context) for _ in range(2)]
+        thread = threading.Thread(
+            target=lambda: (
+                step_manager.start_step(StepResult().set_title("orphan").set_step_results([])),
+                step_manager.stop_step(),
+            ))
+        thread.start()
+        thread.join()
+        for token in tokens:
+            StepResultStorage.end_context(token)
+
+        token = step_manager.start_context()
+        try:
+            step_manager.start_step(StepResult().set_title("own").set_step_results([]))
+            step_manager.stop_step()
+
+            assert [step.get_title() for step in step_manager.get_steps_tree()] == ["orphan", "own"]
+            assert StepResultStorage.get_context().steps_tree == []
+        finally:
+            step_manager.end_context(token)
+
+    def test_ended_context_is_evicted(self):
+        step_manager = StepManager()
+        token = step_manager.start_context()
+        step_manager.start_step(StepResult().set_title("unfinished").set_step_results([]))
+        step_manager.end_context(token)
+
+        assert all(step.get_title() != "unfinished" for step in StepResultStorage.get_context().open_steps)
+
+    def test_steps_without_context_are_shared_as_before(self):
+        step_manager = StepManager()
+        step = StepResult().set_title("shared").set_step_results([])
+        step_manager.start_step(step)
+
+        active_steps = []
+        contextvars.Context().run(lambda: active_steps.append(step_manager.get_active_step()))
+        step_manager.stop_step()
+
+        assert active_steps == [step]
+        assert step_manager.get_steps_tree() == [step]
@@ -234,4 +234,30 @@ class TestUtils:
 
     def test_convert_value_str_to_bool_none_value(self):
         result = Utils.convert_value_str_to_bool(None)
-        assert result is False
\ No newline at end of file
+        assert result is False
+
+    #shorten_for_log
+    def test_shorten_for_log_keeps_short_values(self):
+        assert Utils.shorten_for_log("value") == "value"
+        assert Utils.shorten_for_log([1, 2]) == "[1, 2]"
+
+    def test_shorten_for_log_summarizes_large_collections(self):
+        class Model:
+            def __str__(self):
+                raise AssertionError("large collections must not be stringified")
+
+        assert Utils.shorten_for_log([Model()] * 100) == "<list with 100 items>"
+
+    def test_shorten_for_log_truncates_long_strings(self):
+        result = Utils.shorten_for_log("x" * 5000)
+        assert result.startswith("x" * 1000 + "...")
+        assert result.endswith("(5000 chars)")
+
+    def test_get_function_parameters_for_log(self):
+        def sample_function(arg1, arg2=None):
+            pass
+
+        result = Utils.get_function_parameters_for_log(sample_function, "a" * 2000)
+        assert set(result) == {"arg1", "arg2"}
+        assert result["arg1"].endswith("(2000 chars)")
+        assert result["arg2"] == "None"
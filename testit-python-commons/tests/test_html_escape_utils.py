@@ -1,5 +1,7 @@
 import os
 import unittest
+from adapters_api.model.auto_test_step_api_model import AutoTestStepApiModel
+from adapters_api.model.auto_test_results_for_test_run_model import AutoTestResultsForTestRunModel
 from testit_python_commons.utils.html_escape_utils import HtmlEscapeUtils
 
 
@@ -131,6 +133,35 @@ class TestHtmlEscapeUtils(unittest.TestCase):
         self.assertEqual(result["tags"][0], "&lt;tag&gt;")
         self.assertEqual(result["tags"][1], "normal_tag")
 
+    def test_api_models_are_left_unchanged(self):
+        """Test that generated API models keep their fields, as reflection does not reach them"""
+        step = AutoTestStepApiModel(
+            title="<b>Parent</b>",
+            steps=[AutoTestStepApiModel(title="<i>Child</i>")]
+        )
+        result = HtmlEscapeUtils.escape_html_in_object(step)
+        
+        self.assertIs(result, step)
+        self.assertEqual(result.title, "<b>Parent</b>")
+        self.assertEqual(result.steps[0].title, "<i>Child</i>")
+        self.assertTrue(HtmlEscapeUtils._is_generated_model(AutoTestStepApiModel))
+    
+    def test_list_passed_as_object_is_left_unchanged(self):
+        """Test that escape_html_in_object does not walk a list passed to it"""
+        model = AutoTestResultsForTestRunModel(
+            configuration_id="cfg",
+            auto_test_external_id="<ext>",
+            status_code="Passed",
+            message="<b>failed</b>"
+        )
+        tags = ["<tag>"]
+        
+        HtmlEscapeUtils.escape_html_in_object([model])
+        HtmlEscapeUtils.escape_html_in_object(tags)
+        
+        self.assertEqual(model.message, "<b>failed</b>")
+        self.assertEqual(tags, ["<tag>"])
+
 
 if __name__ == '__main__':
     unittest.main()